@@ -0,0 +1,87 @@
+"""Generate the Unicode category range tables used by the identifier lexer.
+
+The lexer needs to know whether a code point is a Unicode letter, combining mark,
+digit or connector punctuation. Scanning all 0x110000 code points with `unicodedata`
+is far too slow to do on import, so the tables are generated once with this script
+and shipped as `src/ujson5/_unicode_tables.py`.
+
+Run `uv run release/gen_unicode_tables.py` from the root of the repository whenever the
+tables need to be refreshed (e.g. after bumping the minimum supported Python version).
+"""
+
+import unicodedata
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+TABLES_PATH = ROOT_DIR / "src" / "ujson5" / "_unicode_tables.py"
+
+# defined at https://262.ecma-international.org/5.1/#sec-7.6
+TABLES: dict[str, Callable[[str], bool]] = {
+    "LETTERS": lambda c: unicodedata.category(c)
+    in {"Lu", "Ll", "Lt", "Lm", "Lo", "Nl"},
+    "COMBINING_MARKS": lambda c: unicodedata.category(c) in {"Mn", "Mc"},
+    "DIGITS": lambda c: unicodedata.category(c) == "Nd",
+    "CONNECTORS": lambda c: unicodedata.category(c) == "Pc" and c != "_",
+}
+
+VALUES_PER_LINE: int = 8
+
+
+def build_table(predicate: Callable[[str], bool]) -> list[int]:
+    """Build a flat list of range boundaries for all code points matching `predicate`.
+
+    The list alternates between the first code point of a matching range and the first
+    code point after it, so a code point is in the table if and only if
+    `bisect_right(table, code_point)` is odd.
+
+    Args:
+        predicate: returns True if a character belongs to the table
+
+    Returns:
+        list[int]: sorted range boundaries
+    """
+    boundaries: list[int] = []
+    inside: bool = False
+    for code_point in range(0x110000):
+        if predicate(chr(code_point)) != inside:
+            boundaries.append(code_point)
+            inside = not inside
+    if inside:
+        boundaries.append(0x110000)
+    return boundaries
+
+
+def render_table(name: str, boundaries: list[int]) -> str:
+    """Render a table as a Python tuple literal."""
+    lines = [f"{name}: tuple[int, ...] = ("]
+    for start in range(0, len(boundaries), VALUES_PER_LINE):
+        chunk = boundaries[start : start + VALUES_PER_LINE]
+        lines.append("    " + " ".join(f"0x{value:06X}," for value in chunk))
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Generate the tables module."""
+    sections = [
+        '"""Unicode category range tables for the identifier lexer.',
+        "",
+        "This file is generated by `release/gen_unicode_tables.py`. Do not edit it by hand.",
+        "",
+        "Each table is a sorted tuple of range boundaries: a code point belongs to the table",
+        "if and only if `bisect_right(table, code_point)` is odd.",
+        '"""',
+        "",
+        "# fmt: off",
+        "",
+        f'UNICODE_VERSION: str = "{unicodedata.unidata_version}"',
+    ]
+    for name, predicate in TABLES.items():
+        sections.append("")
+        sections.append(render_table(name, build_table(predicate)))
+    TABLES_PATH.write_text("\n".join(sections) + "\n", encoding="utf8")
+
+
+if __name__ == "__main__":
+    main()
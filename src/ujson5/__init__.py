@@ -2,8 +2,32 @@
 
 from ._version import __version__ as gen_version
 from .core import JSON5DecodeError, JSON5EncodeError, JsonValue, version_info
-from .decoder import Json5Decoder, ObjectHookArg, ObjectPairsHookArg, load, loads
-from .encoder import JSON5Encoder, Serializable, dump, dumps
+from .decoder import (
+    Json5Decoder,
+    Json5Event,
+    Json5StreamDecoder,
+    ObjectHookArg,
+    ObjectPairsHookArg,
+    aload,
+    extract,
+    iter_items,
+    iter_loads,
+    iterparse,
+    load,
+    load_many,
+    load_path,
+    loads,
+)
+from .encoder import (
+    JSON5Encoder,
+    Serializable,
+    adump,
+    dump,
+    dump_many,
+    dumps,
+    dumps_bytes,
+)
+from .parallel import FileResult, dumps_many, load_files, loads_many
 
 __version__ = gen_version
 
@@ -15,11 +39,27 @@ __all__ = [
     "JSON5DecodeError",
     "JSON5EncodeError",
     "Json5Decoder",
+    "Json5StreamDecoder",
+    "Json5Event",
+    "iterparse",
+    "extract",
+    "iter_items",
+    "iter_loads",
+    "load_many",
     "load",
+    "load_path",
+    "aload",
     "loads",
+    "load_files",
+    "loads_many",
+    "dumps_many",
+    "FileResult",
     "JSON5Encoder",
     "dumps",
+    "dumps_bytes",
     "dump",
+    "dump_many",
+    "adump",
     "ObjectPairsHookArg",
     "ObjectHookArg",
     "Serializable",
@@ -0,0 +1,280 @@
+"""Unicode category range tables for the identifier lexer.
+
+This file is generated by `release/gen_unicode_tables.py`. Do not edit it by hand.
+
+Each table is a sorted tuple of range boundaries: a code point belongs to the table
+if and only if `bisect_right(table, code_point)` is odd.
+"""
+
+# fmt: off
+
+UNICODE_VERSION: str = "14.0.0"
+
+LETTERS: tuple[int, ...] = (
+    0x000041, 0x00005B, 0x000061, 0x00007B, 0x0000AA, 0x0000AB, 0x0000B5, 0x0000B6,
+    0x0000BA, 0x0000BB, 0x0000C0, 0x0000D7, 0x0000D8, 0x0000F7, 0x0000F8, 0x0002C2,
+    0x0002C6, 0x0002D2, 0x0002E0, 0x0002E5, 0x0002EC, 0x0002ED, 0x0002EE, 0x0002EF,
+    0x000370, 0x000375, 0x000376, 0x000378, 0x00037A, 0x00037E, 0x00037F, 0x000380,
+    0x000386, 0x000387, 0x000388, 0x00038B, 0x00038C, 0x00038D, 0x00038E, 0x0003A2,
+    0x0003A3, 0x0003F6, 0x0003F7, 0x000482, 0x00048A, 0x000530, 0x000531, 0x000557,
+    0x000559, 0x00055A, 0x000560, 0x000589, 0x0005D0, 0x0005EB, 0x0005EF, 0x0005F3,
+    0x000620, 0x00064B, 0x00066E, 0x000670, 0x000671, 0x0006D4, 0x0006D5, 0x0006D6,
+    0x0006E5, 0x0006E7, 0x0006EE, 0x0006F0, 0x0006FA, 0x0006FD, 0x0006FF, 0x000700,
+    0x000710, 0x000711, 0x000712, 0x000730, 0x00074D, 0x0007A6, 0x0007B1, 0x0007B2,
+    0x0007CA, 0x0007EB, 0x0007F4, 0x0007F6, 0x0007FA, 0x0007FB, 0x000800, 0x000816,
+    0x00081A, 0x00081B, 0x000824, 0x000825, 0x000828, 0x000829, 0x000840, 0x000859,
+    0x000860, 0x00086B, 0x000870, 0x000888, 0x000889, 0x00088F, 0x0008A0, 0x0008CA,
+    0x000904, 0x00093A, 0x00093D, 0x00093E, 0x000950, 0x000951, 0x000958, 0x000962,
+    0x000971, 0x000981, 0x000985, 0x00098D, 0x00098F, 0x000991, 0x000993, 0x0009A9,
+    0x0009AA, 0x0009B1, 0x0009B2, 0x0009B3, 0x0009B6, 0x0009BA, 0x0009BD, 0x0009BE,
+    0x0009CE, 0x0009CF, 0x0009DC, 0x0009DE, 0x0009DF, 0x0009E2, 0x0009F0, 0x0009F2,
+    0x0009FC, 0x0009FD, 0x000A05, 0x000A0B, 0x000A0F, 0x000A11, 0x000A13, 0x000A29,
+    0x000A2A, 0x000A31, 0x000A32, 0x000A34, 0x000A35, 0x000A37, 0x000A38, 0x000A3A,
+    0x000A59, 0x000A5D, 0x000A5E, 0x000A5F, 0x000A72, 0x000A75, 0x000A85, 0x000A8E,
+    0x000A8F, 0x000A92, 0x000A93, 0x000AA9, 0x000AAA, 0x000AB1, 0x000AB2, 0x000AB4,
+    0x000AB5, 0x000ABA, 0x000ABD, 0x000ABE, 0x000AD0, 0x000AD1, 0x000AE0, 0x000AE2,
+    0x000AF9, 0x000AFA, 0x000B05, 0x000B0D, 0x000B0F, 0x000B11, 0x000B13, 0x000B29,
+    0x000B2A, 0x000B31, 0x000B32, 0x000B34, 0x000B35, 0x000B3A, 0x000B3D, 0x000B3E,
+    0x000B5C, 0x000B5E, 0x000B5F, 0x000B62, 0x000B71, 0x000B72, 0x000B83, 0x000B84,
+    0x000B85, 0x000B8B, 0x000B8E, 0x000B91, 0x000B92, 0x000B96, 0x000B99, 0x000B9B,
+    0x000B9C, 0x000B9D, 0x000B9E, 0x000BA0, 0x000BA3, 0x000BA5, 0x000BA8, 0x000BAB,
+    0x000BAE, 0x000BBA, 0x000BD0, 0x000BD1, 0x000C05, 0x000C0D, 0x000C0E, 0x000C11,
+    0x000C12, 0x000C29, 0x000C2A, 0x000C3A, 0x000C3D, 0x000C3E, 0x000C58, 0x000C5B,
+    0x000C5D, 0x000C5E, 0x000C60, 0x000C62, 0x000C80, 0x000C81, 0x000C85, 0x000C8D,
+    0x000C8E, 0x000C91, 0x000C92, 0x000CA9, 0x000CAA, 0x000CB4, 0x000CB5, 0x000CBA,
+    0x000CBD, 0x000CBE, 0x000CDD, 0x000CDF, 0x000CE0, 0x000CE2, 0x000CF1, 0x000CF3,
+    0x000D04, 0x000D0D, 0x000D0E, 0x000D11, 0x000D12, 0x000D3B, 0x000D3D, 0x000D3E,
+    0x000D4E, 0x000D4F, 0x000D54, 0x000D57, 0x000D5F, 0x000D62, 0x000D7A, 0x000D80,
+    0x000D85, 0x000D97, 0x000D9A, 0x000DB2, 0x000DB3, 0x000DBC, 0x000DBD, 0x000DBE,
+    0x000DC0, 0x000DC7, 0x000E01, 0x000E31, 0x000E32, 0x000E34, 0x000E40, 0x000E47,
+    0x000E81, 0x000E83, 0x000E84, 0x000E85, 0x000E86, 0x000E8B, 0x000E8C, 0x000EA4,
+    0x000EA5, 0x000EA6, 0x000EA7, 0x000EB1, 0x000EB2, 0x000EB4, 0x000EBD, 0x000EBE,
+    0x000EC0, 0x000EC5, 0x000EC6, 0x000EC7, 0x000EDC, 0x000EE0, 0x000F00, 0x000F01,
+    0x000F40, 0x000F48, 0x000F49, 0x000F6D, 0x000F88, 0x000F8D, 0x001000, 0x00102B,
+    0x00103F, 0x001040, 0x001050, 0x001056, 0x00105A, 0x00105E, 0x001061, 0x001062,
+    0x001065, 0x001067, 0x00106E, 0x001071, 0x001075, 0x001082, 0x00108E, 0x00108F,
+    0x0010A0, 0x0010C6, 0x0010C7, 0x0010C8, 0x0010CD, 0x0010CE, 0x0010D0, 0x0010FB,
+    0x0010FC, 0x001249, 0x00124A, 0x00124E, 0x001250, 0x001257, 0x001258, 0x001259,
+    0x00125A, 0x00125E, 0x001260, 0x001289, 0x00128A, 0x00128E, 0x001290, 0x0012B1,
+    0x0012B2, 0x0012B6, 0x0012B8, 0x0012BF, 0x0012C0, 0x0012C1, 0x0012C2, 0x0012C6,
+    0x0012C8, 0x0012D7, 0x0012D8, 0x001311, 0x001312, 0x001316, 0x001318, 0x00135B,
+    0x001380, 0x001390, 0x0013A0, 0x0013F6, 0x0013F8, 0x0013FE, 0x001401, 0x00166D,
+    0x00166F, 0x001680, 0x001681, 0x00169B, 0x0016A0, 0x0016EB, 0x0016EE, 0x0016F9,
+    0x001700, 0x001712, 0x00171F, 0x001732, 0x001740, 0x001752, 0x001760, 0x00176D,
+    0x00176E, 0x001771, 0x001780, 0x0017B4, 0x0017D7, 0x0017D8, 0x0017DC, 0x0017DD,
+    0x001820, 0x001879, 0x001880, 0x001885, 0x001887, 0x0018A9, 0x0018AA, 0x0018AB,
+    0x0018B0, 0x0018F6, 0x001900, 0x00191F, 0x001950, 0x00196E, 0x001970, 0x001975,
+    0x001980, 0x0019AC, 0x0019B0, 0x0019CA, 0x001A00, 0x001A17, 0x001A20, 0x001A55,
+    0x001AA7, 0x001AA8, 0x001B05, 0x001B34, 0x001B45, 0x001B4D, 0x001B83, 0x001BA1,
+    0x001BAE, 0x001BB0, 0x001BBA, 0x001BE6, 0x001C00, 0x001C24, 0x001C4D, 0x001C50,
+    0x001C5A, 0x001C7E, 0x001C80, 0x001C89, 0x001C90, 0x001CBB, 0x001CBD, 0x001CC0,
+    0x001CE9, 0x001CED, 0x001CEE, 0x001CF4, 0x001CF5, 0x001CF7, 0x001CFA, 0x001CFB,
+    0x001D00, 0x001DC0, 0x001E00, 0x001F16, 0x001F18, 0x001F1E, 0x001F20, 0x001F46,
+    0x001F48, 0x001F4E, 0x001F50, 0x001F58, 0x001F59, 0x001F5A, 0x001F5B, 0x001F5C,
+    0x001F5D, 0x001F5E, 0x001F5F, 0x001F7E, 0x001F80, 0x001FB5, 0x001FB6, 0x001FBD,
+    0x001FBE, 0x001FBF, 0x001FC2, 0x001FC5, 0x001FC6, 0x001FCD, 0x001FD0, 0x001FD4,
+    0x001FD6, 0x001FDC, 0x001FE0, 0x001FED, 0x001FF2, 0x001FF5, 0x001FF6, 0x001FFD,
+    0x002071, 0x002072, 0x00207F, 0x002080, 0x002090, 0x00209D, 0x002102, 0x002103,
+    0x002107, 0x002108, 0x00210A, 0x002114, 0x002115, 0x002116, 0x002119, 0x00211E,
+    0x002124, 0x002125, 0x002126, 0x002127, 0x002128, 0x002129, 0x00212A, 0x00212E,
+    0x00212F, 0x00213A, 0x00213C, 0x002140, 0x002145, 0x00214A, 0x00214E, 0x00214F,
+    0x002160, 0x002189, 0x002C00, 0x002CE5, 0x002CEB, 0x002CEF, 0x002CF2, 0x002CF4,
+    0x002D00, 0x002D26, 0x002D27, 0x002D28, 0x002D2D, 0x002D2E, 0x002D30, 0x002D68,
+    0x002D6F, 0x002D70, 0x002D80, 0x002D97, 0x002DA0, 0x002DA7, 0x002DA8, 0x002DAF,
+    0x002DB0, 0x002DB7, 0x002DB8, 0x002DBF, 0x002DC0, 0x002DC7, 0x002DC8, 0x002DCF,
+    0x002DD0, 0x002DD7, 0x002DD8, 0x002DDF, 0x002E2F, 0x002E30, 0x003005, 0x003008,
+    0x003021, 0x00302A, 0x003031, 0x003036, 0x003038, 0x00303D, 0x003041, 0x003097,
+    0x00309D, 0x0030A0, 0x0030A1, 0x0030FB, 0x0030FC, 0x003100, 0x003105, 0x003130,
+    0x003131, 0x00318F, 0x0031A0, 0x0031C0, 0x0031F0, 0x003200, 0x003400, 0x004DC0,
+    0x004E00, 0x00A48D, 0x00A4D0, 0x00A4FE, 0x00A500, 0x00A60D, 0x00A610, 0x00A620,
+    0x00A62A, 0x00A62C, 0x00A640, 0x00A66F, 0x00A67F, 0x00A69E, 0x00A6A0, 0x00A6F0,
+    0x00A717, 0x00A720, 0x00A722, 0x00A789, 0x00A78B, 0x00A7CB, 0x00A7D0, 0x00A7D2,
+    0x00A7D3, 0x00A7D4, 0x00A7D5, 0x00A7DA, 0x00A7F2, 0x00A802, 0x00A803, 0x00A806,
+    0x00A807, 0x00A80B, 0x00A80C, 0x00A823, 0x00A840, 0x00A874, 0x00A882, 0x00A8B4,
+    0x00A8F2, 0x00A8F8, 0x00A8FB, 0x00A8FC, 0x00A8FD, 0x00A8FF, 0x00A90A, 0x00A926,
+    0x00A930, 0x00A947, 0x00A960, 0x00A97D, 0x00A984, 0x00A9B3, 0x00A9CF, 0x00A9D0,
+    0x00A9E0, 0x00A9E5, 0x00A9E6, 0x00A9F0, 0x00A9FA, 0x00A9FF, 0x00AA00, 0x00AA29,
+    0x00AA40, 0x00AA43, 0x00AA44, 0x00AA4C, 0x00AA60, 0x00AA77, 0x00AA7A, 0x00AA7B,
+    0x00AA7E, 0x00AAB0, 0x00AAB1, 0x00AAB2, 0x00AAB5, 0x00AAB7, 0x00AAB9, 0x00AABE,
+    0x00AAC0, 0x00AAC1, 0x00AAC2, 0x00AAC3, 0x00AADB, 0x00AADE, 0x00AAE0, 0x00AAEB,
+    0x00AAF2, 0x00AAF5, 0x00AB01, 0x00AB07, 0x00AB09, 0x00AB0F, 0x00AB11, 0x00AB17,
+    0x00AB20, 0x00AB27, 0x00AB28, 0x00AB2F, 0x00AB30, 0x00AB5B, 0x00AB5C, 0x00AB6A,
+    0x00AB70, 0x00ABE3, 0x00AC00, 0x00D7A4, 0x00D7B0, 0x00D7C7, 0x00D7CB, 0x00D7FC,
+    0x00F900, 0x00FA6E, 0x00FA70, 0x00FADA, 0x00FB00, 0x00FB07, 0x00FB13, 0x00FB18,
+    0x00FB1D, 0x00FB1E, 0x00FB1F, 0x00FB29, 0x00FB2A, 0x00FB37, 0x00FB38, 0x00FB3D,
+    0x00FB3E, 0x00FB3F, 0x00FB40, 0x00FB42, 0x00FB43, 0x00FB45, 0x00FB46, 0x00FBB2,
+    0x00FBD3, 0x00FD3E, 0x00FD50, 0x00FD90, 0x00FD92, 0x00FDC8, 0x00FDF0, 0x00FDFC,
+    0x00FE70, 0x00FE75, 0x00FE76, 0x00FEFD, 0x00FF21, 0x00FF3B, 0x00FF41, 0x00FF5B,
+    0x00FF66, 0x00FFBF, 0x00FFC2, 0x00FFC8, 0x00FFCA, 0x00FFD0, 0x00FFD2, 0x00FFD8,
+    0x00FFDA, 0x00FFDD, 0x010000, 0x01000C, 0x01000D, 0x010027, 0x010028, 0x01003B,
+    0x01003C, 0x01003E, 0x01003F, 0x01004E, 0x010050, 0x01005E, 0x010080, 0x0100FB,
+    0x010140, 0x010175, 0x010280, 0x01029D, 0x0102A0, 0x0102D1, 0x010300, 0x010320,
+    0x01032D, 0x01034B, 0x010350, 0x010376, 0x010380, 0x01039E, 0x0103A0, 0x0103C4,
+    0x0103C8, 0x0103D0, 0x0103D1, 0x0103D6, 0x010400, 0x01049E, 0x0104B0, 0x0104D4,
+    0x0104D8, 0x0104FC, 0x010500, 0x010528, 0x010530, 0x010564, 0x010570, 0x01057B,
+    0x01057C, 0x01058B, 0x01058C, 0x010593, 0x010594, 0x010596, 0x010597, 0x0105A2,
+    0x0105A3, 0x0105B2, 0x0105B3, 0x0105BA, 0x0105BB, 0x0105BD, 0x010600, 0x010737,
+    0x010740, 0x010756, 0x010760, 0x010768, 0x010780, 0x010786, 0x010787, 0x0107B1,
+    0x0107B2, 0x0107BB, 0x010800, 0x010806, 0x010808, 0x010809, 0x01080A, 0x010836,
+    0x010837, 0x010839, 0x01083C, 0x01083D, 0x01083F, 0x010856, 0x010860, 0x010877,
+    0x010880, 0x01089F, 0x0108E0, 0x0108F3, 0x0108F4, 0x0108F6, 0x010900, 0x010916,
+    0x010920, 0x01093A, 0x010980, 0x0109B8, 0x0109BE, 0x0109C0, 0x010A00, 0x010A01,
+    0x010A10, 0x010A14, 0x010A15, 0x010A18, 0x010A19, 0x010A36, 0x010A60, 0x010A7D,
+    0x010A80, 0x010A9D, 0x010AC0, 0x010AC8, 0x010AC9, 0x010AE5, 0x010B00, 0x010B36,
+    0x010B40, 0x010B56, 0x010B60, 0x010B73, 0x010B80, 0x010B92, 0x010C00, 0x010C49,
+    0x010C80, 0x010CB3, 0x010CC0, 0x010CF3, 0x010D00, 0x010D24, 0x010E80, 0x010EAA,
+    0x010EB0, 0x010EB2, 0x010F00, 0x010F1D, 0x010F27, 0x010F28, 0x010F30, 0x010F46,
+    0x010F70, 0x010F82, 0x010FB0, 0x010FC5, 0x010FE0, 0x010FF7, 0x011003, 0x011038,
+    0x011071, 0x011073, 0x011075, 0x011076, 0x011083, 0x0110B0, 0x0110D0, 0x0110E9,
+    0x011103, 0x011127, 0x011144, 0x011145, 0x011147, 0x011148, 0x011150, 0x011173,
+    0x011176, 0x011177, 0x011183, 0x0111B3, 0x0111C1, 0x0111C5, 0x0111DA, 0x0111DB,
+    0x0111DC, 0x0111DD, 0x011200, 0x011212, 0x011213, 0x01122C, 0x011280, 0x011287,
+    0x011288, 0x011289, 0x01128A, 0x01128E, 0x01128F, 0x01129E, 0x01129F, 0x0112A9,
+    0x0112B0, 0x0112DF, 0x011305, 0x01130D, 0x01130F, 0x011311, 0x011313, 0x011329,
+    0x01132A, 0x011331, 0x011332, 0x011334, 0x011335, 0x01133A, 0x01133D, 0x01133E,
+    0x011350, 0x011351, 0x01135D, 0x011362, 0x011400, 0x011435, 0x011447, 0x01144B,
+    0x01145F, 0x011462, 0x011480, 0x0114B0, 0x0114C4, 0x0114C6, 0x0114C7, 0x0114C8,
+    0x011580, 0x0115AF, 0x0115D8, 0x0115DC, 0x011600, 0x011630, 0x011644, 0x011645,
+    0x011680, 0x0116AB, 0x0116B8, 0x0116B9, 0x011700, 0x01171B, 0x011740, 0x011747,
+    0x011800, 0x01182C, 0x0118A0, 0x0118E0, 0x0118FF, 0x011907, 0x011909, 0x01190A,
+    0x01190C, 0x011914, 0x011915, 0x011917, 0x011918, 0x011930, 0x01193F, 0x011940,
+    0x011941, 0x011942, 0x0119A0, 0x0119A8, 0x0119AA, 0x0119D1, 0x0119E1, 0x0119E2,
+    0x0119E3, 0x0119E4, 0x011A00, 0x011A01, 0x011A0B, 0x011A33, 0x011A3A, 0x011A3B,
+    0x011A50, 0x011A51, 0x011A5C, 0x011A8A, 0x011A9D, 0x011A9E, 0x011AB0, 0x011AF9,
+    0x011C00, 0x011C09, 0x011C0A, 0x011C2F, 0x011C40, 0x011C41, 0x011C72, 0x011C90,
+    0x011D00, 0x011D07, 0x011D08, 0x011D0A, 0x011D0B, 0x011D31, 0x011D46, 0x011D47,
+    0x011D60, 0x011D66, 0x011D67, 0x011D69, 0x011D6A, 0x011D8A, 0x011D98, 0x011D99,
+    0x011EE0, 0x011EF3, 0x011FB0, 0x011FB1, 0x012000, 0x01239A, 0x012400, 0x01246F,
+    0x012480, 0x012544, 0x012F90, 0x012FF1, 0x013000, 0x01342F, 0x014400, 0x014647,
+    0x016800, 0x016A39, 0x016A40, 0x016A5F, 0x016A70, 0x016ABF, 0x016AD0, 0x016AEE,
+    0x016B00, 0x016B30, 0x016B40, 0x016B44, 0x016B63, 0x016B78, 0x016B7D, 0x016B90,
+    0x016E40, 0x016E80, 0x016F00, 0x016F4B, 0x016F50, 0x016F51, 0x016F93, 0x016FA0,
+    0x016FE0, 0x016FE2, 0x016FE3, 0x016FE4, 0x017000, 0x0187F8, 0x018800, 0x018CD6,
+    0x018D00, 0x018D09, 0x01AFF0, 0x01AFF4, 0x01AFF5, 0x01AFFC, 0x01AFFD, 0x01AFFF,
+    0x01B000, 0x01B123, 0x01B150, 0x01B153, 0x01B164, 0x01B168, 0x01B170, 0x01B2FC,
+    0x01BC00, 0x01BC6B, 0x01BC70, 0x01BC7D, 0x01BC80, 0x01BC89, 0x01BC90, 0x01BC9A,
+    0x01D400, 0x01D455, 0x01D456, 0x01D49D, 0x01D49E, 0x01D4A0, 0x01D4A2, 0x01D4A3,
+    0x01D4A5, 0x01D4A7, 0x01D4A9, 0x01D4AD, 0x01D4AE, 0x01D4BA, 0x01D4BB, 0x01D4BC,
+    0x01D4BD, 0x01D4C4, 0x01D4C5, 0x01D506, 0x01D507, 0x01D50B, 0x01D50D, 0x01D515,
+    0x01D516, 0x01D51D, 0x01D51E, 0x01D53A, 0x01D53B, 0x01D53F, 0x01D540, 0x01D545,
+    0x01D546, 0x01D547, 0x01D54A, 0x01D551, 0x01D552, 0x01D6A6, 0x01D6A8, 0x01D6C1,
+    0x01D6C2, 0x01D6DB, 0x01D6DC, 0x01D6FB, 0x01D6FC, 0x01D715, 0x01D716, 0x01D735,
+    0x01D736, 0x01D74F, 0x01D750, 0x01D76F, 0x01D770, 0x01D789, 0x01D78A, 0x01D7A9,
+    0x01D7AA, 0x01D7C3, 0x01D7C4, 0x01D7CC, 0x01DF00, 0x01DF1F, 0x01E100, 0x01E12D,
+    0x01E137, 0x01E13E, 0x01E14E, 0x01E14F, 0x01E290, 0x01E2AE, 0x01E2C0, 0x01E2EC,
+    0x01E7E0, 0x01E7E7, 0x01E7E8, 0x01E7EC, 0x01E7ED, 0x01E7EF, 0x01E7F0, 0x01E7FF,
+    0x01E800, 0x01E8C5, 0x01E900, 0x01E944, 0x01E94B, 0x01E94C, 0x01EE00, 0x01EE04,
+    0x01EE05, 0x01EE20, 0x01EE21, 0x01EE23, 0x01EE24, 0x01EE25, 0x01EE27, 0x01EE28,
+    0x01EE29, 0x01EE33, 0x01EE34, 0x01EE38, 0x01EE39, 0x01EE3A, 0x01EE3B, 0x01EE3C,
+    0x01EE42, 0x01EE43, 0x01EE47, 0x01EE48, 0x01EE49, 0x01EE4A, 0x01EE4B, 0x01EE4C,
+    0x01EE4D, 0x01EE50, 0x01EE51, 0x01EE53, 0x01EE54, 0x01EE55, 0x01EE57, 0x01EE58,
+    0x01EE59, 0x01EE5A, 0x01EE5B, 0x01EE5C, 0x01EE5D, 0x01EE5E, 0x01EE5F, 0x01EE60,
+    0x01EE61, 0x01EE63, 0x01EE64, 0x01EE65, 0x01EE67, 0x01EE6B, 0x01EE6C, 0x01EE73,
+    0x01EE74, 0x01EE78, 0x01EE79, 0x01EE7D, 0x01EE7E, 0x01EE7F, 0x01EE80, 0x01EE8A,
+    0x01EE8B, 0x01EE9C, 0x01EEA1, 0x01EEA4, 0x01EEA5, 0x01EEAA, 0x01EEAB, 0x01EEBC,
+    0x020000, 0x02A6E0, 0x02A700, 0x02B739, 0x02B740, 0x02B81E, 0x02B820, 0x02CEA2,
+    0x02CEB0, 0x02EBE1, 0x02F800, 0x02FA1E, 0x030000, 0x03134B,
+)
+
+COMBINING_MARKS: tuple[int, ...] = (
+    0x000300, 0x000370, 0x000483, 0x000488, 0x000591, 0x0005BE, 0x0005BF, 0x0005C0,
+    0x0005C1, 0x0005C3, 0x0005C4, 0x0005C6, 0x0005C7, 0x0005C8, 0x000610, 0x00061B,
+    0x00064B, 0x000660, 0x000670, 0x000671, 0x0006D6, 0x0006DD, 0x0006DF, 0x0006E5,
+    0x0006E7, 0x0006E9, 0x0006EA, 0x0006EE, 0x000711, 0x000712, 0x000730, 0x00074B,
+    0x0007A6, 0x0007B1, 0x0007EB, 0x0007F4, 0x0007FD, 0x0007FE, 0x000816, 0x00081A,
+    0x00081B, 0x000824, 0x000825, 0x000828, 0x000829, 0x00082E, 0x000859, 0x00085C,
+    0x000898, 0x0008A0, 0x0008CA, 0x0008E2, 0x0008E3, 0x000904, 0x00093A, 0x00093D,
+    0x00093E, 0x000950, 0x000951, 0x000958, 0x000962, 0x000964, 0x000981, 0x000984,
+    0x0009BC, 0x0009BD, 0x0009BE, 0x0009C5, 0x0009C7, 0x0009C9, 0x0009CB, 0x0009CE,
+    0x0009D7, 0x0009D8, 0x0009E2, 0x0009E4, 0x0009FE, 0x0009FF, 0x000A01, 0x000A04,
+    0x000A3C, 0x000A3D, 0x000A3E, 0x000A43, 0x000A47, 0x000A49, 0x000A4B, 0x000A4E,
+    0x000A51, 0x000A52, 0x000A70, 0x000A72, 0x000A75, 0x000A76, 0x000A81, 0x000A84,
+    0x000ABC, 0x000ABD, 0x000ABE, 0x000AC6, 0x000AC7, 0x000ACA, 0x000ACB, 0x000ACE,
+    0x000AE2, 0x000AE4, 0x000AFA, 0x000B00, 0x000B01, 0x000B04, 0x000B3C, 0x000B3D,
+    0x000B3E, 0x000B45, 0x000B47, 0x000B49, 0x000B4B, 0x000B4E, 0x000B55, 0x000B58,
+    0x000B62, 0x000B64, 0x000B82, 0x000B83, 0x000BBE, 0x000BC3, 0x000BC6, 0x000BC9,
+    0x000BCA, 0x000BCE, 0x000BD7, 0x000BD8, 0x000C00, 0x000C05, 0x000C3C, 0x000C3D,
+    0x000C3E, 0x000C45, 0x000C46, 0x000C49, 0x000C4A, 0x000C4E, 0x000C55, 0x000C57,
+    0x000C62, 0x000C64, 0x000C81, 0x000C84, 0x000CBC, 0x000CBD, 0x000CBE, 0x000CC5,
+    0x000CC6, 0x000CC9, 0x000CCA, 0x000CCE, 0x000CD5, 0x000CD7, 0x000CE2, 0x000CE4,
+    0x000D00, 0x000D04, 0x000D3B, 0x000D3D, 0x000D3E, 0x000D45, 0x000D46, 0x000D49,
+    0x000D4A, 0x000D4E, 0x000D57, 0x000D58, 0x000D62, 0x000D64, 0x000D81, 0x000D84,
+    0x000DCA, 0x000DCB, 0x000DCF, 0x000DD5, 0x000DD6, 0x000DD7, 0x000DD8, 0x000DE0,
+    0x000DF2, 0x000DF4, 0x000E31, 0x000E32, 0x000E34, 0x000E3B, 0x000E47, 0x000E4F,
+    0x000EB1, 0x000EB2, 0x000EB4, 0x000EBD, 0x000EC8, 0x000ECE, 0x000F18, 0x000F1A,
+    0x000F35, 0x000F36, 0x000F37, 0x000F38, 0x000F39, 0x000F3A, 0x000F3E, 0x000F40,
+    0x000F71, 0x000F85, 0x000F86, 0x000F88, 0x000F8D, 0x000F98, 0x000F99, 0x000FBD,
+    0x000FC6, 0x000FC7, 0x00102B, 0x00103F, 0x001056, 0x00105A, 0x00105E, 0x001061,
+    0x001062, 0x001065, 0x001067, 0x00106E, 0x001071, 0x001075, 0x001082, 0x00108E,
+    0x00108F, 0x001090, 0x00109A, 0x00109E, 0x00135D, 0x001360, 0x001712, 0x001716,
+    0x001732, 0x001735, 0x001752, 0x001754, 0x001772, 0x001774, 0x0017B4, 0x0017D4,
+    0x0017DD, 0x0017DE, 0x00180B, 0x00180E, 0x00180F, 0x001810, 0x001885, 0x001887,
+    0x0018A9, 0x0018AA, 0x001920, 0x00192C, 0x001930, 0x00193C, 0x001A17, 0x001A1C,
+    0x001A55, 0x001A5F, 0x001A60, 0x001A7D, 0x001A7F, 0x001A80, 0x001AB0, 0x001ABE,
+    0x001ABF, 0x001ACF, 0x001B00, 0x001B05, 0x001B34, 0x001B45, 0x001B6B, 0x001B74,
+    0x001B80, 0x001B83, 0x001BA1, 0x001BAE, 0x001BE6, 0x001BF4, 0x001C24, 0x001C38,
+    0x001CD0, 0x001CD3, 0x001CD4, 0x001CE9, 0x001CED, 0x001CEE, 0x001CF4, 0x001CF5,
+    0x001CF7, 0x001CFA, 0x001DC0, 0x001E00, 0x0020D0, 0x0020DD, 0x0020E1, 0x0020E2,
+    0x0020E5, 0x0020F1, 0x002CEF, 0x002CF2, 0x002D7F, 0x002D80, 0x002DE0, 0x002E00,
+    0x00302A, 0x003030, 0x003099, 0x00309B, 0x00A66F, 0x00A670, 0x00A674, 0x00A67E,
+    0x00A69E, 0x00A6A0, 0x00A6F0, 0x00A6F2, 0x00A802, 0x00A803, 0x00A806, 0x00A807,
+    0x00A80B, 0x00A80C, 0x00A823, 0x00A828, 0x00A82C, 0x00A82D, 0x00A880, 0x00A882,
+    0x00A8B4, 0x00A8C6, 0x00A8E0, 0x00A8F2, 0x00A8FF, 0x00A900, 0x00A926, 0x00A92E,
+    0x00A947, 0x00A954, 0x00A980, 0x00A984, 0x00A9B3, 0x00A9C1, 0x00A9E5, 0x00A9E6,
+    0x00AA29, 0x00AA37, 0x00AA43, 0x00AA44, 0x00AA4C, 0x00AA4E, 0x00AA7B, 0x00AA7E,
+    0x00AAB0, 0x00AAB1, 0x00AAB2, 0x00AAB5, 0x00AAB7, 0x00AAB9, 0x00AABE, 0x00AAC0,
+    0x00AAC1, 0x00AAC2, 0x00AAEB, 0x00AAF0, 0x00AAF5, 0x00AAF7, 0x00ABE3, 0x00ABEB,
+    0x00ABEC, 0x00ABEE, 0x00FB1E, 0x00FB1F, 0x00FE00, 0x00FE10, 0x00FE20, 0x00FE30,
+    0x0101FD, 0x0101FE, 0x0102E0, 0x0102E1, 0x010376, 0x01037B, 0x010A01, 0x010A04,
+    0x010A05, 0x010A07, 0x010A0C, 0x010A10, 0x010A38, 0x010A3B, 0x010A3F, 0x010A40,
+    0x010AE5, 0x010AE7, 0x010D24, 0x010D28, 0x010EAB, 0x010EAD, 0x010F46, 0x010F51,
+    0x010F82, 0x010F86, 0x011000, 0x011003, 0x011038, 0x011047, 0x011070, 0x011071,
+    0x011073, 0x011075, 0x01107F, 0x011083, 0x0110B0, 0x0110BB, 0x0110C2, 0x0110C3,
+    0x011100, 0x011103, 0x011127, 0x011135, 0x011145, 0x011147, 0x011173, 0x011174,
+    0x011180, 0x011183, 0x0111B3, 0x0111C1, 0x0111C9, 0x0111CD, 0x0111CE, 0x0111D0,
+    0x01122C, 0x011238, 0x01123E, 0x01123F, 0x0112DF, 0x0112EB, 0x011300, 0x011304,
+    0x01133B, 0x01133D, 0x01133E, 0x011345, 0x011347, 0x011349, 0x01134B, 0x01134E,
+    0x011357, 0x011358, 0x011362, 0x011364, 0x011366, 0x01136D, 0x011370, 0x011375,
+    0x011435, 0x011447, 0x01145E, 0x01145F, 0x0114B0, 0x0114C4, 0x0115AF, 0x0115B6,
+    0x0115B8, 0x0115C1, 0x0115DC, 0x0115DE, 0x011630, 0x011641, 0x0116AB, 0x0116B8,
+    0x01171D, 0x01172C, 0x01182C, 0x01183B, 0x011930, 0x011936, 0x011937, 0x011939,
+    0x01193B, 0x01193F, 0x011940, 0x011941, 0x011942, 0x011944, 0x0119D1, 0x0119D8,
+    0x0119DA, 0x0119E1, 0x0119E4, 0x0119E5, 0x011A01, 0x011A0B, 0x011A33, 0x011A3A,
+    0x011A3B, 0x011A3F, 0x011A47, 0x011A48, 0x011A51, 0x011A5C, 0x011A8A, 0x011A9A,
+    0x011C2F, 0x011C37, 0x011C38, 0x011C40, 0x011C92, 0x011CA8, 0x011CA9, 0x011CB7,
+    0x011D31, 0x011D37, 0x011D3A, 0x011D3B, 0x011D3C, 0x011D3E, 0x011D3F, 0x011D46,
+    0x011D47, 0x011D48, 0x011D8A, 0x011D8F, 0x011D90, 0x011D92, 0x011D93, 0x011D98,
+    0x011EF3, 0x011EF7, 0x016AF0, 0x016AF5, 0x016B30, 0x016B37, 0x016F4F, 0x016F50,
+    0x016F51, 0x016F88, 0x016F8F, 0x016F93, 0x016FE4, 0x016FE5, 0x016FF0, 0x016FF2,
+    0x01BC9D, 0x01BC9F, 0x01CF00, 0x01CF2E, 0x01CF30, 0x01CF47, 0x01D165, 0x01D16A,
+    0x01D16D, 0x01D173, 0x01D17B, 0x01D183, 0x01D185, 0x01D18C, 0x01D1AA, 0x01D1AE,
+    0x01D242, 0x01D245, 0x01DA00, 0x01DA37, 0x01DA3B, 0x01DA6D, 0x01DA75, 0x01DA76,
+    0x01DA84, 0x01DA85, 0x01DA9B, 0x01DAA0, 0x01DAA1, 0x01DAB0, 0x01E000, 0x01E007,
+    0x01E008, 0x01E019, 0x01E01B, 0x01E022, 0x01E023, 0x01E025, 0x01E026, 0x01E02B,
+    0x01E130, 0x01E137, 0x01E2AE, 0x01E2AF, 0x01E2EC, 0x01E2F0, 0x01E8D0, 0x01E8D7,
+    0x01E944, 0x01E94B, 0x0E0100, 0x0E01F0,
+)
+
+DIGITS: tuple[int, ...] = (
+    0x000030, 0x00003A, 0x000660, 0x00066A, 0x0006F0, 0x0006FA, 0x0007C0, 0x0007CA,
+    0x000966, 0x000970, 0x0009E6, 0x0009F0, 0x000A66, 0x000A70, 0x000AE6, 0x000AF0,
+    0x000B66, 0x000B70, 0x000BE6, 0x000BF0, 0x000C66, 0x000C70, 0x000CE6, 0x000CF0,
+    0x000D66, 0x000D70, 0x000DE6, 0x000DF0, 0x000E50, 0x000E5A, 0x000ED0, 0x000EDA,
+    0x000F20, 0x000F2A, 0x001040, 0x00104A, 0x001090, 0x00109A, 0x0017E0, 0x0017EA,
+    0x001810, 0x00181A, 0x001946, 0x001950, 0x0019D0, 0x0019DA, 0x001A80, 0x001A8A,
+    0x001A90, 0x001A9A, 0x001B50, 0x001B5A, 0x001BB0, 0x001BBA, 0x001C40, 0x001C4A,
+    0x001C50, 0x001C5A, 0x00A620, 0x00A62A, 0x00A8D0, 0x00A8DA, 0x00A900, 0x00A90A,
+    0x00A9D0, 0x00A9DA, 0x00A9F0, 0x00A9FA, 0x00AA50, 0x00AA5A, 0x00ABF0, 0x00ABFA,
+    0x00FF10, 0x00FF1A, 0x0104A0, 0x0104AA, 0x010D30, 0x010D3A, 0x011066, 0x011070,
+    0x0110F0, 0x0110FA, 0x011136, 0x011140, 0x0111D0, 0x0111DA, 0x0112F0, 0x0112FA,
+    0x011450, 0x01145A, 0x0114D0, 0x0114DA, 0x011650, 0x01165A, 0x0116C0, 0x0116CA,
+    0x011730, 0x01173A, 0x0118E0, 0x0118EA, 0x011950, 0x01195A, 0x011C50, 0x011C5A,
+    0x011D50, 0x011D5A, 0x011DA0, 0x011DAA, 0x016A60, 0x016A6A, 0x016AC0, 0x016ACA,
+    0x016B50, 0x016B5A, 0x01D7CE, 0x01D800, 0x01E140, 0x01E14A, 0x01E2F0, 0x01E2FA,
+    0x01E950, 0x01E95A, 0x01FBF0, 0x01FBFA,
+)
+
+CONNECTORS: tuple[int, ...] = (
+    0x00203F, 0x002041, 0x002054, 0x002055, 0x00FE33, 0x00FE35, 0x00FE4D, 0x00FE50,
+    0x00FF3F, 0x00FF40,
+)
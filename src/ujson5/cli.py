@@ -7,7 +7,8 @@ from collections.abc import Sequence
 
 from ._version import __version__
 from .core import JSON5DecodeError, version_info
-from .decoder import loads
+from .decoder import load_path, loads
+from .parallel import load_files
 
 ERR_NO_TARGET: str = "No target file specified."
 ERR_TARGET_NOT_EXIST: str = "Target is not a file or does not exist."
@@ -68,6 +69,18 @@ def main(test_args: Sequence[str] | None = None) -> None:
         default=2,
         help="separate items with newlines and use this number of spaces for indentation",
     )
+    parser.add_argument(
+        "--validate",
+        nargs="+",
+        metavar="FILE",
+        help="validate many JSON5 files in parallel and report errors per file",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes used by --validate (default: number of CPUs)",
+    )
 
     args = parser.parse_args(test_args)
     if args.info:
@@ -76,14 +89,23 @@ def main(test_args: Sequence[str] | None = None) -> None:
     if args.version:
         print(__version__)
         return
+    if args.validate:
+        for result in load_files(args.validate, workers=args.workers):
+            if result.error is None:
+                print(f"{result.path}: {VALID_JSON5}")
+            elif isinstance(result.error, (JSON5DecodeError, UnicodeDecodeError)):
+                print(f"{DECODING_ERROR} {result.path}:")
+                print(result.error)
+            else:
+                print(f"{result.path}: {ERR_TARGET_NOT_EXIST}")
+        return
     if args.infile is None and sys.stdin.isatty():
         print(ERR_NO_TARGET)
         parser.print_help()
         return
     try:
         if args.infile is not None:
-            with open(args.infile, "r", encoding="utf8") as file:
-                json5_obj = loads(file.read())
+            json5_obj = load_path(args.infile)
         else:
             json5_obj = loads(sys.stdin.read())
     except FileNotFoundError:
@@ -1,6 +1,8 @@
 """This module contains constants used by the lexer."""
 
-import unicodedata
+from bisect import bisect_right
+from functools import cache
+from types import ModuleType
 
 PUNCTUATORS = {
     "{",
@@ -132,25 +134,72 @@ RESERVED_WORDS = KEYWORDS.union(FUTURE_RESERVED_WORDS).union(
 
 
 # defined at https://262.ecma-international.org/5.1/#sec-7.6
-UNICODE_LETTERS = {
-    chr(i)
-    for i in range(0x110000)
-    if unicodedata.category(chr(i)) in {"Lu", "Ll", "Lt", "Lm", "Lo", "Nl"}
-}
+# Unicode categories are looked up in precomputed range tables (see
+# `release/gen_unicode_tables.py`) that are only imported the first time a non-ASCII
+# character needs to be classified.
 
-UNICODE_COMBINING_MARKS = {
-    chr(i) for i in range(0x110000) if unicodedata.category(chr(i)) in {"Mn", "Mc"}
-}
 
-UNICODE_DIGITS = {
-    chr(i) for i in range(0x110000) if unicodedata.category(chr(i)) == "Nd"
-}
+@cache
+def _unicode_tables() -> ModuleType:
+    from ujson5 import _unicode_tables  # pylint: disable=C0415
+
+    return _unicode_tables
+
+
+def _in_table(table: tuple[int, ...], char: str) -> bool:
+    return bisect_right(table, ord(char)) % 2 == 1
+
+
+def is_unicode_letter(char: str) -> bool:
+    """Check if a character is a Unicode letter (Lu, Ll, Lt, Lm, Lo or Nl)."""
+    if char < "\x80":
+        return char.isalpha()
+    return _in_table(_unicode_tables().LETTERS, char)
+
+
+def is_unicode_combining_mark(char: str) -> bool:
+    """Check if a character is a Unicode combining mark (Mn or Mc)."""
+    if char < "\x80":
+        return False
+    return _in_table(_unicode_tables().COMBINING_MARKS, char)
 
-UNICODE_CONNECTORS = {
-    chr(i)
-    for i in range(0x110000)
-    if (unicodedata.category(chr(i)) == "Pc" and chr(i) != "_")
+
+def is_unicode_digit(char: str) -> bool:
+    """Check if a character is a Unicode decimal digit (Nd)."""
+    if char < "\x80":
+        return char.isdigit()
+    return _in_table(_unicode_tables().DIGITS, char)
+
+
+def is_unicode_connector(char: str) -> bool:
+    """Check if a character is a Unicode connector punctuation (Pc) other than `_`."""
+    if char < "\x80":
+        return False
+    return _in_table(_unicode_tables().CONNECTORS, char)
+
+
+_UNICODE_SETS: dict[str, str] = {
+    "UNICODE_LETTERS": "LETTERS",
+    "UNICODE_COMBINING_MARKS": "COMBINING_MARKS",
+    "UNICODE_DIGITS": "DIGITS",
+    "UNICODE_CONNECTORS": "CONNECTORS",
 }
 
+
+def __getattr__(name: str) -> set[str]:
+    """Materialize `UNICODE_LETTERS`, `UNICODE_COMBINING_MARKS`, `UNICODE_DIGITS` and
+    `UNICODE_CONNECTORS` as sets of characters on first access."""
+    if name not in _UNICODE_SETS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    table: tuple[int, ...] = getattr(_unicode_tables(), _UNICODE_SETS[name])
+    chars: set[str] = {
+        chr(code_point)
+        for start, end in zip(table[::2], table[1::2], strict=True)
+        for code_point in range(start, end)
+    }
+    globals()[name] = chars
+    return chars
+
+
 ZWNJ = "\u200c"  # Zero Width Non-Joiner
 ZWJ = "\u200d"  # Zero Width Joiner
@@ -1,6 +1,7 @@
 """Core JSON5 classes and exceptions."""
 
-from typing import Literal, NamedTuple
+from functools import cached_property
+from typing import Any, Literal, NamedTuple
 
 from ._version import __version__
 
@@ -28,24 +29,48 @@ class JSON5DecodeError(ValueError):
     """Subclass of ValueError with the following additional properties:
 
     msg: The unformatted error message
-    doc: The JSON document being parsed
+    doc: The JSON document being parsed, or an object providing the same `str`
+        lookups for documents that are read from buffers or streams
     pos: The start index of doc where parsing failed
     lineno: The line corresponding to pos
     colno: The column corresponding to pos
 
     """
 
-    # Note that this exception is used from _json
-    def __init__(self, msg: str, doc: str, pos: int) -> None:
-        lineno = doc.count("\n", 0, pos) + 1
-        colno = pos - doc.rfind("\n", 0, pos)
-        err_msg = f"{msg}: line {lineno} column {colno} (char {pos})"
-        ValueError.__init__(self, err_msg)
+    # lineno, colno and the formatted message scan the document, so they are only
+    # computed when accessed. Raising and catching the error stays O(1).
+    def __init__(self, msg: str, doc: Any, pos: int) -> None:
+        ValueError.__init__(self, msg)
         self.msg = msg
         self.doc = doc
         self.pos = pos
-        self.lineno = lineno
-        self.colno = colno
+        self._args: tuple | None = None
+
+    @property  # type: ignore[override]
+    def args(self) -> tuple:
+        """The formatted message, as `(msg: line L column C (char P),)`"""
+        if self._args is None:
+            self._args = (
+                f"{self.msg}: line {self.lineno} column {self.colno} (char {self.pos})",
+            )
+        return self._args
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        self._args = tuple(value)
+
+    @cached_property
+    def lineno(self) -> int:
+        """The line corresponding to pos"""
+        return self.doc.count("\n", 0, self.pos) + 1
+
+    @cached_property
+    def colno(self) -> int:
+        """The column corresponding to pos"""
+        return self.pos - self.doc.rfind("\n", 0, self.pos)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.args[0]!r})"
 
     def __reduce__(self) -> tuple:  # pragma: no cover
         return self.__class__, (self.msg, self.doc, self.pos)
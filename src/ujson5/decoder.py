@@ -1,13 +1,37 @@
 """Implementation of the JSON5 decoder."""
 
+import codecs
+import copy
+import mmap
+import os
 import re
-from collections.abc import Callable
-from typing import Any, Literal, TextIO
+from collections.abc import Callable, Generator, Iterable, Iterator
+from functools import cached_property
+from typing import IO, TYPE_CHECKING, Any, Literal, NamedTuple, NoReturn, TextIO
 
 from ujson5.consts import ESCAPE_SEQUENCE, RESERVED_WORDS
-from ujson5.core import TOKEN_TYPE, JSON5DecodeError, JsonValue, JsonValuePairs, Token
+from ujson5.core import (
+    TOKEN_TYPE,
+    JSON5DecodeError,
+    JsonValue,
+    JsonValuePairs,
+    Token,
+    TokenResult,
+)
 from ujson5.err_msg import DecoderErr
-from ujson5.lexer import tokenize
+from ujson5.lexer import (
+    WHITESPACE_PATTERN,
+    BytesFallback,
+    BytesLike,
+    next_token,
+    next_token_bytes,
+    scan_array,
+    skip_container,
+    validate_comment,
+)
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader
 
 ObjectHookArg = dict[str, JsonValue]
 """Type hint for the argument of the `object_hook` function."""
@@ -17,6 +41,103 @@ ObjectPairsHookArg = list[tuple[str, JsonValue]]
 """Type hint for the argument of the `object_pairs_hook` function."""
 ObjectPairsHook = Callable[[ObjectPairsHookArg], Any]
 """Type hint for the `object_pairs_hook` function signature."""
+Scanner = Callable[[Any, int], TokenResult | None]
+
+Json5EventType = Literal[
+    "start_map", "map_key", "end_map", "start_array", "end_array", "value"
+]
+"""Type hint for the kind of a [`Json5Event`][ujson5.Json5Event]."""
+
+
+class Json5Event(NamedTuple):
+    """Parsing event yielded by [`iterparse`][ujson5.iterparse].
+
+    `value` is the decoded key for `map_key` events, the decoded value for `value`
+    events and `None` otherwise. `start` and `end` are the offsets of the token in the
+    document (excluding the quotes of strings).
+    """
+
+    event: Json5EventType
+    value: Any
+    start: int
+    end: int
+
+
+# token types as module constants, so the parsing loops compare ints instead of doing a
+# dict lookup per test
+TK_IDENTIFIER: int = TOKEN_TYPE["IDENTIFIER"]
+TK_STRING: int = TOKEN_TYPE["STRING"]
+TK_NUMBER: int = TOKEN_TYPE["NUMBER"]
+TK_BOOLEAN: int = TOKEN_TYPE["BOOLEAN"]
+TK_NULL: int = TOKEN_TYPE["NULL"]
+TK_OPEN_BRACE: int = TOKEN_TYPE["PUN_OPEN_BRACE"]
+TK_CLOSE_BRACE: int = TOKEN_TYPE["PUN_CLOSE_BRACE"]
+TK_OPEN_BRACKET: int = TOKEN_TYPE["PUN_OPEN_BRACKET"]
+TK_CLOSE_BRACKET: int = TOKEN_TYPE["PUN_CLOSE_BRACKET"]
+TK_COLON: int = TOKEN_TYPE["PUN_COLON"]
+TK_COMMA: int = TOKEN_TYPE["PUN_COMMA"]
+CONTAINER_OPEN: frozenset[int] = frozenset({TK_OPEN_BRACE, TK_OPEN_BRACKET})
+CONTAINER_CLOSE: frozenset[int] = frozenset({TK_CLOSE_BRACE, TK_CLOSE_BRACKET})
+# punctuators reported as unexpected rather than as a missing comma after a value
+UNEXPECTED_AFTER_VALUE: frozenset[int] = frozenset(
+    {TK_CLOSE_BRACE, TK_CLOSE_BRACKET, TK_COLON}
+)
+
+# group 1: escape sequences, group 2: unicode escape sequences
+# group 3: line continuations
+STRING_ESCAPE_PATTERN = re.compile(
+    r"\\([\'\"\\bfnrtv0])|\\u([0-9a-fA-F]{4})|\\\s*(?:\r\n|[\n\r\u2028\u2029])"
+)
+IDENTIFIER_ESCAPE_PATTERN = re.compile(r"\\u([0-9a-fA-F]{4})")
+STRICT_ESCAPES: frozenset[str] = frozenset({"t", "n", "r", "0"})
+
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+"""Number of characters (or bytes) read at a time by `Json5StreamDecoder`."""
+MIN_PARALLEL_CHUNK_SIZE: int = 1024 * 1024
+"""Minimum number of characters of array elements decoded by one worker process."""
+
+# extent of a token that failed to lex in a stream window: a string runs up to its
+# closing quote or an unescaped line terminator, other tokens up to whitespace or a
+# punctuator. A token reaching the end of the window may be completed by the stream.
+STRING_EXTENT_PATTERNS: dict[str, re.Pattern[str]] = {
+    quote: re.compile(
+        rf"{quote}(?:[^{quote}\\\n\r\u2028\u2029]"
+        + r"|\\[^\S\n\r\u2028\u2029]*(?:\r\n?|[\s\S])?)*"
+    )
+    for quote in ("'", '"')
+}
+TOKEN_EXTENT_PATTERN = re.compile(r"[^\s{}\[\]:,'\"/]*")
+
+
+def _token_str(json5_str: Any, start: int, end: int) -> str:
+    """Return the text of a token, decoding it if the document is a UTF-8 buffer."""
+    text = json5_str[start:end]
+    if isinstance(text, str):
+        return text
+    return str(text, "utf-8")
+
+
+def _detect_encoding(buffer: BytesLike) -> str:
+    """Detect the encoding of a JSON5 document from its BOM, or from the position of
+    null bytes in its first characters (which are always ASCII in JSON5)."""
+    head = bytes(buffer[:4])
+    if head.startswith((codecs.BOM_UTF32_BE, codecs.BOM_UTF32_LE)):
+        return "utf-32"
+    if head.startswith((codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)):
+        return "utf-16"
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if len(head) >= 4:
+        if not head[0]:
+            return "utf-16-be" if head[1] else "utf-32-be"
+        if not head[1]:
+            return "utf-16-le" if head[2] or head[3] else "utf-32-le"
+    elif len(head) == 2:
+        if not head[0]:
+            return "utf-16-be"
+        if not head[1]:
+            return "utf-16-le"
+    return "utf-8"
 
 
 class Json5Decoder:
@@ -95,11 +216,14 @@ class Json5Decoder:
         self._strict: bool = strict
         self._object_pairs_hook: ObjectPairsHook | None = object_pairs_hook
 
-    def decode(self, json5_str: str) -> Any:
+    def decode(self, json5_str: str | BytesLike) -> Any:
         """Deserialize a JSON5 string to a Python object.
 
         Args:
-            json5_str: The JSON5 string to be deserialized.
+            json5_str: The JSON5 string to be deserialized. It can also be a `bytes`,
+                `bytearray` or `memoryview` containing a UTF-8, UTF-16 or UTF-32
+                encoded document. UTF-8 buffers are parsed without decoding the whole
+                document to `str`.
 
         Returns:
             The Python object represented by the JSON5 string.
@@ -107,334 +231,862 @@ class Json5Decoder:
         Raises:
             JSON5DecodeError: If the JSON5 string is invalid.
         """
-        tokens = tokenize(json5_str)
-        return self._parse_json5(json5_str, tokens)
+        if not isinstance(json5_str, str):
+            return self._decode_bytes(json5_str)
+        obj, end_idx = self.raw_decode(json5_str)
+        trailing = next_token(json5_str, end_idx)
+        if trailing is not None:
+            raise JSON5DecodeError(
+                DecoderErr.multiple_root(), json5_str, trailing.token.value[0]
+            )
+        return obj
+
+    def decode_parallel(
+        self, json5_str: str | BytesLike, workers: int | None = None
+    ) -> Any:
+        """Deserialize a JSON5 document whose root is a large array, decoding runs of
+        its elements in parallel worker processes.
 
-    def raw_decode(self, json5_str: str) -> tuple[Any, int]:
-        """Deserialize a JSON5 string to a Python object and return the index of the last
-        character parsed.
+        A structural scan (string boundaries and bracket matching only) finds the
+        elements of the root array, which are split into runs of at least
+        `MIN_PARALLEL_CHUNK_SIZE` characters. Documents whose root is not an array,
+        or that are too small to be split, are decoded in the current process.
 
         Args:
-            json5_str: The JSON5 string to be deserialized.
+            json5_str: The JSON5 document. See [`decode`][ujson5.Json5Decoder.decode].
+            workers: Number of worker processes. Defaults to the number of CPUs.
 
         Returns:
-            A tuple of the Python object represented by the JSON5 string and the index
-                of the last character parsed.
+            The Python object represented by the JSON5 document.
 
         Raises:
-            JSON5DecodeError: If the JSON5 string is invalid.
+            JSON5DecodeError: If the JSON5 document is invalid.
         """
-        tokens = tokenize(json5_str)
-        if tokens[-1].tk_type == TOKEN_TYPE["STRING"]:
-            # If the last token is a string, we need to skip the closing quote
-            return self._parse_json5(json5_str, tokens), tokens[-1].value[1] + 1
-        return self._parse_json5(json5_str, tokens), tokens[-1].value[1]
+        if not isinstance(json5_str, str):
+            json5_str = str(json5_str, _detect_encoding(json5_str))
+        result = next_token(json5_str, 0)
+        if (
+            result is None
+            or result.token.tk_type != TK_OPEN_BRACKET
+            or len(json5_str) < 2 * MIN_PARALLEL_CHUNK_SIZE
+        ):
+            return self.decode(json5_str)
+        root_start = result.token.value[0]
+        commas, close_idx = scan_array(json5_str, root_start)
+        trailing = next_token(json5_str, close_idx + 1)
+        if trailing is not None:
+            raise JSON5DecodeError(
+                DecoderErr.multiple_root(), json5_str, trailing.token.value[0]
+            )
 
-    def _parse_json5(
-        self, json5_str: str, tokens: list[Token]
-    ) -> JsonValue | JsonValuePairs:
-        """Parse a JSON5 string with tokens."""
-        if not tokens:
-            raise JSON5DecodeError(DecoderErr.empty_json5(), json5_str, 0)
+        # split the elements into runs, at the commas separating them
+        target_size = max(
+            MIN_PARALLEL_CHUNK_SIZE,
+            (close_idx - root_start) // (4 * (workers or os.cpu_count() or 1)),
+        )
+        bounds: list[int] = [root_start]
+        # delimiter before each comma ending a run, to find elided elements
+        previous: list[int] = []
+        for i, comma in enumerate(commas):
+            if comma - bounds[-1] >= target_size:
+                bounds.append(comma)
+                previous.append(commas[i - 1] if i else root_start)
+        bounds.append(close_idx)
+        if len(bounds) == 2:
+            return self.decode(json5_str)
 
-        # stack contains (type, data, last_key) tuples
-        stack: list[tuple[Literal["object", "array"], JsonValue, str | None]] = []
-        root: JsonValue | JsonValuePairs = None
-        root_defined: bool = False
-
-        # A helper function to add a new value to the top of the stack
-        def add_value_to_top(value: JsonValue, local_idx: int) -> JsonValue | None:
-            # If stack is empty, this is the root value
-            if not stack:
-                return value
-
-            top_type, top_data, top_last_key = stack[-1]
-            if top_type == "object":
-                if top_last_key is None:
-                    # We didn't expect a value without a key
-                    raise JSON5DecodeError(
-                        DecoderErr.expecting_property_name(), json5_str, 0
-                    )
-                # Insert into dict under the key
-                if self._object_pairs_hook is not None:
-                    assert isinstance(top_data, list)
-                    top_data.append((top_last_key, value))
-                else:
-                    assert isinstance(top_data, dict)
-                    top_data[top_last_key] = value
-                # Reset last_key
-                stack[-1] = (top_type, top_data, None)
-            else:  # array
-                assert top_type == "array"
-                assert isinstance(top_data, list)
-                if tokens[local_idx - 1].tk_type not in {
-                    TOKEN_TYPE["PUN_COMMA"],
-                    TOKEN_TYPE["PUN_OPEN_BRACKET"],
-                }:
-                    # it is not the first element and the comma is missing
-                    raise JSON5DecodeError(
-                        DecoderErr.missing_comma("array"),
-                        json5_str,
-                        tokens[local_idx].value[0],
-                    )
-                top_data.append(value)
-            return None  # The root remains unchanged unless stack was empty
+        from ujson5.parallel import decode_chunks  # pylint: disable=C0415
 
-        def update_root(new_root: JsonValue, root_start: int) -> None:
-            nonlocal root, root_defined
-            if root_defined:
+        # hooks are applied to the root value, after the runs are joined
+        chunk_decoder = copy.copy(self)
+        chunk_decoder._object_hook = None
+        chunk_decoder._object_pairs_hook = None
+        runs = list(zip(bounds, bounds[1:], strict=False))
+        chunks = [json5_str[start + 1 : end] for start, end in runs]
+        root: list[Any] = []
+        for (start, end), before_end, chunk_result in zip(
+            runs,
+            previous + [close_idx],
+            decode_chunks(chunk_decoder, chunks, workers),
+            strict=True,
+        ):
+            if isinstance(chunk_result, JSON5DecodeError):
                 raise JSON5DecodeError(
-                    DecoderErr.multiple_root(), json5_str, root_start
+                    chunk_result.msg, json5_str, min(start + chunk_result.pos, end)
                 )
-            root = new_root
-            root_defined = True
-
-        def update_last_key(new_key: str, local_idx: int) -> None:
-            if (
-                local_idx + 1 >= len(tokens)
-                or tokens[local_idx + 1].tk_type != TOKEN_TYPE["PUN_COLON"]
-            ):
-                # key should always be followed by a colon
+            if end != close_idx:
+                # the run is decoded with a legal trailing comma, but only whitespace
+                # and comments between two commas is an elided element
+                result = next_token(json5_str, before_end + 1)
+                assert result is not None
+                if result.token.value[0] == end:
+                    raise JSON5DecodeError(DecoderErr.expecting_value(), json5_str, end)
+            root.extend(chunk_result)
+        return self._apply_hooks(root, json5_str, root_start)
+
+    def _decode_bytes(self, buffer: BytesLike) -> Any:
+        """Deserialize an encoded JSON5 document.
+
+        UTF-8 buffers are lexed byte by byte and only the slices of string, identifier
+        and number tokens are decoded. Documents that need the `str` lexer (e.g.
+        non-ASCII identifiers or whitespace, or invalid tokens) are decoded to `str`
+        and parsed again. Other errors are reported with the character position of
+        the byte offset they were raised at.
+        """
+        encoding = _detect_encoding(buffer)
+        if encoding in {"utf-8", "utf-8-sig"}:
+            start_idx = 3 if encoding == "utf-8-sig" else 0
+            try:
+                obj, end_idx = self._parse_json5(buffer, start_idx, next_token_bytes)
+                trailing = next_token_bytes(buffer, end_idx)
+                if trailing is None:
+                    return obj
                 raise JSON5DecodeError(
-                    DecoderErr.missing_colon(),
-                    json5_str,
-                    tokens[local_idx].value[0],
+                    DecoderErr.multiple_root(), buffer, trailing.token.value[0]
                 )
-            if tokens[local_idx - 1].tk_type not in {
-                TOKEN_TYPE["PUN_COMMA"],
-                TOKEN_TYPE["PUN_OPEN_BRACE"],
-            }:
-                # it is not the first key-value pair and the comma is missing
+            except BytesFallback:
+                pass
+            except JSON5DecodeError as e:
                 raise JSON5DecodeError(
-                    DecoderErr.missing_comma("array"),
-                    json5_str,
-                    tokens[local_idx].value[0],
-                )
-            top_type, top_data, _ = stack[-1]
-            stack[-1] = (top_type, top_data, new_key)
+                    e.msg,
+                    _Utf8Text(buffer, start_idx),
+                    len(str(buffer[start_idx : e.pos], "utf-8")),
+                ) from e.__cause__
+        return self.decode(str(buffer, encoding))
 
-        idx = 0
-        while idx < len(tokens):
-            tk_start, tk_typ = tokens[idx].value[0], tokens[idx].tk_type
-            tk_str = json5_str[tokens[idx].value[0] : tokens[idx].value[1]]
+    def raw_decode(self, json5_str: str, idx: int = 0) -> tuple[Any, int]:
+        """Deserialize the JSON5 value starting at `idx` in a string and return the
+        index right after it. Lexing stops as soon as the value is complete, so this can
+        be used to decode a value embedded in a larger string: anything after the value
+        is neither read nor validated.
 
-            if tk_typ == TOKEN_TYPE["PUN_OPEN_BRACE"]:
-                if self._object_pairs_hook is not None:
-                    new_obj: list[tuple[str, JsonValue]] | dict[str, JsonValue] = []
-                else:
-                    new_obj = {}
-                add_value_to_top(new_obj, idx)
-                # Push onto the stack
-                stack.append(("object", new_obj, None))
+        Example:
+        ```python
+        import ujson5
+        ujson5.Json5Decoder().raw_decode('frame: {"id": 1} trailer', 7)
+        # ({'id': 1}, 16)
+        ```
 
-            elif tk_typ == TOKEN_TYPE["PUN_CLOSE_BRACE"]:
-                if not stack or stack[-1][0] != "object":
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_punctuation("}"), json5_str, tk_start
-                    )
-                top_layer = stack.pop()
-                if not stack:
-                    # If stack is now empty, that means this object is the root
-                    update_root(top_layer[1], tk_start)
+        Args:
+            json5_str: The string containing the JSON5 value.
+            idx: Index where the value (or whitespace and comments preceding it)
+                starts. Defaults to 0.
+
+        Returns:
+            A tuple of the Python object represented by the JSON5 value and the index
+                in `json5_str` right after the value.
+
+        Raises:
+            JSON5DecodeError: If the JSON5 value is invalid.
+        """
+        return self._parse_json5(json5_str, idx)
+
+    def _parse_json5(
+        self, json5_str: Any, idx: int, scan: Scanner = next_token
+    ) -> tuple[Any, int]:
+        """Parse the JSON5 value starting at `idx` in a single pass. Tokens are lexed on
+        demand and Python objects are built as soon as each token is read, so no token
+        list is materialized.
+
+        Args:
+            json5_str: The JSON5 string being parsed.
+            idx: Index where the value (or whitespace and comments preceding it) starts.
+            scan: The lexer function returning the next token.
+
+        Returns:
+            A tuple of the parsed value and the index right after it.
+
+        Raises:
+            JSON5DecodeError: If the value is invalid.
+        """
+        # the parser requests the token at each index and the scanner lexes it there
+        parser = self._parse_requests(json5_str, idx)
+        try:
+            idx = next(parser)
+            while True:
+                idx = parser.send(scan(json5_str, idx))
+        except StopIteration as stop:
+            return stop.value
+
+    async def decode_async(
+        self, reader: "StreamReader", chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Any:
+        """Deserialize a JSON5 document read from an asynchronous stream.
+
+        The stream is read `chunk_size` bytes at a time and each chunk is parsed as soon
+        as it is read. Control returns to the event loop between chunks, so decoding a
+        large document does not block other tasks for longer than parsing one chunk.
+
+        Args:
+            reader: The stream, read with `await reader.read(chunk_size)` until it
+                returns an empty chunk. Its data must be UTF-8 encoded `bytes` (a BOM is
+                allowed) or `str`.
+            chunk_size: Number of bytes read at a time.
+
+        Returns:
+            The Python object represented by the JSON5 document.
 
-            elif tk_typ == TOKEN_TYPE["PUN_OPEN_BRACKET"]:
+        Raises:
+            JSON5DecodeError: If the JSON5 document is invalid. Error positions are
+                character offsets in the stream.
+        """
+        import asyncio  # pylint: disable=C0415
+
+        window = _StreamWindow(None, chunk_size)
+
+        async def scan(idx: int) -> TokenResult | None:
+            while True:
+                complete, result = window.scan_buffered(idx)
+                if complete:
+                    return result
+                window.feed(await reader.read(chunk_size))
+                # the reader does not yield if it has buffered the chunk already
+                await asyncio.sleep(0)
+
+        parser = self._parse_requests(window)
+        try:
+            idx = next(parser)
+            while True:
+                idx = parser.send(await scan(idx))
+        except StopIteration as stop:
+            obj, end_idx = stop.value
+        trailing = await scan(end_idx)
+        if trailing is not None:
+            raise JSON5DecodeError(
+                DecoderErr.multiple_root(), window, trailing.token.value[0]
+            )
+        return obj
+
+    def _parse_requests(
+        self, json5_str: Any, idx: int = 0
+    ) -> Generator[int, TokenResult | None, tuple[Any, int]]:
+        """Parse the JSON5 value starting at `idx` without lexing the document. The
+        generator yields the index of each token it needs and is sent the token lexed
+        there (`None` at the end of the document), so the caller chooses how the
+        document is lexed and read: `_parse_json5` lexes it right away, while
+        `decode_async` reads the stream asynchronously in between.
+
+        Returns:
+            A tuple of the parsed value and the index right after it.
+        """
+        result = yield idx
+        if result is None:
+            raise JSON5DecodeError(DecoderErr.empty_json5(), json5_str, idx)
+        root_start: int = result.token.value[0]
+        use_pairs: bool = self._object_pairs_hook is not None
+        parse_string = self._parse_string
+        parse_number = self._parse_number
+
+        # open containers with the key of the entry being parsed. key is None for arrays
+        stack: list[tuple[Any, str | None]] = []
+        key: str | None
+        value: Any
+        while True:
+            # a value is expected at the current token. Branches are ordered by how
+            # often the token types occur in typical documents
+            (tk_type, (tk_start, tk_end)), idx = result
+            if tk_type == TK_STRING:
+                text = json5_str[tk_start:tk_end]
+                if not isinstance(text, str):
+                    text = str(text, "utf-8")
+                if "\\" in text:
+                    text = parse_string(text, json5_str, tk_start)
+                value = text
+            elif tk_type == TK_NUMBER:
+                text = json5_str[tk_start:tk_end]
+                if not isinstance(text, str):
+                    text = str(text, "utf-8")
+                value = parse_number(text)
+            elif tk_type == TK_OPEN_BRACE:
+                new_obj: JsonValuePairs | dict[str, JsonValue] = [] if use_pairs else {}
+                result = yield idx
+                if result is None:
+                    self._raise_eof(json5_str)
+                if result.token.tk_type != TK_CLOSE_BRACE:
+                    key, idx = yield from self._request_key(json5_str, result)
+                    stack.append((new_obj, key))
+                    result = yield idx
+                    if result is None:
+                        self._raise_eof(json5_str)
+                    continue
+                value, idx = new_obj, result.idx
+            elif tk_type == TK_OPEN_BRACKET:
                 new_arr: list[JsonValue] = []
-                add_value_to_top(new_arr, idx)
-                stack.append(("array", new_arr, None))
+                result = yield idx
+                if result is None:
+                    self._raise_eof(json5_str)
+                if result.token.tk_type != TK_CLOSE_BRACKET:
+                    stack.append((new_arr, None))
+                    continue
+                value, idx = new_arr, result.idx
+            else:
+                value = self._parse_scalar(json5_str, result.token)
 
-            elif tk_typ == TOKEN_TYPE["PUN_CLOSE_BRACKET"]:
-                if not stack or stack[-1][0] != "array":
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_punctuation("]"), json5_str, tk_start
-                    )
-                top_layer = stack.pop()
-                if not stack:
-                    # If stack is now empty, that means this array is the root
-                    update_root(top_layer[1], tk_start)
-
-            elif tk_typ == TOKEN_TYPE["IDENTIFIER"]:
-                if not stack or stack[-1][0] == "array" or stack[-1][2] is not None:
-                    # identifier can only be used as a key in an object
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_identifier(), json5_str, tk_start
-                    )
-                if not self._allow_reserved_words and tk_str in RESERVED_WORDS:
-                    raise JSON5DecodeError(
-                        DecoderErr.reserved_word(tk_str), json5_str, tk_start
-                    )
-                update_last_key(self._parse_identifier(tk_str), idx)
-            elif tk_typ == TOKEN_TYPE["STRING"]:
-                parsed_str = self._parse_string(tk_str, json5_str, tk_start)
-                if not stack:
-                    # A bare string is a root-level scalar
-                    update_root(parsed_str, tk_start)
+            # the value is complete: add it to its container, then close every
+            # container that ends right after it
+            while stack:
+                container, key = stack[-1]
+                if key is None:
+                    container.append(value)
+                    close_type = TK_CLOSE_BRACKET
                 else:
-                    top_type, _, top_last_key = stack[-1]
-                    if top_type == "object":
-                        # If last_key is None, this string should be a key
-                        if top_last_key is None:
-                            update_last_key(parsed_str, idx)
-                        else:
-                            # last_key is already set, so this string is a value
-                            add_value_to_top(parsed_str, idx)
+                    if use_pairs:
+                        container.append((key, value))
                     else:
-                        # top_type is array
-                        add_value_to_top(parsed_str, idx)
-
-            elif tk_typ == TOKEN_TYPE["NUMBER"]:
-                parsed_number = self._parse_number(tk_str)
-                # These are scalar values
-                if not stack:
-                    # A bare scalar is root-level
-                    update_root(parsed_number, tk_start)
-                else:
-                    add_value_to_top(parsed_number, idx)
+                        container[key] = value
+                    close_type = TK_CLOSE_BRACE
+                result = yield idx
+                if result is None:
+                    self._raise_eof(json5_str)
+                tk_type = result.token.tk_type
+                if tk_type == TK_COMMA:
+                    result = yield result.idx
+                    if result is None:
+                        self._raise_eof(json5_str)
+                    if result.token.tk_type == close_type:
+                        value, idx = stack.pop()[0], result.idx
+                        continue
+                    if key is not None:
+                        key, idx = yield from self._request_key(json5_str, result)
+                        stack[-1] = (container, key)
+                        result = yield idx
+                        if result is None:
+                            self._raise_eof(json5_str)
+                    break
+                if tk_type == close_type:
+                    value, idx = stack.pop()[0], result.idx
+                    continue
+                self._raise_missing_comma(json5_str, result.token, key is None)
+            else:
+                return self._apply_hooks(value, json5_str, root_start), idx
 
-            elif tk_typ == TOKEN_TYPE["BOOLEAN"]:
-                assert tk_str in {"true", "false"}
-                parsed_bool = tk_str == "true"
-                if not stack:
-                    update_root(parsed_bool, tk_start)
-                else:
-                    add_value_to_top(parsed_bool, idx)
+    def iter_decode(
+        self,
+        source: str | BytesLike | IO[str] | IO[bytes],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Decode successive JSON5 values from a document holding several of them,
+        separated by whitespace or comments (e.g. one value per line).
 
-            elif tk_typ == TOKEN_TYPE["NULL"]:
-                assert tk_str == "null"
-                if not stack:
-                    update_root(None, tk_start)
-                else:
-                    add_value_to_top(None, idx)
+        Args:
+            source: The JSON5 values. A `str`, a UTF-8/16/32 encoded buffer or a text
+                or binary (UTF-8) file-like object.
+            chunk_size: Number of characters (or bytes) read at a time from buffers and
+                file-like objects.
 
-            elif tk_typ == TOKEN_TYPE["PUN_COLON"]:
-                # Just validate that we are in an object and have a last_key
-                if not stack:
-                    raise JSON5DecodeError(
-                        DecoderErr.expecting_value(), json5_str, tk_start
-                    )
-                top_type, _, top_last_key = stack[-1]
-                # Colon should only be used in an object and after a key
-                if top_type != "object":
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_colon_in_array(), json5_str, tk_start
-                    )
-                if top_last_key is None:
-                    raise JSON5DecodeError(
-                        DecoderErr.missing_key_with_colon(), json5_str, tk_start
-                    )
-                if idx + 1 >= len(tokens):
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_eof(), json5_str, tk_start
+        Yields:
+            Any: The decoded values, each as soon as it is parsed.
+
+        Raises:
+            JSON5DecodeError: If a value is invalid.
+        """
+        if isinstance(source, str):
+            return self._iter_decode(source, next_token)
+        if hasattr(source, "read"):
+            window = _StreamWindow(source, chunk_size)
+        else:
+            window = _StreamWindow(
+                _BufferReader(source), chunk_size, _detect_encoding(source)
+            )
+        return self._iter_decode(window, _StreamWindow.scan)
+
+    def _iter_decode(self, json5_str: Any, scan: Scanner) -> Iterator[Any]:
+        """Generate the values of a document holding several of them."""
+        idx = 0
+        # the first token of each value is lexed again by `_parse_json5`
+        while scan(json5_str, idx) is not None:
+            value, idx = self._parse_json5(json5_str, idx, scan)
+            yield value
+
+    def iterparse(
+        self,
+        source: str | BytesLike | IO[str] | IO[bytes],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Json5Event]:
+        """Parse a JSON5 document lazily and yield parsing events.
+
+        No containers are built: only the current key or scalar value is decoded, so
+        memory usage does not depend on the size of the document.
+
+        Args:
+            source: The JSON5 document. A `str`, a UTF-8/16/32 encoded buffer or a text
+                or binary (UTF-8) file-like object.
+            chunk_size: Number of characters (or bytes) read at a time from buffers and
+                file-like objects.
+
+        Yields:
+            Json5Event: The events of the document in order. Offsets are character
+                offsets in the (decoded) document.
+
+        Raises:
+            JSON5DecodeError: If the JSON5 document is invalid. The events preceding
+                the error have already been yielded.
+        """
+        if isinstance(source, str):
+            return self._iter_events(source, next_token)
+        if hasattr(source, "read"):
+            window = _StreamWindow(source, chunk_size)
+        else:
+            window = _StreamWindow(
+                _BufferReader(source), chunk_size, _detect_encoding(source)
+            )
+        return self._iter_events(window, _StreamWindow.scan)
+
+    def _iter_events(
+        self, json5_str: Any, scan: Scanner
+    ) -> Generator[Json5Event, int | None, None]:
+        """Generate the parsing events of a document. This is the walker shared by
+        `iterparse`, `extract` and `iter_items`, so the rules for commas, trailing
+        commas and closing brackets are only implemented here.
+
+        In reply to a `start_map` or `start_array` event, the consumer can send the
+        index right after the object or array once it has skipped or decoded it
+        itself. The walker then continues after it, without events for its content.
+        """
+        result = scan(json5_str, 0)
+        if result is None:
+            raise JSON5DecodeError(DecoderErr.empty_json5(), json5_str, 0)
+
+        # open containers. True for objects, False for arrays
+        stack: list[bool] = []
+        while True:
+            # a value is expected at the current token
+            tk_type = result.token.tk_type
+            tk_start, tk_end = result.token.value
+            idx = result.idx
+            if tk_type in CONTAINER_OPEN:
+                in_object = tk_type == TK_OPEN_BRACE
+                end_idx = yield Json5Event(
+                    "start_map" if in_object else "start_array", None, tk_start, tk_end
+                )
+                if end_idx is not None:
+                    idx = end_idx
+                else:
+                    result = self._next_token(json5_str, idx, scan)
+                    if result.token.tk_type != (
+                        TK_CLOSE_BRACE if in_object else TK_CLOSE_BRACKET
+                    ):
+                        if in_object:
+                            key, idx = self._parse_key(json5_str, result, scan)
+                            yield Json5Event("map_key", key, *result.token.value)
+                            result = self._next_token(json5_str, idx, scan)
+                        stack.append(in_object)
+                        continue
+                    yield Json5Event(
+                        "end_map" if in_object else "end_array",
+                        None,
+                        *result.token.value,
                     )
-                if tokens[idx + 1].tk_type in {
-                    TOKEN_TYPE["PUN_CLOSE_BRACE"],
-                    TOKEN_TYPE["PUN_CLOSE_BRACKET"],
-                    TOKEN_TYPE["PUN_COMMA"],
-                    TOKEN_TYPE["PUN_COLON"],
-                }:
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_punctuation(
-                            json5_str[tokens[idx + 1].value[0]]
-                        ),
-                        json5_str,
-                        tokens[idx + 1].value[0],
+                    idx = result.idx
+            else:
+                value = self._parse_scalar(json5_str, result.token)
+                yield Json5Event("value", value, tk_start, tk_end)
+
+            # the value is complete: close every container that ends right after it
+            while stack:
+                in_object = stack[-1]
+                close_type = TK_CLOSE_BRACE if in_object else TK_CLOSE_BRACKET
+                result = self._next_token(json5_str, idx, scan)
+                has_comma: bool = result.token.tk_type == TK_COMMA
+                if has_comma:
+                    result = self._next_token(json5_str, result.idx, scan)
+                if result.token.tk_type == close_type:
+                    stack.pop()
+                    yield Json5Event(
+                        "end_map" if in_object else "end_array",
+                        None,
+                        *result.token.value,
                     )
+                    idx = result.idx
+                    continue
+                if not has_comma:
+                    self._raise_missing_comma(json5_str, result.token, not in_object)
+                if in_object:
+                    key, idx = self._parse_key(json5_str, result, scan)
+                    yield Json5Event("map_key", key, *result.token.value)
+                    result = self._next_token(json5_str, idx, scan)
+                break
+            else:
+                break
 
+        trailing = scan(json5_str, idx)
+        if trailing is not None:
+            raise JSON5DecodeError(
+                DecoderErr.multiple_root(), json5_str, trailing.token.value[0]
+            )
+
+    def _parse_scalar(self, json5_str: Any, token: Token) -> Any:
+        """Decode a token where a scalar value is expected."""
+        tk_type = token.tk_type
+        tk_start, tk_end = token.value
+        if tk_type == TK_STRING:
+            return self._parse_string(
+                _token_str(json5_str, tk_start, tk_end), json5_str, tk_start
+            )
+        if tk_type == TK_NUMBER:
+            return self._parse_number(_token_str(json5_str, tk_start, tk_end))
+        if tk_type == TK_BOOLEAN:
+            return tk_end - tk_start == 4  # true
+        if tk_type == TK_NULL:
+            return None
+        if tk_type == TK_IDENTIFIER:
+            raise JSON5DecodeError(
+                DecoderErr.unexpected_identifier(), json5_str, tk_start
+            )
+        if tk_type == TK_COMMA:
+            raise JSON5DecodeError(DecoderErr.expecting_value(), json5_str, tk_start)
+        raise JSON5DecodeError(
+            DecoderErr.unexpected_punctuation(_token_str(json5_str, tk_start, tk_end)),
+            json5_str,
+            tk_start,
+        )
+
+    def extract(
+        self, json5_str: str | BytesLike, paths: Iterable[str]
+    ) -> dict[str, Any]:
+        """Decode only the values at the given paths of a JSON5 document.
+
+        Objects and arrays that cannot contain a selected path are skipped by matching
+        their brackets, without tokenizing or decoding their content. Once every path
+        without wildcards has been found, the rest of the document is not read.
+
+        Args:
+            json5_str: The JSON5 document.
+            paths: Paths of the values to decode. Segments are separated by `/` and are
+                either object keys, array indices or `*` to select every member of an
+                object or array (e.g. `"server/port"` or `"features/*/enabled"`).
+
+        Returns:
+            A dictionary mapping the concrete path of every value found to the value.
+                Paths that are not found are omitted. If a key is duplicated, the first
+                occurrence is used.
+
+        Raises:
+            JSON5DecodeError: If the parts of the document that are read are invalid.
+                Skipped objects and arrays are only checked for matching brackets and
+                valid strings and comments.
+        """
+        if not isinstance(json5_str, str):
+            json5_str = str(json5_str, _detect_encoding(json5_str))
+        patterns = [
+            path.strip("/").split("/") if path.strip("/") else [] for path in paths
+        ]
+        # the document can be left early if no pattern has wildcards
+        remaining: int | None = (
+            None
+            if any("*" in pattern for pattern in patterns)
+            else len({tuple(pattern) for pattern in patterns})
+        )
+        found: dict[str, Any] = {}
+
+        def add(path: list[str], value: Any) -> None:
+            nonlocal remaining
+            key = "/".join(path)
+            if key not in found:
+                found[key] = value
+                if remaining is not None:
+                    remaining -= 1
+
+        def select(value: Any, pattern: list[str], path: list[str]) -> None:
+            """Select a pattern in a value that has already been decoded."""
+            if not pattern:
+                add(path, value)
+                return
+            segment = pattern[0]
+            items: Iterable[tuple[str, Any]]
+            if isinstance(value, dict):
+                items = value.items()
+            elif isinstance(value, list):
+                items = ((str(i), item) for i, item in enumerate(value))
             else:
-                assert tk_typ == TOKEN_TYPE["PUN_COMMA"]
-                if idx + 1 >= len(tokens) or idx == 0:
-                    raise JSON5DecodeError(
-                        DecoderErr.expecting_value(), json5_str, tk_start
-                    )
-                if not stack:
-                    raise JSON5DecodeError(
-                        DecoderErr.unexpected_punctuation(","), json5_str, tk_start
-                    )
-                if stack[-1][0] == "object":
-                    # in an object, anything before a comma should be a value
-                    if tokens[idx - 1].tk_type not in {
-                        TOKEN_TYPE["STRING"],
-                        TOKEN_TYPE["NUMBER"],
-                        TOKEN_TYPE["BOOLEAN"],
-                        TOKEN_TYPE["NULL"],
-                        TOKEN_TYPE["PUN_CLOSE_BRACE"],
-                        TOKEN_TYPE["PUN_CLOSE_BRACKET"],
-                    }:
-                        raise JSON5DecodeError(
-                            DecoderErr.expecting_property_value(
-                                tokens[idx - 1].tk_type
-                            ),
-                            json5_str,
-                            tk_start,
-                        )
-                    # in an object, anything after a comma should be a key
-                    # or the end of the object
-                    if tokens[idx + 1].tk_type not in {
-                        TOKEN_TYPE["STRING"],
-                        TOKEN_TYPE["IDENTIFIER"],
-                        TOKEN_TYPE["PUN_CLOSE_BRACE"],
-                    }:
-                        raise JSON5DecodeError(
-                            DecoderErr.expecting_property_name(tokens[idx + 1].tk_type),
-                            json5_str,
-                            tokens[idx + 1].value[0],
-                        )
-                elif stack[-1][0] == "array":
-                    # in an array, anything before a comma should be a value
-                    if tokens[idx - 1].tk_type not in {
-                        TOKEN_TYPE["STRING"],
-                        TOKEN_TYPE["NUMBER"],
-                        TOKEN_TYPE["BOOLEAN"],
-                        TOKEN_TYPE["NULL"],
-                        TOKEN_TYPE["PUN_CLOSE_BRACE"],
-                        TOKEN_TYPE["PUN_CLOSE_BRACKET"],
-                    }:
-                        raise JSON5DecodeError(
-                            DecoderErr.expecting_value(), json5_str, tk_start
-                        )
-                    # in an array, anything after a comma should be a value
-                    # or the end of the array
-                    if tokens[idx + 1].tk_type not in {
-                        TOKEN_TYPE["STRING"],
-                        TOKEN_TYPE["NUMBER"],
-                        TOKEN_TYPE["BOOLEAN"],
-                        TOKEN_TYPE["NULL"],
-                        TOKEN_TYPE["PUN_CLOSE_BRACKET"],
-                        TOKEN_TYPE["PUN_OPEN_BRACKET"],
-                        TOKEN_TYPE["PUN_OPEN_BRACE"],
-                    }:
-                        raise JSON5DecodeError(
-                            DecoderErr.expecting_value(), json5_str, tk_start
-                        )
-            idx += 1
-
-        # If everything is parsed, the stack should be empty (all objects/arrays closed)
-        if stack:
+                return
+            for key, item in items:
+                if segment in {key, "*"}:
+                    select(item, pattern[1:], [*path, key])
+
+        events = self._iter_events(json5_str, next_token)
+
+        def visit(
+            event: Json5Event, patterns: list[list[str]], path: list[str]
+        ) -> Json5Event | None:
+            """Extract the patterns from the value starting with `event`. Returns the
+            event following the value, or None once every pattern has been found."""
+            depth = len(path)
+            if any(len(pattern) == depth for pattern in patterns):
+                value, end_idx = self._decode_event(json5_str, event, next_token)
+                for pattern in patterns:
+                    select(value, pattern[depth:], path)
+                return None if remaining == 0 else events.send(end_idx)
+            if event.event == "value":
+                return next(events)
+
+            event = next(events)
+            index = 0
+            while event.event not in {"end_map", "end_array"}:
+                if event.event == "map_key":
+                    key = event.value
+                    event = next(events)
+                else:
+                    key = str(index)
+                    index += 1
+                selected = [p for p in patterns if p[depth] in {key, "*"}]
+                if selected:
+                    next_event = visit(event, selected, [*path, key])
+                    if next_event is None:
+                        return None
+                    event = next_event
+                else:
+                    event = self._skip_value(json5_str, events, event)
+            return next(events)
+
+        try:
+            visit(next(events), patterns, [])
+        except StopIteration:
+            # the walker has checked that nothing follows the root value
+            pass
+        return found
+
+    def iter_items(
+        self,
+        source: str | BytesLike | IO[str] | IO[bytes],
+        path: str = "",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Decode the elements of an array one by one.
+
+        Each element is yielded as soon as it is fully parsed. Neither the rest of the
+        array nor the rest of the document is held in memory when reading buffers or
+        file-like objects. Objects and arrays outside the path to the array are not
+        built (in strings, they are skipped by matching their brackets), and the
+        document is not read past the end of the array.
+
+        Args:
+            source: The JSON5 document. A `str`, a UTF-8/16/32 encoded buffer or a text
+                or binary (UTF-8) file-like object.
+            path: Path of the array. Segments are separated by `/` and are either
+                object keys or array indices. The default selects the root value. If a
+                key is duplicated, the first occurrence is used, whereas
+                [`loads`][ujson5.loads] keeps the last one.
+            chunk_size: Number of characters (or bytes) read at a time from buffers and
+                file-like objects.
+
+        Yields:
+            Any: The elements of the array.
+
+        Raises:
+            JSON5DecodeError: If the document is invalid, the path does not exist or
+                the value at the path is not an array.
+        """
+        if isinstance(source, str):
+            return self._iter_items(source, next_token, path)
+        if hasattr(source, "read"):
+            window = _StreamWindow(source, chunk_size)
+        else:
+            window = _StreamWindow(
+                _BufferReader(source), chunk_size, _detect_encoding(source)
+            )
+        return self._iter_items(window, _StreamWindow.scan, path)
+
+    def _iter_items(self, json5_str: Any, scan: Scanner, path: str) -> Iterator[Any]:
+        """Generate the elements of the array at `path`."""
+        events = self._iter_events(json5_str, scan)
+        event = next(events)
+        segments = path.strip("/").split("/") if path.strip("/") else []
+        for segment in segments:
+            event = self._find_member(json5_str, events, event, segment, path)
+        if event.event != "start_array":
+            raise JSON5DecodeError(
+                DecoderErr.expecting_array(path), json5_str, event.start
+            )
+
+        event = next(events)
+        while event.event != "end_array":
+            item, end_idx = self._decode_event(json5_str, event, scan)
+            yield item
+            event = events.send(end_idx)
+
+    def _find_member(
+        self,
+        json5_str: Any,
+        events: Generator[Json5Event, int | None, None],
+        event: Json5Event,
+        segment: str,
+        path: str,
+    ) -> Json5Event:
+        """Find the member `segment` of the object or array starting with `event`,
+        skipping the other members. Members are found in a single pass, so the first
+        of duplicated keys is used.
+
+        Returns:
+            The first event of the member.
+        """
+        if event.event not in {"start_map", "start_array"}:
             raise JSON5DecodeError(
-                DecoderErr.expecting_value(), json5_str, tokens[-1].value[0]
+                DecoderErr.path_not_found(path), json5_str, event.start
             )
+        event = next(events)
+        index = 0
+        while event.event not in {"end_map", "end_array"}:
+            if event.event == "map_key":
+                key = event.value
+                event = next(events)
+            else:
+                key = str(index)
+                index += 1
+            if key == segment:
+                return event
+            event = self._skip_value(json5_str, events, event)
+        raise JSON5DecodeError(DecoderErr.path_not_found(path), json5_str, event.start)
+
+    def _skip_value(
+        self,
+        json5_str: Any,
+        events: Generator[Json5Event, int | None, None],
+        event: Json5Event,
+    ) -> Json5Event:
+        """Skip the value starting with `event` without decoding it.
+
+        Returns:
+            The event following the value.
+        """
+        if event.event == "value":
+            return next(events)
+        if isinstance(json5_str, str):
+            # only brackets, strings and comments are matched
+            return events.send(skip_container(json5_str, event.start))
+        # streams cannot be scanned ahead, so their events are read and dropped
+        depth = 1
+        while depth:
+            event = next(events)
+            if event.event in {"start_map", "start_array"}:
+                depth += 1
+            elif event.event in {"end_map", "end_array"}:
+                depth -= 1
+        return next(events)
+
+    def _decode_event(
+        self, json5_str: Any, event: Json5Event, scan: Scanner
+    ) -> tuple[Any, int | None]:
+        """Decode the value starting with `event`, applying the hooks to it.
+
+        Returns:
+            A tuple of the value and the index right after it to send to the walker, or
+                None for scalars, which the walker has already read.
+        """
+        if event.event == "value":
+            return self._apply_hooks(event.value, json5_str, event.start), None
+        return self._parse_json5(json5_str, event.start, scan)
+
+    def _next_token(self, json5_str: Any, idx: int, scan: Scanner) -> TokenResult:
+        """Lex the next token inside a container, where the document cannot end yet."""
+        result = scan(json5_str, idx)
+        if result is None:
+            self._raise_eof(json5_str)
+        return result
+
+    def _raise_eof(self, json5_str: Any) -> NoReturn:
+        """Raise the error for a document ending inside a container."""
+        raise JSON5DecodeError(DecoderErr.unexpected_eof(), json5_str, len(json5_str))
+
+    def _request_key(
+        self, json5_str: Any, result: TokenResult
+    ) -> Generator[int, TokenResult | None, tuple[str, int]]:
+        """Parse an object key and request the colon following it. See
+        `_parse_requests`."""
+        key = self._parse_key_token(json5_str, result.token)
+        colon = yield result.idx
+        if colon is None or colon.token.tk_type != TK_COLON:
+            raise JSON5DecodeError(
+                DecoderErr.missing_colon(), json5_str, result.token.value[0]
+            )
+        return key, colon.idx
+
+    def _parse_key(
+        self, json5_str: Any, result: TokenResult, scan: Scanner
+    ) -> tuple[str, int]:
+        """Parse an object key and the colon following it.
 
-        if self._object_pairs_hook is None and self._object_hook is not None:
+        Returns:
+            A tuple of the key and the index right after the colon.
+        """
+        key = self._parse_key_token(json5_str, result.token)
+        colon = scan(json5_str, result.idx)
+        if colon is None or colon.token.tk_type != TK_COLON:
+            # key should always be followed by a colon
+            raise JSON5DecodeError(
+                DecoderErr.missing_colon(), json5_str, result.token.value[0]
+            )
+        return key, colon.idx
+
+    def _parse_key_token(self, json5_str: Any, token: Token) -> str:
+        """Parse the token of an object key."""
+        tk_type = token.tk_type
+        tk_start, tk_end = token.value
+        tk_str = _token_str(json5_str, tk_start, tk_end)
+        if tk_type == TK_IDENTIFIER:
+            if not self._allow_reserved_words and tk_str in RESERVED_WORDS:
+                raise JSON5DecodeError(
+                    DecoderErr.reserved_word(tk_str), json5_str, tk_start
+                )
+            return self._parse_identifier(tk_str)
+        if tk_type == TK_STRING:
+            return self._parse_string(tk_str, json5_str, tk_start)
+        raise JSON5DecodeError(
+            DecoderErr.expecting_property_name(tk_type), json5_str, tk_start
+        )
+
+    def _raise_missing_comma(
+        self, json5_str: Any, token: Token, in_array: bool
+    ) -> None:
+        """Raise the error for a token following a value without a separating comma."""
+        tk_start = token.value[0]
+        if token.tk_type in UNEXPECTED_AFTER_VALUE:
+            if in_array and token.tk_type == TK_COLON:
+                raise JSON5DecodeError(
+                    DecoderErr.unexpected_colon_in_array(), json5_str, tk_start
+                )
+            raise JSON5DecodeError(
+                DecoderErr.unexpected_punctuation(
+                    _token_str(json5_str, tk_start, tk_start + 1)
+                ),
+                json5_str,
+                tk_start,
+            )
+        raise JSON5DecodeError(
+            DecoderErr.missing_comma("array" if in_array else "object"),
+            json5_str,
+            tk_start,
+        )
+
+    def _apply_hooks(self, root: Any, json5_str: Any, root_start: int) -> Any:
+        """Call `object_pairs_hook` or `object_hook` on the decoded root value."""
+        if self._object_pairs_hook is not None:
             try:
-                return self._object_hook(root) if isinstance(root, dict) else root
+                return self._object_pairs_hook(root)
             except Exception as e:
                 raise JSON5DecodeError(
-                    DecoderErr.invalid_object_hook(), json5_str, tokens[-1].value[0]
+                    DecoderErr.invalid_object_pairs_hook(), json5_str, root_start
                 ) from e
-        if self._object_pairs_hook is not None:
+        if self._object_hook is not None and isinstance(root, dict):
             try:
-                return self._object_pairs_hook(root)  # type: ignore
+                return self._object_hook(root)
             except Exception as e:
                 raise JSON5DecodeError(
-                    DecoderErr.invalid_object_pairs_hook(),
-                    json5_str,
-                    tokens[-1].value[0],
+                    DecoderErr.invalid_object_hook(), json5_str, root_start
                 ) from e
-
-        # no hooks provided, just parse the JSON5 string
         return root
 
     def _parse_number(self, num_str: str) -> int | float:
         """Parse a number."""
+        # most floats have a fraction, and a "." cannot appear in other numbers
+        if "." in num_str:
+            return (
+                float(num_str)
+                if self._parse_float is None
+                else self._parse_float(num_str)
+            )
+        if "0x" in num_str or "0X" in num_str:
+            return int(num_str, 16)
         if "Infinity" in num_str:
             return (
                 float("-inf" if "-" in num_str else "inf")
@@ -447,9 +1099,7 @@ class Json5Decoder:
                 if self._parse_constant is None
                 else self._parse_constant(num_str)
             )
-        if "0x" in num_str or "0X" in num_str:
-            return int(num_str, 16)
-        if "." in num_str or "e" in num_str or "E" in num_str:
+        if "e" in num_str or "E" in num_str:
             return (
                 float(num_str)
                 if self._parse_float is None
@@ -458,6 +1108,9 @@ class Json5Decoder:
         return int(num_str) if self._parse_int is None else self._parse_int(num_str)
 
     def _parse_string(self, str_str: str, json5_str: str, str_start_idx: int) -> str:
+        if "\\" not in str_str:
+            return str_str
+
         def replace_escape_sequences_continuations(match):
             r"""Unescape escape sequences, unicode escape sequence
                 and line continuations in a string.
@@ -468,7 +1121,7 @@ class Json5Decoder:
             """
             if match.group(1):
                 # in strict mode, control characters are not allowed
-                if self._strict and match.group(1) in {"t", "n", "r", "0"}:
+                if self._strict and match.group(1) in STRICT_ESCAPES:
                     raise JSON5DecodeError(
                         DecoderErr.invalid_control_char(),
                         json5_str,
@@ -479,32 +1132,290 @@ class Json5Decoder:
                 return chr(int(match.group(2), 16))
             return ""
 
-        # group 1: escape sequences, group 2: unicode escape sequences
-        # group 3: line continuations
-        return re.sub(
-            r"\\([\'\"\\bfnrtv0])|\\u([0-9a-fA-F]{4})|\\\s*\n",
-            replace_escape_sequences_continuations,
-            str_str,
+        return STRING_ESCAPE_PATTERN.sub(
+            replace_escape_sequences_continuations, str_str
         )
 
     def _parse_identifier(self, id_str: str) -> str:
+        if "\\" not in id_str:
+            return id_str
+
         def replace_unicode_escape_sequences(match):
             r"""Unescape unicode escape sequences in an identifier.
             unicode escape sequences replaced: `\\u` followed by 4 hexadecimal digits
             """
             return chr(int(match.group(1), 16))
 
-        # group 1: escape sequences, group 2: unicode escape sequences
-        # group 3: line continuations
-        return re.sub(
-            r"\\u([0-9a-fA-F]{4})",
-            replace_unicode_escape_sequences,
-            id_str,
+        return IDENTIFIER_ESCAPE_PATTERN.sub(replace_unicode_escape_sequences, id_str)
+
+
+class _BufferReader:
+    """Binary file-like object reading a buffer without copying it."""
+
+    def __init__(self, buffer: BytesLike) -> None:
+        self._view = memoryview(buffer)
+        self._pos: int = 0
+
+    def read(self, size: int) -> memoryview:
+        """Read up to `size` bytes."""
+        chunk = self._view[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+class _Utf8Text:
+    """Text of a UTF-8 buffer, given as the document of errors raised while decoding
+    it. The buffer is only decoded when the line of an error is looked up, so raising
+    an error does not copy the document.
+    """
+
+    def __init__(self, buffer: BytesLike, start_idx: int) -> None:
+        self._buffer = buffer
+        self._start_idx: int = start_idx
+
+    @cached_property
+    def _text(self) -> str:
+        return str(self._buffer[self._start_idx :], "utf-8")
+
+    def __str__(self) -> str:
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    def __getitem__(self, key: slice) -> str:
+        return self._text[key]
+
+    def count(self, sub: str, start: int, end: int) -> int:
+        """Count occurrences of `sub` between `start` and `end`."""
+        return self._text.count(sub, start, end)
+
+    def rfind(self, sub: str, start: int, end: int) -> int:
+        """Find the last `sub` between `start` and `end`."""
+        return self._text.rfind(sub, start, end)
+
+    def find(self, sub: str, start: int) -> int:
+        """Find the first `sub` after `start`."""
+        return self._text.find(sub, start)
+
+
+class _StreamWindow:
+    """Window over the unconsumed part of a text or binary stream.
+
+    Positions are absolute offsets in the decoded stream. Text before the token being
+    lexed is dropped as the stream is read, so memory is bounded by the longest token
+    rather than by the size of the document. The window also provides the `str`
+    lookups `JSON5DecodeError` uses to locate the line of an error.
+
+    `fp` is any object whose `read(size)` method returns `str` or bytes-like chunks.
+    Without `fp`, the caller reads the stream itself (e.g. asynchronously) and passes
+    it to `feed` whenever `scan_buffered` needs more of it.
+    """
+
+    def __init__(self, fp: Any, chunk_size: int, encoding: str = "utf-8-sig") -> None:
+        self._fp = fp
+        self._chunk_size: int = chunk_size
+        self._encoding: str = encoding
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._eof: bool = False
+        self._text: str = ""
+        # absolute position of the first character of `_text`
+        self._base: int = 0
+        # number and last absolute position of the "\n" dropped from the window
+        self._dropped_newlines: int = 0
+        self._last_newline: int = -1
+
+    def scan(self, idx: int) -> TokenResult | None:
+        """Lex the next token at absolute position `idx`, reading more of the stream
+        while the token may continue past the end of the window."""
+        assert self._fp is not None
+        while True:
+            complete, result = self.scan_buffered(idx)
+            if complete:
+                return result
+            # re-lexing a long token from its start is amortized by reading at least
+            # as much as has been buffered for it
+            self.feed(self._fp.read(max(self._chunk_size, len(self) - idx)))
+
+    def scan_buffered(self, idx: int) -> tuple[bool, TokenResult | None]:
+        """Lex the next token at absolute position `idx` without reading the stream.
+
+        Returns:
+            A tuple of whether the token is complete and the token. The token is
+                incomplete if it may continue past the end of the window, in which case
+                more of the stream must be passed to `feed` before lexing it again.
+        """
+        self._drop(idx)
+        rel_idx = idx - self._base
+        try:
+            result = next_token(self._text, rel_idx)
+        except JSON5DecodeError as e:
+            if not self._eof and self._reaches_end(rel_idx):
+                return False, None
+            err = JSON5DecodeError(e.msg, self, e.pos + self._base)
+            # locate the error while the window still holds its line
+            _ = err.lineno, err.colno
+            raise err from None
+        if not self._eof and (result is None or result.idx == len(self._text)):
+            return False, None
+        base = self._base
+        if result is None or not base:
+            return True, result
+        token = result.token
+        tk_start, tk_end = token.value
+        return True, TokenResult(
+            Token(token.tk_type, (tk_start + base, tk_end + base)), result.idx + base
+        )
+
+    def _reaches_end(self, rel_idx: int) -> bool:
+        """Whether the token that failed to lex after `rel_idx` runs to the end of the
+        window, i.e. whether reading more of the stream may complete it."""
+        text = self._text
+        while True:
+            match = WHITESPACE_PATTERN.match(text, rel_idx)
+            assert match is not None
+            rel_idx = match.end()
+            if not text.startswith("/", rel_idx):
+                break
+            try:
+                rel_idx = validate_comment(text, rel_idx)
+            except JSON5DecodeError:
+                # only unterminated comments are invalid
+                return True
+        pattern = STRING_EXTENT_PATTERNS.get(text[rel_idx : rel_idx + 1])
+        match = (pattern or TOKEN_EXTENT_PATTERN).match(text, rel_idx)
+        assert match is not None
+        return match.end() == len(text)
+
+    def feed(self, data: str | bytes) -> None:
+        """Append the next chunk of the stream to the window. An empty chunk marks the
+        end of the stream."""
+        self._eof = not data
+        if not isinstance(data, str):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder(self._encoding)()
+            data = self._decoder.decode(data, final=self._eof)
+        self._text += data
+
+    def _drop(self, idx: int) -> None:
+        """Drop the text before absolute position `idx` once it is worth a copy."""
+        rel_idx = idx - self._base
+        if rel_idx < self._chunk_size:
+            return
+        dropped = self._text[:rel_idx]
+        newlines = dropped.count("\n")
+        if newlines:
+            self._dropped_newlines += newlines
+            self._last_newline = self._base + dropped.rfind("\n")
+        self._text = self._text[rel_idx:]
+        self._base = idx
+
+    def __len__(self) -> int:
+        return self._base + len(self._text)
+
+    def __getitem__(self, key: slice) -> str:
+        start = 0 if key.start is None else max(key.start - self._base, 0)
+        stop = len(self._text) if key.stop is None else max(key.stop - self._base, 0)
+        return self._text[start:stop]
+
+    def count(self, sub: str, start: int, end: int) -> int:
+        r"""Count occurrences of `sub` ("\n") before `end`. `start` must be 0."""
+        assert start == 0
+        return self._dropped_newlines + self._text.count(sub, 0, end - self._base)
+
+    def rfind(self, sub: str, start: int, end: int) -> int:
+        r"""Find the last `sub` ("\n") before `end`. `start` must be 0."""
+        assert start == 0
+        found = self._text.rfind(sub, 0, end - self._base)
+        return self._last_newline if found == -1 else found + self._base
+
+    def find(self, sub: str, start: int) -> int:
+        """Find the first `sub` after `start` in the window."""
+        found = self._text.find(sub, max(start - self._base, 0))
+        return -1 if found == -1 else found + self._base
+
+
+class Json5StreamDecoder(Json5Decoder):
+    r"""JSON5 decoder reading a file-like object incrementally.
+
+    The stream is read `chunk_size` at a time and only the part of the document that
+    has not been consumed yet is kept in memory, so memory usage is bounded by the
+    decoded object rather than by the size of the input. Tokens (strings, comments,
+    numbers, ...) split across chunks are handled transparently, and the result is
+    the same as [`loads`][ujson5.loads] on the whole document.
+
+    Example:
+    ```python
+    import gzip
+    import ujson5
+    with gzip.open('export.json5.gz', 'rb') as f:
+        obj = ujson5.Json5StreamDecoder().decode_stream(f)
+    ```
+
+    Args:
+        chunk_size: Number of characters (or bytes for binary streams) read at a time.
+        parse_float: See [`Json5Decoder`][ujson5.Json5Decoder].
+        parse_int: See [`Json5Decoder`][ujson5.Json5Decoder].
+        parse_constant: See [`Json5Decoder`][ujson5.Json5Decoder].
+        strict: See [`Json5Decoder`][ujson5.Json5Decoder].
+        allow_reserved_words: See [`Json5Decoder`][ujson5.Json5Decoder].
+        object_hook: See [`Json5Decoder`][ujson5.Json5Decoder].
+        object_pairs_hook: See [`Json5Decoder`][ujson5.Json5Decoder].
+
+    Raises:
+        JSON5DecodeError: If the JSON5 document is invalid.
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        parse_float: Callable[[str], Any] | None = None,
+        parse_int: Callable[[str], Any] | None = None,
+        parse_constant: Callable[[str], Any] | None = None,
+        strict: bool = True,
+        allow_reserved_words: bool = True,
+        object_hook: ObjectHook | None = None,
+        object_pairs_hook: ObjectPairsHook | None = None,
+    ) -> None:
+        super().__init__(
+            parse_float=parse_float,
+            parse_int=parse_int,
+            parse_constant=parse_constant,
+            strict=strict,
+            allow_reserved_words=allow_reserved_words,
+            object_hook=object_hook,
+            object_pairs_hook=object_pairs_hook,
         )
+        self._chunk_size: int = chunk_size
+
+    def decode_stream(self, input_file: IO[str] | IO[bytes]) -> Any:
+        """Deserialize a JSON5 document read from a text or binary file-like object.
+
+        Binary streams must be UTF-8 encoded (a BOM is allowed).
+
+        Args:
+            input_file: A `.read()`-supporting file-like object.
+
+        Returns:
+            The Python object represented by the JSON5 document.
+
+        Raises:
+            JSON5DecodeError: If the JSON5 document is invalid. Error positions are
+                character offsets in the stream.
+        """
+        window = _StreamWindow(input_file, self._chunk_size)
+        obj, end_idx = self._parse_json5(window, 0, _StreamWindow.scan)
+        trailing = window.scan(end_idx)
+        if trailing is not None:
+            raise JSON5DecodeError(
+                DecoderErr.multiple_root(), window, trailing.token.value[0]
+            )
+        return obj
 
 
 def loads(
-    json5_str: str,
+    json5_str: str | BytesLike,
     *,
     cls: type[Json5Decoder] | None = None,
     parse_float: Callable[[str], Any] | None = None,
@@ -514,8 +1425,9 @@ def loads(
     allow_reserved_words: bool = True,
     object_hook: ObjectHook | None = None,
     object_pairs_hook: ObjectPairsHook | None = None,
+    workers: int | None = None,
 ) -> Any:
-    r"""Deserialize `json5_str` (a `str`, `bytes` or `bytearray` instance
+    r"""Deserialize `json5_str` (a `str`, `bytes`, `bytearray` or `memoryview` instance
     containing a JSON document) to a Python object.
 
     Example:
@@ -529,7 +1441,8 @@ def loads(
     All arguments except `json5_str` are keyword-only.
 
     Args:
-        json5_str: The JSON5 string to be deserialized.
+        json5_str: The JSON5 string to be deserialized. Binary input may be UTF-8, UTF-16
+            or UTF-32 encoded; UTF-8 input is parsed without decoding the whole document.
         cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass. The `cls`
             will be used to instantiate the decoder. If `cls` is not specified, the default
             `Json5Decoder` will be used.
@@ -557,6 +1470,10 @@ def loads(
             will be used instead of the `dict`. This feature can be used to implement
             custom decoders. If `object_hook` is also defined, the `object_pairs_hook`
             takes priority.
+        workers: if specified and the root of the document is a large array, runs of its
+            elements are decoded in this many worker processes. See
+            [`decode_parallel`][ujson5.Json5Decoder.decode_parallel]. Hooks and parse
+            functions must then be picklable.
     """
     if cls is not None:
         decoder: Json5Decoder = cls(
@@ -578,6 +1495,8 @@ def loads(
             allow_reserved_words=allow_reserved_words,
             object_pairs_hook=object_pairs_hook,
         )
+    if workers is not None and workers != 1:
+        return decoder.decode_parallel(json5_str, workers)
     return decoder.decode(json5_str)
 
 
@@ -646,3 +1565,417 @@ def load(
         allow_reserved_words=allow_reserved_words,
         object_pairs_hook=object_pairs_hook,
     )
+
+
+def load_path(
+    path: str | os.PathLike[str],
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+    object_hook: ObjectHook | None = None,
+    object_pairs_hook: ObjectPairsHook | None = None,
+) -> Any:
+    r"""Deserialize the JSON5 file at `path` to a Python object.
+
+    The file is memory-mapped and UTF-8 documents are parsed directly from the mapped
+    bytes, so the file is paged in by the OS instead of being read into a string. This
+    keeps peak memory low when loading large files.
+
+    Example:
+    ```python
+    import ujson5
+    obj = ujson5.load_path('file.json5')
+    ```
+
+    All arguments except `path` are keyword-only and have the same meaning as in
+    [`loads`][ujson5.loads].
+
+    Args:
+        path: Path to a UTF-8, UTF-16 or UTF-32 encoded JSON5 file.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+        object_hook: Called with the result of any object literal decode.
+        object_pairs_hook: Called with the ordered list of pairs of any object literal
+            decode. Takes priority over `object_hook`.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:  # empty files cannot be mapped
+            buffer: BytesLike = b""
+        else:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return loads(
+                buffer,
+                cls=cls,
+                object_hook=object_hook,
+                parse_float=parse_float,
+                parse_int=parse_int,
+                parse_constant=parse_constant,
+                strict=strict,
+                allow_reserved_words=allow_reserved_words,
+                object_pairs_hook=object_pairs_hook,
+            )
+        except JSON5DecodeError as e:
+            # the error must not reference the mapping once it is closed
+            if isinstance(e.doc, _Utf8Text):
+                e.doc = str(e.doc)
+            raise
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+
+async def aload(
+    reader: "StreamReader",
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+    object_hook: ObjectHook | None = None,
+    object_pairs_hook: ObjectPairsHook | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Any:
+    r"""Deserialize a JSON5 document read from an `asyncio.StreamReader` (or any object
+    with an asynchronous `.read(n)` method) to a Python object.
+
+    The stream is parsed as it is read, and control returns to the event loop between
+    chunks, so a large document does not block other tasks. See
+    [`decode_async`][ujson5.Json5Decoder.decode_async].
+
+    Example:
+    ```python
+    import asyncio
+    import ujson5
+
+    async def main():
+        reader, writer = await asyncio.open_connection("localhost", 8000)
+        obj = await ujson5.aload(reader)
+    ```
+
+    All arguments except `reader` are keyword-only and have the same meaning as in
+    [`loads`][ujson5.loads].
+
+    Args:
+        reader: The stream, holding UTF-8 encoded `bytes` or `str`.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+        object_hook: Called with the result of any object literal decode.
+        object_pairs_hook: Called with the ordered list of pairs of any object literal
+            decode. Takes priority over `object_hook`.
+        chunk_size: Number of bytes read at a time.
+    """
+    decoder = (cls or Json5Decoder)(
+        object_hook=object_hook,
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        allow_reserved_words=allow_reserved_words,
+        object_pairs_hook=object_pairs_hook,
+    )
+    return await decoder.decode_async(reader, chunk_size)
+
+
+def iterparse(
+    source: str | BytesLike | IO[str] | IO[bytes],
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Json5Event]:
+    r"""Parse a JSON5 document lazily and yield [`Json5Event`][ujson5.Json5Event]s
+    instead of building Python objects.
+
+    Example:
+    ```python
+    import ujson5
+    for event in ujson5.iterparse('{"key": [1, 2]}'):
+        print(event.event, event.value)
+    # start_map None
+    # map_key key
+    # start_array None
+    # value 1
+    # value 2
+    # end_array None
+    # end_map None
+    ```
+
+    All arguments except `source` are keyword-only and have the same meaning as in
+    [`loads`][ujson5.loads].
+
+    Args:
+        source: The JSON5 document. A `str`, a UTF-8/16/32 encoded buffer or a text or
+            binary (UTF-8) file-like object. Buffers and file-like objects are read
+            `chunk_size` at a time.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+        chunk_size: Number of characters (or bytes) read at a time.
+
+    Yields:
+        Json5Event: The events of the document in order.
+
+    Raises:
+        JSON5DecodeError: If the JSON5 document is invalid.
+    """
+    decoder = (cls or Json5Decoder)(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        allow_reserved_words=allow_reserved_words,
+    )
+    return decoder.iterparse(source, chunk_size)
+
+
+def extract(
+    json5_str: str | BytesLike,
+    paths: Iterable[str],
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+) -> dict[str, Any]:
+    r"""Decode only the values at the given paths of a JSON5 document. This is much
+    cheaper than [`loads`][ujson5.loads] when only a few values of a large document are
+    needed: unselected objects and arrays are skipped without being decoded.
+
+    Example:
+    ```python
+    import ujson5
+    json5_str = '{server: {port: 8080, host: "x"}, features: {a: {enabled: true}}}'
+    ujson5.extract(json5_str, ["server/port", "features/*/enabled"])
+    # {'server/port': 8080, 'features/a/enabled': True}
+    ```
+
+    All arguments except `json5_str` and `paths` are keyword-only and have the same
+    meaning as in [`loads`][ujson5.loads].
+
+    Args:
+        json5_str: The JSON5 document.
+        paths: Paths of the values to decode. Segments are separated by `/` and are
+            either object keys, array indices or `*` to select every member of an
+            object or array.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+
+    Returns:
+        A dictionary mapping the concrete path of every value found to the value.
+    """
+    decoder = (cls or Json5Decoder)(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        allow_reserved_words=allow_reserved_words,
+    )
+    return decoder.extract(json5_str, paths)
+
+
+def iter_items(
+    source: str | BytesLike | IO[str] | IO[bytes],
+    path: str = "",
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+    object_hook: ObjectHook | None = None,
+    object_pairs_hook: ObjectPairsHook | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    r"""Decode the elements of a (possibly nested) array one by one, as soon as each
+    of them is fully parsed.
+
+    Example:
+    ```python
+    import ujson5
+    with open('export.json5', 'rb') as f:
+        for record in ujson5.iter_items(f, "records"):
+            print(record)
+    ```
+
+    All arguments except `source` and `path` are keyword-only and have the same
+    meaning as in [`loads`][ujson5.loads]. Hooks are called on every element.
+
+    Args:
+        source: The JSON5 document. A `str`, a UTF-8/16/32 encoded buffer or a text or
+            binary (UTF-8) file-like object. Buffers and file-like objects are read
+            `chunk_size` at a time.
+        path: Path of the array. Segments are separated by `/` and are either object
+            keys or array indices. The default selects the root value. If a key is
+            duplicated, the first occurrence is used, whereas [`loads`][ujson5.loads]
+            keeps the last one.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+        object_hook: Called with every element that is an object.
+        object_pairs_hook: Called with the ordered list of pairs of every element that
+            is an object. Takes priority over `object_hook`.
+        chunk_size: Number of characters (or bytes) read at a time.
+
+    Yields:
+        Any: The elements of the array.
+
+    Raises:
+        JSON5DecodeError: If the document is invalid, the path does not exist or the
+            value at the path is not an array.
+    """
+    decoder = (cls or Json5Decoder)(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        allow_reserved_words=allow_reserved_words,
+        object_hook=object_hook,
+        object_pairs_hook=object_pairs_hook,
+    )
+    return decoder.iter_items(source, path, chunk_size)
+
+
+def iter_loads(
+    json5_str: str | BytesLike,
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+    object_hook: ObjectHook | None = None,
+    object_pairs_hook: ObjectPairsHook | None = None,
+) -> Iterator[Any]:
+    r"""Deserialize successive JSON5 values from `json5_str`, separated by whitespace
+    or comments (e.g. JSON5 Lines).
+
+    Example:
+    ```python
+    import ujson5
+    list(ujson5.iter_loads('{id: 1}\n{id: 2}\n'))
+    # [{'id': 1}, {'id': 2}]
+    ```
+
+    All arguments except `json5_str` are keyword-only and have the same meaning as in
+    [`loads`][ujson5.loads]. Hooks are called on every value.
+
+    Args:
+        json5_str: The JSON5 values. A `str` or a UTF-8/16/32 encoded buffer.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+        object_hook: Called with every value that is an object.
+        object_pairs_hook: Called with the ordered list of pairs of every value that is
+            an object. Takes priority over `object_hook`.
+
+    Yields:
+        Any: The decoded values.
+
+    Raises:
+        JSON5DecodeError: If a value is invalid.
+    """
+    decoder = (cls or Json5Decoder)(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        allow_reserved_words=allow_reserved_words,
+        object_hook=object_hook,
+        object_pairs_hook=object_pairs_hook,
+    )
+    return decoder.iter_decode(json5_str)
+
+
+def load_many(
+    input_file: IO[str] | IO[bytes],
+    *,
+    cls: type[Json5Decoder] | None = None,
+    parse_float: Callable[[str], Any] | None = None,
+    parse_int: Callable[[str], Any] | None = None,
+    parse_constant: Callable[[str], Any] | None = None,
+    strict: bool = True,
+    allow_reserved_words: bool = True,
+    object_hook: ObjectHook | None = None,
+    object_pairs_hook: ObjectPairsHook | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    r"""Lazily deserialize successive JSON5 values read from a file-like object, such
+    as a JSON5 Lines file written by [`dump_many`][ujson5.dump_many].
+
+    Example:
+    ```python
+    import ujson5
+    with open('records.json5l', 'r') as f:
+        for record in ujson5.load_many(f):
+            print(record)
+    ```
+
+    All arguments except `input_file` are keyword-only and have the same meaning as in
+    [`loads`][ujson5.loads]. Hooks are called on every value.
+
+    Args:
+        input_file: A text or binary (UTF-8) file-like object. It is read `chunk_size`
+            at a time and only the value being decoded is kept in memory.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        parse_float: Called with the string of every JSON float to be decoded.
+        parse_int: Called with the string of every JSON int to be decoded.
+        parse_constant: Called with one of `-Infinity`, `Infinity` or `NaN`.
+        strict: Control characters will be allowed inside strings if `False`.
+        allow_reserved_words: If `True`, reserved words can be used as identifiers.
+        object_hook: Called with every value that is an object.
+        object_pairs_hook: Called with the ordered list of pairs of every value that is
+            an object. Takes priority over `object_hook`.
+        chunk_size: Number of characters (or bytes) read at a time.
+
+    Yields:
+        Any: The decoded values.
+
+    Raises:
+        JSON5DecodeError: If a value is invalid.
+    """
+    decoder = (cls or Json5Decoder)(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+        strict=strict,
+        allow_reserved_words=allow_reserved_words,
+        object_hook=object_hook,
+        object_pairs_hook=object_pairs_hook,
+    )
+    return decoder.iter_decode(input_file, chunk_size)
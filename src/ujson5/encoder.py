@@ -1,20 +1,36 @@
 """Implements the JSON5Encoder class and the dumps and dump functions."""
 
 import inspect
+import io
+import itertools
 import re
 import sys
 import tokenize
-from collections.abc import Callable, Iterable
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from io import StringIO
-from typing import Any, Literal, TextIO, TypedDict, is_typeddict
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NamedTuple,
+    TypedDict,
+    is_typeddict,
+)
 from warnings import warn
 
 from ujson5.core import JSON5EncodeError
 from ujson5.err_msg import EncoderErrors
 
+if TYPE_CHECKING:
+    from asyncio import StreamWriter
+
 Serializable = dict | list | tuple | int | float | str | None | bool
 """Python objects that can be serialized to JSON5"""
 
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
 DefaultInterface = (
     Callable[[Any], dict]
     | Callable[[Any], list]
@@ -43,6 +59,7 @@ ESCAPE_DCT = {
 }
 for i in range(0x20):
     ESCAPE_DCT.setdefault(chr(i), f"\\u{i:04x}")
+INFINITY: float = float("inf")
 
 COMMENTS_PATTERN = re.compile(
     r"(?P<block_comment>(?: *# *.+? *\n)*)"
@@ -60,6 +77,24 @@ class EntryComments(TypedDict):
 CommentsCache = dict[str, EntryComments]
 
 
+class CommentNode(NamedTuple):
+    """Comments of a dict entry, rendered ahead of encoding"""
+
+    block_comments: tuple[str, ...]
+    """Block comments, each prefixed with `// `"""
+    inline_comment: str
+    """Inline comment prefixed with `  // `, or an empty string"""
+    children: "CommentTree"
+    """Comments of the entries nested in the value of the entry"""
+
+
+CommentTree = dict[str, CommentNode]
+"""Comments of the entries of a dict, by key. Mirrors the tree of a TypedDict."""
+
+Markers = dict[int, Any]
+"""Ids of the containers being encoded, used to detect circular references."""
+
+
 def extend_key_path(base_path: str, key: str) -> str:
     """Generate a unique name for each key in a composite dictionary by concatenating the
     base path and the key
@@ -173,10 +208,464 @@ def get_comments(typed_dict_cls: Any) -> CommentsCache:
     return _get_comments(typed_dict_cls, key_path="", comments={})
 
 
+def build_comment_tree(comments: CommentsCache) -> CommentTree:
+    """Nest the comments returned by `get_comments` by key, so that the encoder resolves
+    the comments of an entry with a single lookup in the tree of its parent dict.
+
+    Args:
+        comments: Comments of each TypedDict entry, by key path
+
+    Returns:
+        CommentTree: Comments of the top level entries
+    """
+    tree: CommentTree = {}
+    for key_path, entry_comments in comments.items():
+        *parent_keys, key = key_path.split("/")[1:]
+        level: CommentTree = tree
+        for parent_key in parent_keys:
+            parent = level.get(parent_key)
+            if parent is None:
+                parent = level[parent_key] = CommentNode((), "", {})
+            level = parent.children
+        node = level.get(key)
+        inline_comment = entry_comments["inline_comment"]
+        level[key] = CommentNode(
+            tuple(f"// {comment}" for comment in entry_comments["block_comments"]),
+            f"  // {inline_comment}" if inline_comment else "",
+            {} if node is None else node.children,
+        )
+    return tree
+
+
+# weakly keyed, so the entry of a class is dropped with it and a redefined class (a new
+# class object) is extracted again
+_comment_trees: weakref.WeakKeyDictionary[type, CommentTree] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def cached_comment_tree(typed_dict_cls: type) -> CommentTree:
+    """Return the comment tree of a TypedDict class, extracting the comments with
+    `get_comments` the first time the class is used.
+
+    Extracting comments reads and tokenizes the source of the class, so the result is
+    cached per class and shared by all encoders. It must not be modified.
+
+    Args:
+        typed_dict_cls: The TypedDict class
+
+    Returns:
+        CommentTree: Comments of the top level entries of the TypedDict
+    """
+    try:
+        return _comment_trees[typed_dict_cls]
+    except KeyError:
+        # concurrent first uses may both extract the comments, which is harmless
+        tree = build_comment_tree(get_comments(typed_dict_cls))
+        _comment_trees[typed_dict_cls] = tree
+        return tree
+
+
 KeyQuotation = Literal["single", "double", "none"]
 """The quotation style to be used for keys in a json5 object."""
 
 
+def _replace_escape(match: re.Match) -> str:
+    """Escape a character matched by `ESCAPE`."""
+    return ESCAPE_DCT[match.group(0)]
+
+
+def _replace_escape_ascii(match: re.Match) -> str:
+    """Escape a character matched by `ESCAPE_ASCII`."""
+    matched_str = match.group(0)
+    try:
+        return ESCAPE_DCT[matched_str]
+    except KeyError:
+        key: int = ord(matched_str)
+        if key < 0x10000:
+            return f"\\u{key:04x}"
+        # surrogate pair
+        key -= 0x10000
+        s1 = 0xD800 | ((key >> 10) & 0x3FF)
+        s2 = 0xDC00 | (key & 0x3FF)
+        return f"\\u{s1:04x}\\u{s2:04x}"
+
+
+EncodeFunction = Callable[
+    [Any, list[str], int, Markers | None, CommentTree | None], None
+]
+"""Appends the chunks of an object to a list."""
+IterencodeFunction = Callable[
+    [Any, int, Markers | None, CommentTree | None], Iterator[str]
+]
+"""Yields the chunks of an object."""
+
+
+def _make_encoders(  # pylint: disable=R0913,R0914,R0915
+    default: Callable[[Any], Any],
+    *,
+    skip_keys: bool,
+    ensure_ascii: bool,
+    allow_nan: bool,
+    indent_str: str | None,
+    item_separator: str,
+    key_separator: str,
+    sort_keys: bool,
+    key_quotation: str,
+    trailing_comma: bool,
+) -> tuple[Callable[[str], str], EncodeFunction, IterencodeFunction]:
+    """Build the functions encoding objects with one configuration of the encoder.
+
+    The options are bound as locals of closures, so they are not looked up on the
+    encoder for every value. The state of a single call (circular reference markers
+    and comments) is passed as arguments, so the functions can be shared by threads.
+
+    Returns:
+        A tuple of the function encoding a string, the function appending the chunks
+            of an object to a list, and the generator yielding them.
+    """
+    escape = ESCAPE_ASCII.sub if ensure_ascii else ESCAPE.sub
+    replace = _replace_escape_ascii if ensure_ascii else _replace_escape
+    if key_quotation == "none":
+        key_quote = ""
+    elif key_quotation == "single":
+        key_quote = "'"
+    else:
+        assert key_quotation == "double", key_quotation
+        key_quote = '"'
+    end_comma: str = item_separator if trailing_comma else ""
+    int_repr = int.__repr__
+    float_repr = float.__repr__
+
+    def encode_str(obj: str) -> str:
+        return '"' + escape(replace, obj) + '"'
+
+    def encode_float(obj: float) -> str:
+        if obj != obj:  # pylint: disable=R0124
+            text = "NaN"
+        elif obj == INFINITY:
+            text = "Infinity"
+        elif obj == -INFINITY:
+            text = "-Infinity"
+        else:
+            return float_repr(obj)
+        if not allow_nan:
+            raise JSON5EncodeError(EncoderErrors.float_out_of_range(obj))
+        return text
+
+    def encode_key(key: Any) -> str | None:
+        """Encode a dict key, or return None if it is skipped."""
+        if isinstance(key, str):
+            pass
+        # JavaScript is weakly typed for these, so it makes sense to
+        # also allow them.  Many encoders seem to do something like this.
+        elif isinstance(key, float):
+            key = encode_float(key)
+        elif key is True:
+            key = "true"
+        elif key is False:
+            key = "false"
+        elif key is None:
+            key = "null"
+        elif isinstance(key, int):
+            key = int_repr(key)
+        elif skip_keys:
+            return None
+        else:
+            raise JSON5EncodeError(EncoderErrors.invalid_key_type(key))
+        return key
+
+    def encode_value(
+        obj: Any,
+        chunks: list[str],
+        indent_level: int,
+        markers: Markers | None,
+        comments: CommentTree | None,
+    ) -> None:
+        if isinstance(obj, str):
+            chunks.append(encode_str(obj))
+        elif obj is None:
+            chunks.append("null")
+        elif obj is True:
+            chunks.append("true")
+        elif obj is False:
+            chunks.append("false")
+        elif isinstance(obj, int):
+            # subclasses of int/float may override __repr__, but we still
+            # want to encode them as integers/floats in JSON. One example
+            # within the standard library is IntEnum.
+            chunks.append(int_repr(obj))
+        elif isinstance(obj, float):
+            chunks.append(encode_float(obj))
+        elif isinstance(obj, (list, tuple)):
+            encode_list(obj, chunks, indent_level, markers, comments)
+        elif isinstance(obj, dict):
+            encode_dict(obj, chunks, indent_level, markers, comments)
+        else:
+            marker_id = id(obj)
+            if markers is not None:
+                if marker_id in markers:
+                    raise JSON5EncodeError(EncoderErrors.circular_reference())
+                markers[marker_id] = obj
+            encode_value(default(obj), chunks, indent_level, markers, comments)
+            if markers is not None:
+                del markers[marker_id]
+
+    def encode_list(
+        obj: list | tuple,
+        chunks: list[str],
+        indent_level: int,
+        markers: Markers | None,
+        comments: CommentTree | None,
+    ) -> None:
+        if not obj:
+            chunks.append("[]")
+            return
+        marker_id = id(obj)
+        if markers is not None:
+            if marker_id in markers:
+                raise JSON5EncodeError(EncoderErrors.circular_reference())
+            markers[marker_id] = obj
+        append = chunks.append
+        if indent_str is not None:
+            indent_level += 1
+            newline_indent = "\n" + indent_str * indent_level
+            separator = item_separator + newline_indent
+            append("[" + newline_indent)
+        else:
+            separator = item_separator
+            append("[")
+        first: bool = True
+        for value in obj:
+            if first:
+                first = False
+            else:
+                append(separator)
+            if isinstance(value, str):
+                append(encode_str(value))
+            elif value.__class__ is float:
+                append(encode_float(value))
+            elif value.__class__ is int:
+                append(int_repr(value))
+            elif isinstance(value, (list, tuple)):
+                encode_list(value, chunks, indent_level, markers, comments)
+            elif isinstance(value, dict):
+                encode_dict(value, chunks, indent_level, markers, comments)
+            else:
+                encode_value(value, chunks, indent_level, markers, comments)
+        if indent_str is not None:
+            append(end_comma + "\n" + indent_str * (indent_level - 1) + "]")
+        else:
+            append(end_comma + "]")
+        if markers is not None:
+            del markers[marker_id]
+
+    def encode_dict(
+        obj: dict[Any, Any],
+        chunks: list[str],
+        indent_level: int,
+        markers: Markers | None,
+        comments: CommentTree | None,
+    ) -> None:
+        if not obj:
+            chunks.append("{}")
+            return
+        marker_id = id(obj)
+        if markers is not None:
+            if marker_id in markers:
+                raise JSON5EncodeError(EncoderErrors.circular_reference())
+            markers[marker_id] = obj
+        append = chunks.append
+        if indent_str is not None:
+            indent_level += 1
+            newline_indent = "\n" + indent_str * indent_level
+            append("{" + newline_indent)
+        else:
+            newline_indent = ""
+            append("{")
+        first = True
+        items: Any = sorted(obj.items()) if sort_keys else obj.items()
+        last_idx: int = len(items) - 1
+        for idx, (key, value) in enumerate(items):
+            if not isinstance(key, str):
+                key = encode_key(key)
+                if key is None:
+                    continue
+            if first:
+                first = False
+            elif newline_indent:
+                append(newline_indent)
+            node = comments.get(key) if comments else None
+            if node is None:
+                child_comments = None
+            else:
+                child_comments = node.children
+                for block_comment in node.block_comments:
+                    append(block_comment + newline_indent)
+            append(key_quote + escape(replace, key) + key_quote)
+            append(key_separator)
+            if isinstance(value, str):
+                append(encode_str(value))
+            elif value.__class__ is int:
+                append(int_repr(value))
+            elif value.__class__ is float:
+                append(encode_float(value))
+            elif isinstance(value, (list, tuple)):
+                encode_list(value, chunks, indent_level, markers, child_comments)
+            elif isinstance(value, dict):
+                encode_dict(value, chunks, indent_level, markers, child_comments)
+            else:
+                encode_value(value, chunks, indent_level, markers, child_comments)
+            if idx != last_idx or trailing_comma:
+                append(item_separator)
+            if node is not None and node.inline_comment:
+                append(node.inline_comment)
+        if indent_str is not None:
+            append("\n" + indent_str * (indent_level - 1))
+        append("}")
+        if markers is not None:
+            del markers[marker_id]
+
+    def iterencode(
+        obj: Any,
+        indent_level: int,
+        markers: Markers | None,
+        comments: CommentTree | None,
+    ) -> Iterator[str]:
+        if isinstance(obj, str):
+            yield encode_str(obj)
+        elif obj is None:
+            yield "null"
+        elif obj is True:
+            yield "true"
+        elif obj is False:
+            yield "false"
+        elif isinstance(obj, int):
+            yield int_repr(obj)
+        elif isinstance(obj, float):
+            yield encode_float(obj)
+        elif isinstance(obj, (list, tuple)):
+            yield from iterencode_list(obj, indent_level, markers, comments)
+        elif isinstance(obj, dict):
+            yield from iterencode_dict(obj, indent_level, markers, comments)
+        else:
+            marker_id = id(obj)
+            if markers is not None:
+                if marker_id in markers:
+                    raise JSON5EncodeError(EncoderErrors.circular_reference())
+                markers[marker_id] = obj
+            yield from iterencode(default(obj), indent_level, markers, comments)
+            if markers is not None:
+                del markers[marker_id]
+
+    def iterencode_list(
+        obj: list | tuple,
+        indent_level: int,
+        markers: Markers | None,
+        comments: CommentTree | None,
+    ) -> Iterator[str]:
+        if not obj:
+            yield "[]"
+            return
+        marker_id = id(obj)
+        if markers is not None:
+            if marker_id in markers:
+                raise JSON5EncodeError(EncoderErrors.circular_reference())
+            markers[marker_id] = obj
+        buffer = "["
+        if indent_str is not None:
+            indent_level += 1
+            newline_indent = "\n" + indent_str * indent_level
+            separator = item_separator + newline_indent
+            buffer += newline_indent
+        else:
+            separator = item_separator
+        first: bool = True
+        for value in obj:
+            if first:
+                first = False
+            else:
+                buffer = separator
+            if isinstance(value, str):
+                yield buffer + encode_str(value)
+                continue
+            yield buffer
+            if isinstance(value, (list, tuple)):
+                chunks = iterencode_list(value, indent_level, markers, comments)
+            elif isinstance(value, dict):
+                chunks = iterencode_dict(value, indent_level, markers, comments)
+            else:
+                chunks = iterencode(value, indent_level, markers, comments)
+            yield from chunks
+        if indent_str is not None:
+            yield end_comma + "\n" + indent_str * (indent_level - 1) + "]"
+        else:
+            yield end_comma + "]"
+        if markers is not None:
+            del markers[marker_id]
+
+    def iterencode_dict(
+        obj: dict[Any, Any],
+        indent_level: int,
+        markers: Markers | None,
+        comments: CommentTree | None,
+    ) -> Iterator[str]:
+        if not obj:
+            yield "{}"
+            return
+        marker_id = id(obj)
+        if markers is not None:
+            if marker_id in markers:
+                raise JSON5EncodeError(EncoderErrors.circular_reference())
+            markers[marker_id] = obj
+        if indent_str is not None:
+            indent_level += 1
+            newline_indent = "\n" + indent_str * indent_level
+            yield "{" + newline_indent
+        else:
+            newline_indent = ""
+            yield "{"
+        first = True
+        items: Any = sorted(obj.items()) if sort_keys else obj.items()
+        last_idx: int = len(items) - 1
+        for idx, (key, value) in enumerate(items):
+            if not isinstance(key, str):
+                key = encode_key(key)
+                if key is None:
+                    continue
+            if first:
+                first = False
+            elif newline_indent:
+                yield newline_indent
+            node = comments.get(key) if comments else None
+            if node is None:
+                child_comments = None
+            else:
+                child_comments = node.children
+                for block_comment in node.block_comments:
+                    yield block_comment + newline_indent
+            yield key_quote + escape(replace, key) + key_quote + key_separator
+            if isinstance(value, str):
+                yield encode_str(value)
+            elif isinstance(value, (list, tuple)):
+                yield from iterencode_list(value, indent_level, markers, child_comments)
+            elif isinstance(value, dict):
+                yield from iterencode_dict(value, indent_level, markers, child_comments)
+            else:
+                yield from iterencode(value, indent_level, markers, child_comments)
+            if idx != last_idx or trailing_comma:
+                yield item_separator
+            if node is not None and node.inline_comment:
+                yield node.inline_comment
+        if indent_str is not None:
+            yield "\n" + indent_str * (indent_level - 1)
+        yield "}"
+        if markers is not None:
+            del markers[marker_id]
+
+    return encode_str, encode_value, iterencode
+
+
 class JSON5Encoder:
     """JSON5 encoder class. This encoder is used to serialize Python objects to JSON5
     strings. This class mirrors the standard library's JSONEncoder class, with the
@@ -295,13 +784,19 @@ class JSON5Encoder:
             self._item_separator, self._key_separator = separators
 
         self._default: DefaultInterface | None = default
-
-        if check_circular:
-            self._markers: dict[int, Any] | None = {}
-        else:
-            self._markers = None
-
-        self._comments_cache: CommentsCache = {}
+        self._check_circular: bool = check_circular
+        self._encode_str, self._encode_value, self._iterencode = _make_encoders(
+            self.default,
+            skip_keys=self._skip_keys,
+            ensure_ascii=self._ensure_ascii,
+            allow_nan=self._allow_nan,
+            indent_str=self._indent_str,
+            item_separator=self._item_separator,
+            key_separator=self._key_separator,
+            sort_keys=self._sort_keys,
+            key_quotation=self._key_quotation,
+            trailing_comma=self._trailing_comma,
+        )
 
     def encode(self, obj: Any, typed_dict_cls: Any | None = None) -> str:
         """Return a JSON5 string representation of a Python object.
@@ -318,22 +813,18 @@ class JSON5Encoder:
             JSON5EncodeError: If the TypedDict class is not a TypedDict subclass or if the
                 object cannot be serialized
         """
-        if typed_dict_cls is not None and not is_typeddict(typed_dict_cls):
-            raise JSON5EncodeError(EncoderErrors.invalid_typed_dict(typed_dict_cls))
+        markers, comments = self._call_state(typed_dict_cls)
         if isinstance(obj, str):
             return self._encode_str(obj)
         if isinstance(obj, bool):
             return "true" if obj else "false"
-        if isinstance(obj, int):
-            return self._encode_int(obj)
-        if isinstance(obj, float):
-            return self._encode_float(obj)
         if obj is None:
             return "null"
 
-        chunks = self.iterencode(obj, typed_dict_cls)
-        if not isinstance(chunks, (list, tuple)):
-            chunks = list(chunks)
+        # no output is streamed, so the chunks are appended to a single list rather
+        # than yielded through a generator per container
+        chunks: list[str] = []
+        self._encode_value(obj, chunks, 0, markers, comments)
         return "".join(chunks)
 
     def iterencode(self, obj: Any, typed_dict_cls: Any | None = None) -> Iterable[str]:
@@ -352,11 +843,27 @@ class JSON5Encoder:
             JSON5EncodeError: If the TypedDict class is not a TypedDict subclass or if the
                 object cannot be serialized
         """
-        if is_typeddict(typed_dict_cls) and self._indent_str is not None:
-            self._comments_cache = get_comments(typed_dict_cls)
+        return self._iterencode(obj, 0, *self._call_state(typed_dict_cls))
+
+    def _call_state(
+        self, typed_dict_cls: Any | None
+    ) -> tuple[Markers | None, CommentTree | None]:
+        """Create the circular reference markers and comments of a single call.
+
+        The state is passed down the encoding functions rather than stored on the
+        instance, so that an encoder can be shared between threads.
+        """
         if typed_dict_cls is not None and not is_typeddict(typed_dict_cls):
             raise JSON5EncodeError(EncoderErrors.invalid_typed_dict(typed_dict_cls))
-        return self._iterencode(obj, indent_level=0, key_path="")
+        markers: Markers | None = {} if self._check_circular else None
+        # comments are only written on their own lines, and without any comments the
+        # encoding functions skip resolving them altogether
+        comments: CommentTree | None = (
+            cached_comment_tree(typed_dict_cls) or None
+            if typed_dict_cls is not None and self._indent_str is not None
+            else None
+        )
+        return markers, comments
 
     def default(self, obj: Any) -> Serializable:
         """Override this method in a subclass to implement custom serialization
@@ -377,213 +884,6 @@ class JSON5Encoder:
             return self._default(obj)
         raise JSON5EncodeError(EncoderErrors.unable_to_encode(obj))
 
-    def _encode_int(self, obj: int) -> str:
-        # Subclasses of int/float may override __repr__, but we still
-        # want to encode them as integers/floats in JSON. One example
-        # within the standard library is IntEnum.
-        return int.__repr__(obj)
-
-    def _encode_float(self, obj: float) -> str:
-        if obj != obj:  # pylint: disable=R0124
-            text = "NaN"
-        elif obj == float("inf"):
-            text = "Infinity"
-        elif obj == float("-inf"):
-            text = "-Infinity"
-        else:
-            return float.__repr__(obj)
-
-        if not self._allow_nan:
-            raise JSON5EncodeError(EncoderErrors.float_out_of_range(obj))
-
-        return text
-
-    def _encode_str(self, obj: str, key_str: bool = False) -> str:
-        def replace_unicode(match: re.Match) -> str:
-            return ESCAPE_DCT[match.group(0)]
-
-        def replace_ascii(match: re.Match) -> str:
-            matched_str = match.group(0)
-            try:
-                return ESCAPE_DCT[matched_str]
-            except KeyError:
-                key: int = ord(matched_str)
-                if key < 0x10000:
-                    return f"\\u{key:04x}"
-                # surrogate pair
-                key -= 0x10000
-                s1 = 0xD800 | ((key >> 10) & 0x3FF)
-                s2 = 0xDC00 | (key & 0x3FF)
-                return f"\\u{s1:04x}\\u{s2:04x}"
-
-        if self._ensure_ascii:
-            raw_str: str = ESCAPE_ASCII.sub(replace_ascii, obj)
-        else:
-            raw_str = ESCAPE.sub(replace_unicode, obj)
-        if not key_str:
-            return f'"{raw_str}"'
-        if self._key_quotation == "none":
-            return raw_str
-        if self._key_quotation == "single":
-            return f"'{raw_str}'"
-        assert self._key_quotation == "double", self._key_quotation
-        return f'"{raw_str}"'
-
-    def _iterencode(self, obj: Any, indent_level: int, key_path: str) -> Iterable[str]:
-        if isinstance(obj, str):
-            yield self._encode_str(obj)
-        elif obj is None:
-            yield "null"
-        elif obj is True:
-            yield "true"
-        elif obj is False:
-            yield "false"
-        elif isinstance(obj, int):
-            # see comment for int/float in _make_iterencode
-            yield self._encode_int(obj)
-        elif isinstance(obj, float):
-            # see comment for int/float in _make_iterencode
-            yield self._encode_float(obj)
-        elif isinstance(obj, (list, tuple)):
-            yield from self._iterencode_list(obj, indent_level, key_path)
-        elif isinstance(obj, dict):
-            yield from self._iterencode_dict(obj, indent_level, key_path)
-        else:
-            if self._markers is not None:
-                marker_id: int | None = id(obj)
-                if marker_id in self._markers:
-                    raise JSON5EncodeError(EncoderErrors.circular_reference())
-                assert marker_id is not None
-                self._markers[marker_id] = obj
-            else:
-                marker_id = None
-            obj_user = self.default(obj)
-            yield from self._iterencode(obj_user, indent_level, key_path)
-            if self._markers is not None and marker_id is not None:
-                del self._markers[marker_id]
-
-    def _iterencode_list(
-        self, obj: list | tuple, indent_level: int, key_path: str
-    ) -> Iterable[str]:
-        if not obj:
-            yield "[]"
-            return
-        if self._markers is not None:
-            marker_id: int | None = id(obj)
-            if marker_id in self._markers:
-                raise JSON5EncodeError(EncoderErrors.circular_reference())
-            assert marker_id is not None
-            self._markers[marker_id] = obj
-        else:
-            marker_id = None
-        buffer = "["
-        if self._indent_str is not None:
-            indent_level += 1
-            newline_indent: str | None = "\n" + self._indent_str * indent_level
-            assert newline_indent is not None
-            separator = self._item_separator + newline_indent
-            buffer += newline_indent
-        else:
-            newline_indent = None
-            separator = self._item_separator
-        first: bool = True
-        for value in obj:
-            if first:
-                first = False
-            else:
-                buffer = separator
-            yield buffer
-            if isinstance(value, (list, tuple)):
-                chunks = self._iterencode_list(value, indent_level, key_path)
-            elif isinstance(value, dict):
-                chunks = self._iterencode_dict(value, indent_level, key_path)
-            else:
-                chunks = self._iterencode(value, indent_level, key_path)
-            yield from chunks
-        comma = self._item_separator if self._trailing_comma else ""
-        if self._indent_str is not None:
-            indent_level -= 1
-            yield comma + "\n" + self._indent_str * indent_level
-        else:
-            yield comma
-        yield "]"
-        if self._markers is not None and marker_id is not None:
-            del self._markers[marker_id]
-
-    def _iterencode_dict(
-        self, obj: dict[Any, Any], indent_level: int, key_path: str
-    ) -> Iterable[str]:
-        if not obj:
-            yield "{}"
-            return
-        if self._markers is not None:
-            marker_id: int | None = id(obj)
-            if marker_id in self._markers:
-                raise JSON5EncodeError(EncoderErrors.circular_reference())
-            assert marker_id is not None
-            self._markers[marker_id] = obj
-        else:
-            marker_id = None
-        yield "{"
-        if self._indent_str is not None:
-            indent_level += 1
-            newline_indent: str | None = "\n" + self._indent_str * indent_level
-            assert newline_indent is not None
-            yield newline_indent
-        else:
-            newline_indent = None
-        first = True
-        if self._sort_keys:
-            items: Any = sorted(obj.items())
-        else:
-            items = obj.items()
-        total_items: int = len(items)
-        for idx, (key, value) in enumerate(items):
-            if isinstance(key, str):
-                pass
-            # JavaScript is weakly typed for these, so it makes sense to
-            # also allow them.  Many encoders seem to do something like this.
-            elif isinstance(key, (float, int, bool)) or key is None:
-                key = "".join(list(self.iterencode(key)))
-            elif self._skip_keys:
-                continue
-            else:
-                raise JSON5EncodeError(EncoderErrors.invalid_key_type(key))
-            specific_key_path: str = extend_key_path(key_path, key)
-            block_comments: list[str] = self._comments_cache.get(  # type: ignore
-                specific_key_path, {}
-            ).get("block_comments", [])
-            inline_comment: str = self._comments_cache.get(  # type: ignore
-                specific_key_path, {}
-            ).get("inline_comment", "")
-            if first:
-                first = False
-            elif newline_indent is not None:
-                yield newline_indent  # we do not need to yield anything if indent == 0
-            for block_comment in block_comments:
-                if newline_indent is not None:
-                    yield f"// {block_comment}{newline_indent}"
-            yield self._encode_str(key, key_str=True)
-            yield self._key_separator
-            if isinstance(value, (list, tuple)):
-                chunks = self._iterencode_list(value, indent_level, specific_key_path)
-            elif isinstance(value, dict):
-                chunks = self._iterencode_dict(value, indent_level, specific_key_path)
-            else:
-                chunks = self._iterencode(value, indent_level, specific_key_path)
-            yield from chunks
-
-            if idx != total_items - 1 or self._trailing_comma:
-                yield self._item_separator
-            if inline_comment and newline_indent is not None:
-                yield "  // " + inline_comment
-        if self._indent_str is not None:
-            indent_level -= 1
-            yield "\n" + self._indent_str * indent_level
-        yield "}"
-        if self._markers is not None and marker_id is not None:
-            del self._markers[marker_id]
-
 
 _default_encoder = JSON5Encoder(
     skip_keys=False,
@@ -598,6 +898,52 @@ _default_encoder = JSON5Encoder(
 )
 
 
+def _get_encoder(
+    cls: type[JSON5Encoder] | None,
+    *,
+    default: DefaultInterface | None,
+    skip_keys: bool,
+    ensure_ascii: bool,
+    check_circular: bool,
+    allow_nan: bool,
+    indent: int | None,
+    separators: tuple[str, str] | None,
+    sort_keys: bool,
+    key_quotation: KeyQuotation,
+    trailing_comma: bool | None,
+) -> JSON5Encoder:
+    """Return the shared default encoder if every option has its default value, or
+    a new encoder configured with the options otherwise."""
+    if (
+        not skip_keys  # pylint: disable=R0916
+        and ensure_ascii
+        and check_circular
+        and allow_nan
+        and cls is None
+        and indent is None
+        and separators is None
+        and default is None
+        and not sort_keys
+        and key_quotation == "double"
+        and trailing_comma is None
+    ):
+        return _default_encoder
+    if cls is None:
+        cls = JSON5Encoder
+    return cls(
+        skip_keys=skip_keys,
+        ensure_ascii=ensure_ascii,
+        check_circular=check_circular,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=separators,
+        default=default,
+        sort_keys=sort_keys,
+        key_quotation=key_quotation,
+        trailing_comma=trailing_comma,
+    )
+
+
 def dumps(
     obj: Any,
     typed_dict_cls: Any | None = None,
@@ -662,39 +1008,136 @@ def dumps(
     Raises:
         JSON5EncodeError: If the object cannot be serialized
     """
-    if (
-        not skip_keys  # pylint: disable=R0916
-        and ensure_ascii
-        and check_circular
-        and allow_nan
-        and cls is None
-        and indent is None
-        and separators is None
-        and default is None
-        and not sort_keys
-        and key_quotation == "double"
-        and trailing_comma is None
-    ):
-        return _default_encoder.encode(obj, typed_dict_cls)
-    if cls is None:
-        cls = JSON5Encoder
-    return cls(
+    return _get_encoder(
+        cls,
+        default=default,
         skip_keys=skip_keys,
         ensure_ascii=ensure_ascii,
         check_circular=check_circular,
         allow_nan=allow_nan,
         indent=indent,
         separators=separators,
-        default=default,
         sort_keys=sort_keys,
         key_quotation=key_quotation,
         trailing_comma=trailing_comma,
     ).encode(obj, typed_dict_cls)
 
 
+def dumps_bytes(
+    obj: Any,
+    typed_dict_cls: Any | None = None,
+    *,
+    cls: type[JSON5Encoder] | None = None,
+    default: DefaultInterface | None = None,
+    skip_keys: bool = False,
+    ensure_ascii: bool = True,
+    check_circular: bool = True,
+    allow_nan: bool = True,
+    indent: int | None = None,
+    separators: tuple[str, str] | None = None,
+    sort_keys: bool = False,
+    key_quotation: KeyQuotation = "double",
+    trailing_comma: bool | None = None,
+) -> bytes:
+    """Serialize `obj` to UTF-8 encoded JSON5 `bytes`, e.g. for the body of an HTTP
+    response.
+
+    Example:
+    ```python
+    import ujson5
+    print(ujson5.dumps_bytes({"name": "John"}))
+    # Output: b'{"name": "John"}'
+    ```
+
+    All arguments except `obj` and `typed_dict_cls` are keyword-only and have the same
+    meaning as in [`dumps`][ujson5.dumps].
+
+    The object is serialized with the same list-based fast path as `dumps`, and the
+    result is encoded once, so this is as fast as `dumps(obj).encode("utf-8")`.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON5 representation of the Python object
+
+    Raises:
+        JSON5EncodeError: If the object cannot be serialized
+    """
+    encoder = _get_encoder(
+        cls,
+        default=default,
+        skip_keys=skip_keys,
+        ensure_ascii=ensure_ascii,
+        check_circular=check_circular,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=separators,
+        sort_keys=sort_keys,
+        key_quotation=key_quotation,
+        trailing_comma=trailing_comma,
+    )
+    return encoder.encode(obj, typed_dict_cls).encode("utf-8")
+
+
+def _join_chunks(chunks: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Join chunks of output into pieces of at least `chunk_size` characters.
+
+    If an error is raised while producing the chunks, the output joined so far is
+    yielded before the error is raised.
+    """
+    buffer: list[str] = []
+    size: int = 0
+    try:
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+    except Exception:
+        if buffer:
+            yield "".join(buffer)
+        raise
+    if buffer:
+        yield "".join(buffer)
+
+
+def _write_chunks(
+    fp: IO[str] | IO[bytes], chunks: Iterable[str], chunk_size: int
+) -> None:
+    """Write chunks of output to a text or binary file object, joined into writes of
+    at least `chunk_size` characters.
+
+    Binary file objects are written the UTF-8 encoded output. They are detected by
+    type (`io.RawIOBase` or `io.BufferedIOBase` instances, such as files opened in
+    binary mode or the files returned by `socket.makefile("wb")`) or by a `mode`
+    containing `"b"`. Other objects are written `str` unless the first write raises a
+    `TypeError`, as the body streams of web frameworks do. The output buffered when
+    an error is raised is still written.
+    """
+    binary: bool | None = None
+    if isinstance(fp, io.TextIOBase):
+        binary = False
+    elif isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        binary = True
+    else:
+        mode = getattr(fp, "mode", None)
+        if isinstance(mode, str) and "b" in mode:
+            binary = True
+    write: Callable[[Any], Any] = fp.write
+    for text in _join_chunks(chunks, chunk_size):
+        if binary is None:
+            try:
+                write(text)
+                binary = False
+                continue
+            except TypeError:
+                binary = True
+        write(text.encode("utf-8") if binary else text)
+
+
 def dump(
     obj: Any,
-    fp: TextIO,
+    fp: IO[str] | IO[bytes],
     typed_dict_cls: Any | None = None,
     *,
     skip_keys: bool = False,
@@ -708,10 +1151,16 @@ def dump(
     sort_keys: bool = False,
     key_quotation: KeyQuotation = "double",
     trailing_comma: bool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> None:
     """Serialize `obj` as a JSON formatted stream to `fp` (a `.write()`-supporting
     file-like object).
 
+    The output is buffered and written `chunk_size` characters at a time. Binary file
+    objects (files opened in binary mode, `io.BytesIO`, sockets wrapped with
+    `socket.makefile("wb")`, or other writers that only accept `bytes`) are written
+    the UTF-8 encoded output.
+
     Example:
     ```python
     import ujson5
@@ -749,42 +1198,156 @@ def dump(
         trailing_comma: If True, a trailing comma will be added to the last item in
             a list or dictionary. If None, a trailing comma will be added if indent
             is not None. Defaults to None.
+        chunk_size: Number of characters buffered before they are written to `fp`.
+            Defaults to 64 KiB.
 
-    Returns:
-        str: The JSON5 formatted string representation of the Python object
+    Raises:
+        JSON5EncodeError: If the object cannot be serialized
+    """
+    iterable = _get_encoder(
+        cls,
+        default=default,
+        skip_keys=skip_keys,
+        ensure_ascii=ensure_ascii,
+        check_circular=check_circular,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=separators,
+        sort_keys=sort_keys,
+        key_quotation=key_quotation,
+        trailing_comma=trailing_comma,
+    ).iterencode(obj, typed_dict_cls)
+    _write_chunks(fp, itertools.chain(iterable, ("\n",)), chunk_size)
+
+
+async def adump(
+    obj: Any,
+    writer: "StreamWriter",
+    typed_dict_cls: Any | None = None,
+    *,
+    skip_keys: bool = False,
+    ensure_ascii: bool = True,
+    check_circular: bool = True,
+    allow_nan: bool = True,
+    cls: type[JSON5Encoder] | None = None,
+    indent: int | None = None,
+    separators: tuple[str, str] | None = None,
+    default: DefaultInterface | None = None,
+    sort_keys: bool = False,
+    key_quotation: KeyQuotation = "double",
+    trailing_comma: bool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Serialize `obj` as UTF-8 encoded JSON5 to an `asyncio.StreamWriter` (or any
+    object with `.write(data)` and asynchronous `.drain()` methods).
+
+    The output is written and drained `chunk_size` characters at a time as it is
+    encoded, and control returns to the event loop between chunks, so serializing a
+    large object does not block other tasks.
+
+    Example:
+    ```python
+    import asyncio
+    import ujson5
+
+    async def main():
+        reader, writer = await asyncio.open_connection("localhost", 8000)
+        await ujson5.adump({"key": "value"}, writer)
+    ```
+
+    All arguments except `obj`, `writer` and `typed_dict_cls` are keyword-only and have
+    the same meaning as in [`dump`][ujson5.dump].
+
+    Args:
+        obj: The object to serialize.
+        writer: The stream the UTF-8 encoded output is written to.
+        typed_dict_cls: A TypedDict class describing `obj`, used to write comments.
+        chunk_size: Number of characters written at a time.
 
     Raises:
         JSON5EncodeError: If the object cannot be serialized
     """
-    if (
-        not skip_keys  # pylint: disable=R0916
-        and ensure_ascii
-        and check_circular
-        and allow_nan
-        and cls is None
-        and indent is None
-        and separators is None
-        and default is None
-        and not sort_keys
-        and key_quotation == "double"
-        and trailing_comma is None
-    ):
-        iterable = _default_encoder.iterencode(obj, typed_dict_cls)
-    else:
-        if cls is None:
-            cls = JSON5Encoder
-        iterable = cls(
-            skip_keys=skip_keys,
-            ensure_ascii=ensure_ascii,
-            check_circular=check_circular,
-            allow_nan=allow_nan,
-            indent=indent,
-            separators=separators,
-            default=default,
-            sort_keys=sort_keys,
-            key_quotation=key_quotation,
-            trailing_comma=trailing_comma,
-        ).iterencode(obj, typed_dict_cls)
-    for chunk in iterable:
-        fp.write(chunk)
-    fp.write("\n")
+    import asyncio  # pylint: disable=C0415
+
+    iterable = _get_encoder(
+        cls,
+        default=default,
+        skip_keys=skip_keys,
+        ensure_ascii=ensure_ascii,
+        check_circular=check_circular,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=separators,
+        sort_keys=sort_keys,
+        key_quotation=key_quotation,
+        trailing_comma=trailing_comma,
+    ).iterencode(obj, typed_dict_cls)
+    for text in _join_chunks(itertools.chain(iterable, ("\n",)), chunk_size):
+        writer.write(text.encode("utf-8"))
+        await writer.drain()
+        # drain does not yield unless the transport's buffer is full
+        await asyncio.sleep(0)
+
+
+def dump_many(
+    objs: Iterable[Any],
+    fp: IO[str] | IO[bytes],
+    typed_dict_cls: Any | None = None,
+    *,
+    skip_keys: bool = False,
+    ensure_ascii: bool = True,
+    check_circular: bool = True,
+    allow_nan: bool = True,
+    cls: type[JSON5Encoder] | None = None,
+    indent: int | None = None,
+    separators: tuple[str, str] | None = None,
+    default: DefaultInterface | None = None,
+    sort_keys: bool = False,
+    key_quotation: KeyQuotation = "double",
+    trailing_comma: bool | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Serialize every object of `objs` to `fp`, one JSON5 value per line (JSON5
+    Lines). The output can be read back with [`load_many`][ujson5.load_many].
+
+    The encoder is only configured once, so this is much cheaper than calling
+    [`dump`][ujson5.dump] for each object.
+
+    Example:
+    ```python
+    import ujson5
+    records = [{"id": 1}, {"id": 2}]
+    with open("records.json5l", "w") as f:
+        ujson5.dump_many(records, f)
+    ```
+
+    All arguments except `objs`, `fp` and `typed_dict_cls` are keyword-only and have the
+    same meaning as in [`dump`][ujson5.dump]. Each value spans a single line unless
+    `indent` is set.
+
+    Args:
+        objs: The objects to serialize.
+        fp: A `.write()`-supporting text or binary file-like object.
+        typed_dict_cls: A TypedDict class describing every object, used to write
+            comments.
+        chunk_size: Number of characters buffered before they are written to `fp`.
+
+    Raises:
+        JSON5EncodeError: If an object cannot be serialized
+    """
+    encoder = _get_encoder(
+        cls,
+        default=default,
+        skip_keys=skip_keys,
+        ensure_ascii=ensure_ascii,
+        check_circular=check_circular,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=separators,
+        sort_keys=sort_keys,
+        key_quotation=key_quotation,
+        trailing_comma=trailing_comma,
+    )
+    _write_chunks(
+        fp, (encoder.encode(obj, typed_dict_cls) + "\n" for obj in objs), chunk_size
+    )
@@ -156,6 +156,14 @@ class DecoderErr:
     def reserved_word(word_str: str) -> str:
         return f"Reserved word cannot be used as identifier: <{word_str}>"
 
+    @staticmethod
+    def path_not_found(path: str) -> str:
+        return f"Path not found: <{path}>"
+
+    @staticmethod
+    def expecting_array(path: str) -> str:
+        return f"Expecting an array at path: <{path}>"
+
 
 class EncoderErrors:
     """Encoder errors"""
@@ -4,6 +4,7 @@ and transitions. The lexer is used to tokenize JSON5 documents into tokens. The
 tokens are used by the parser to build the abstract syntax tree (AST).
 """
 
+import mmap
 import re
 from typing import Literal
 
@@ -81,9 +82,58 @@ def _handle_unexpected_char(buffer: str, idx: int, char: str) -> None:
     )
 
 
+# the full JSON5 numeric grammar. A number must be followed by whitespace, a
+# punctuator or the end of the document.
+NUMBER_PATTERN = re.compile(
+    r"""
+    [+-]?
+    (?:
+        Infinity
+        | NaN
+        | 0[xX][0-9a-fA-F]+
+        | (?:0|[1-9][0-9]*) (?:\.[0-9]*)? (?:[eE][+-]?[0-9]+)?
+        | \.[0-9]+ (?:[eE][+-]?[0-9]+)?
+    )
+    (?=[\s{}\[\]:,]|\Z)
+    """,
+    re.VERBOSE,
+)
+
+
 def tokenize_number(buffer: str, idx: int) -> TokenResult:
     """Tokenize a number and return the token and the updated index.
 
+    Valid numbers are matched with a single regex. The finite state machine in
+    `_tokenize_number_fsm` only runs when the match fails, to report where and why
+    the number is invalid.
+
+    Args:
+        buffer: JSON5 document
+        idx: current index. Must point to the start of the number
+
+    Returns:
+        TokenResult: Token and updated index
+
+    Raises:
+        JSON5DecodeError: if the number is invalid
+    """
+    match = NUMBER_PATTERN.match(buffer, idx)
+    if match is not None:
+        end_idx = match.end()
+        return TokenResult(
+            Token(
+                tk_type=TOKEN_TYPE["NUMBER"],
+                value=(idx, end_idx),
+            ),
+            end_idx,
+        )
+    return _tokenize_number_fsm(buffer, idx)
+
+
+def _tokenize_number_fsm(buffer: str, idx: int) -> TokenResult:
+    """Tokenize a number character by character. This is the slow path of
+    `tokenize_number` and is used to produce precise error messages.
+
     Args:
         buffer: JSON5 document
         idx: current index. Must point to the start of the number
@@ -264,12 +314,10 @@ def tokenize_number(buffer: str, idx: int) -> TokenResult:
     )
 
 
-StringState = Literal[
-    "STRING_START",  # Initial state, waiting for a string
-    "DOUBLE_STRING",
-    "SINGLE_STRING",
-    "END_STRING",  # accepting
-]
+STRING_CHARS_PATTERNS: dict[str, re.Pattern[str]] = {
+    '"': re.compile(r'[^"\\\n\r\u2028\u2029]*'),
+    "'": re.compile(r"[^'\\\n\r\u2028\u2029]*"),
+}
 
 
 def _escape_handler(buffer: str, idx: int) -> int:
@@ -300,13 +348,13 @@ def _escape_handler(buffer: str, idx: int) -> int:
         )
     next_char = buffer[idx + 1]
 
-    if next_char == "\n":  # Line continuation
-        idx += 2
+    if next_char in consts.LINE_TERMINATOR_SEQUENCE:  # Line continuation
+        idx += 3 if buffer.startswith("\r\n", idx + 1) else 2
     elif next_char.isspace():  # Ignore whitespace
         idx += 2
         while idx < buffer_len:
             character = buffer[idx]
-            if character == "\n":
+            if character in consts.LINE_TERMINATOR_SEQUENCE:
                 break
             if not character.isspace():
                 break
@@ -317,8 +365,8 @@ def _escape_handler(buffer: str, idx: int) -> int:
                 doc=buffer,
                 pos=idx,
             )
-        if buffer[idx] == "\n":
-            idx += 1
+        if buffer[idx] in consts.LINE_TERMINATOR_SEQUENCE:
+            idx += 2 if buffer.startswith("\r\n", idx) else 1
         else:
             raise JSON5DecodeError(
                 msg=DecoderErr.bad_string_continuation(),
@@ -383,57 +431,39 @@ def tokenize_string(buffer: str, idx: int) -> TokenResult:
     Raises:
         JSON5DecodeError: if the string is invalid
     """
-    state: StringState = "STRING_START"
-    start_idx = idx
     quote = buffer[idx]
-    buffer_len = len(buffer)
-
-    if quote == '"':
-        state = "DOUBLE_STRING"
-        start_idx += 1
-    elif quote == "'":
-        state = "SINGLE_STRING"
-        start_idx += 1
-    else:
+    if quote not in STRING_CHARS_PATTERNS:
         raise JSON5DecodeError(
             msg=StringDecoderErr.string_invalid_start(quote),
             doc=buffer,
             pos=idx,
         )
+    # skip over runs of ordinary characters, stopping only at the closing quote,
+    # an escape sequence or a line terminator
+    chars_pattern = STRING_CHARS_PATTERNS[quote]
+    buffer_len = len(buffer)
     idx += 1
+    start_idx = idx
 
-    while idx < buffer_len:
-        assert state != "STRING_START", state
+    while True:
+        match = chars_pattern.match(buffer, idx)
+        assert match is not None
+        idx = match.end()
+        if idx == buffer_len:
+            break
         char = buffer[idx]
-
-        if char == "\n":
+        if char == quote:
+            return TokenResult(
+                Token(
+                    tk_type=TOKEN_TYPE["STRING"],
+                    value=(start_idx, idx),
+                ),
+                idx + 1,  # Skip the closing quote
+            )
+        if char != "\\":
             break
+        idx = _escape_handler(buffer, idx)
 
-        if state == "DOUBLE_STRING":
-            if char == '"':
-                state = "END_STRING"
-                break
-            if char == "\\":
-                idx = _escape_handler(buffer, idx)
-            else:
-                idx += 1
-        elif state == "SINGLE_STRING":
-            if char == "'":
-                state = "END_STRING"
-                break
-            if char == "\\":
-                idx = _escape_handler(buffer, idx)
-            else:
-                idx += 1
-
-    if state == "END_STRING":
-        return TokenResult(
-            Token(
-                tk_type=TOKEN_TYPE["STRING"],
-                value=(start_idx, idx),
-            ),
-            idx + 1,  # Skip the closing quote
-        )
     raise JSON5DecodeError(
         msg=StringDecoderErr.unexpected_end_of_string(),
         doc=buffer,
@@ -457,7 +487,7 @@ def validate_identifier_start(buffer: str, idx: int) -> int:
         JSON5DecodeError: if the identifier is invalid
     """
     start_char = buffer[idx]
-    if start_char in {"$", "_"} or start_char in consts.UNICODE_LETTERS:
+    if start_char in {"$", "_"} or consts.is_unicode_letter(start_char):
         idx += 1
     elif start_char == "\\":  # unicode escape sequence
         if idx + 5 >= len(buffer):
@@ -487,9 +517,24 @@ def validate_identifier_start(buffer: str, idx: int) -> int:
     return idx
 
 
+IDENTIFIER_ASCII_PATTERN = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*")
+IDENTIFIER_PART_ASCII_PATTERN = re.compile(r"[A-Za-z0-9_$]+")
+UNICODE_ESCAPE_PATTERN = re.compile(r"\\u[0-9a-fA-F]{4}")
+
+
+def _is_identifier_end(buffer: str, idx: int) -> bool:
+    return (
+        idx == len(buffer) or buffer[idx].isspace() or buffer[idx] in consts.PUNCTUATORS
+    )
+
+
 def tokenize_identifier(buffer: str, idx: int) -> TokenResult:
     """Tokenize an identifier and return the token and the updated index.
 
+    Runs of ASCII identifier characters are matched with a single regex. Only
+    non-ASCII characters and unicode escape sequences go through the character
+    by character checks.
+
     Args:
         buffer: JSON5 document
         idx: current index. Must point to the start of the identifier
@@ -502,25 +547,35 @@ def tokenize_identifier(buffer: str, idx: int) -> TokenResult:
     """
     start_idx = idx
     buffer_len = len(buffer)
-    idx = validate_identifier_start(buffer, idx)
+    match = IDENTIFIER_ASCII_PATTERN.match(buffer, idx)
+    if match is not None:
+        idx = match.end()
+        if _is_identifier_end(buffer, idx):
+            return TokenResult(
+                Token(
+                    tk_type=TOKEN_TYPE["IDENTIFIER"],
+                    value=(start_idx, idx),
+                ),
+                idx,
+            )
+    else:
+        idx = validate_identifier_start(buffer, idx)
 
     while idx < buffer_len:
         char = buffer[idx]
 
         if char.isspace() or char in consts.PUNCTUATORS:
             break
-        is_start_char = False
-        try:
-            idx = validate_identifier_start(buffer, idx)
-            is_start_char = True
-        except JSON5DecodeError:
-            is_start_char = False
-        if is_start_char:
-            continue
-        if (
-            char in consts.UNICODE_COMBINING_MARKS
-            or char in consts.UNICODE_DIGITS
-            or char in consts.UNICODE_CONNECTORS
+        match = IDENTIFIER_PART_ASCII_PATTERN.match(buffer, idx)
+        if match is not None:
+            idx = match.end()
+        elif char == "\\" and UNICODE_ESCAPE_PATTERN.match(buffer, idx):
+            idx += 6
+        elif (
+            consts.is_unicode_letter(char)
+            or consts.is_unicode_combining_mark(char)
+            or consts.is_unicode_digit(char)
+            or consts.is_unicode_connector(char)
             or char in {consts.ZWJ, consts.ZWNJ}
         ):
             idx += 1
@@ -540,9 +595,12 @@ def tokenize_identifier(buffer: str, idx: int) -> TokenResult:
     )
 
 
+LINE_TERMINATOR_PATTERN = re.compile(r"[\n\r\u2028\u2029]")
+
+
 def validate_comment(buffer: str, idx: int) -> int:
     """Validate a comment. An inline comment starts with `//` and ends with a
-    newline character. A block comment starts with `/*` and ends with `*/`.
+    line terminator. A block comment starts with `/*` and ends with `*/`.
 
     Args:
         buffer: JSON5 document
@@ -562,19 +620,80 @@ def validate_comment(buffer: str, idx: int) -> int:
             pos=idx,
         )
     if buffer[idx + 1] == "/":  # Single line comment
-        while idx < len(buffer) and buffer[idx] != "\n":
-            idx += 1
-        return idx + 1 if idx < len(buffer) else idx
+        match = LINE_TERMINATOR_PATTERN.search(buffer, idx + 2)
+        return len(buffer) if match is None else match.end()
     # Multi-line comment
-    while idx + 1 < len(buffer) and buffer[idx : idx + 2] != "*/":
-        idx += 1
-    if idx + 1 == len(buffer):
+    end_idx = buffer.find("*/", idx + 2)
+    if end_idx == -1:
         raise JSON5DecodeError(
             msg=DecoderErr.unexpected_eof(),
             doc=buffer,
-            pos=idx,
+            pos=len(buffer) - 1,
         )
-    return idx + 2
+    return end_idx + 2
+
+
+PUNCTUATOR_TOKEN_TYPES: dict[str, int] = {
+    "{": TOKEN_TYPE["PUN_OPEN_BRACE"],
+    "}": TOKEN_TYPE["PUN_CLOSE_BRACE"],
+    "[": TOKEN_TYPE["PUN_OPEN_BRACKET"],
+    "]": TOKEN_TYPE["PUN_CLOSE_BRACKET"],
+    ":": TOKEN_TYPE["PUN_COLON"],
+    ",": TOKEN_TYPE["PUN_COMMA"],
+}
+
+KEYWORD_TOKEN_TYPES: dict[str, int] = {
+    "true": TOKEN_TYPE["BOOLEAN"],
+    "false": TOKEN_TYPE["BOOLEAN"],
+    "null": TOKEN_TYPE["NULL"],
+    "Infinity": TOKEN_TYPE["NUMBER"],
+    "NaN": TOKEN_TYPE["NUMBER"],
+}
+
+WHITESPACE_PATTERN = re.compile(r"\s*")
+
+
+def next_token(buffer: str, idx: int) -> TokenResult | None:
+    """Skip whitespace and comments starting at `idx` and tokenize the next token.
+    This allows the document to be lexed on demand, one token at a time.
+
+    Args:
+        buffer: JSON5 document
+        idx: current index
+
+    Returns:
+        TokenResult | None: The next token and the index right after it, or None if
+            only whitespace and comments are left in the document
+
+    Raises:
+        JSON5DecodeError: if the next token is invalid
+    """
+    buffer_len = len(buffer)
+    while True:
+        match = WHITESPACE_PATTERN.match(buffer, idx)
+        assert match is not None
+        idx = match.end()
+        if idx >= buffer_len:
+            return None
+        char = buffer[idx]
+        if char in PUNCTUATOR_TOKEN_TYPES:
+            return TokenResult(
+                Token(PUNCTUATOR_TOKEN_TYPES[char], (idx, idx + 1)), idx + 1
+            )
+        if char in {"'", '"'}:
+            return tokenize_string(buffer, idx)
+        if char == "/":
+            idx = validate_comment(buffer, idx)
+            continue
+        if char.isdigit() or char in {"+", "-", "."}:
+            return tokenize_number(buffer, idx)
+        result = tokenize_identifier(buffer, idx)
+        tk_type = KEYWORD_TOKEN_TYPES.get(
+            buffer[result.token.value[0] : result.token.value[1]]
+        )
+        if tk_type is None:
+            return result
+        return TokenResult(Token(tk_type, result.token.value), result.idx)
 
 
 def tokenize(buffer: str) -> list[Token]:
@@ -589,59 +708,265 @@ def tokenize(buffer: str) -> list[Token]:
     Raises:
         JSON5DecodeError: if the document is invalid
     """
-    buffer = simplify_escapes(buffer)
     tokens: list[Token] = []
     idx: int = 0
-    while idx < len(buffer):
+    while (result := next_token(buffer, idx)) is not None:
+        tokens.append(result.token)
+        idx = result.idx
+    return tokens
+
+
+SKIP_PATTERN = re.compile(r"[^\"'{}\[\]/]*")
+CLOSING_PUNCTUATORS: dict[str, str] = {"{": "}", "[": "]"}
+
+
+def skip_container(buffer: str, idx: int) -> int:
+    """Skip an object or an array without tokenizing its content. Only strings and
+    comments are lexed (so that brackets inside them are ignored) and brackets are
+    matched. Everything else is jumped over without being validated.
+
+    Args:
+        buffer: JSON5 document
+        idx: current index. Must point to the opening brace or bracket
+
+    Returns:
+        int: index right after the matching closing brace or bracket
+
+    Raises:
+        JSON5DecodeError: if a string, a comment or the brackets are invalid
+    """
+    assert buffer[idx] in CLOSING_PUNCTUATORS
+    buffer_len = len(buffer)
+    expected_closers: list[str] = []
+    while True:
         char = buffer[idx]
-        if char.isspace():
-            idx += 1
-        elif char == "{":
-            tokens.append(Token(TOKEN_TYPE["PUN_OPEN_BRACE"], (idx, idx + 1)))
+        if char in CLOSING_PUNCTUATORS:
+            expected_closers.append(CLOSING_PUNCTUATORS[char])
             idx += 1
-        elif char == "}":
-            tokens.append(Token(TOKEN_TYPE["PUN_CLOSE_BRACE"], (idx, idx + 1)))
+        elif char in {"}", "]"}:
+            if char != expected_closers.pop():
+                raise JSON5DecodeError(
+                    msg=DecoderErr.unexpected_punctuation(char),
+                    doc=buffer,
+                    pos=idx,
+                )
             idx += 1
-        elif char == "[":
-            tokens.append(Token(TOKEN_TYPE["PUN_OPEN_BRACKET"], (idx, idx + 1)))
+            if not expected_closers:
+                return idx
+        elif char == "/":
+            idx = validate_comment(buffer, idx)
+        else:
+            idx = tokenize_string(buffer, idx).idx
+        match = SKIP_PATTERN.match(buffer, idx)
+        assert match is not None
+        idx = match.end()
+        if idx == buffer_len:
+            raise JSON5DecodeError(
+                msg=DecoderErr.unexpected_eof(),
+                doc=buffer,
+                pos=idx,
+            )
+
+
+ARRAY_SCAN_PATTERN = re.compile(r"[^\"'{}\[\],/]*")
+
+
+def scan_array(buffer: str, idx: int) -> tuple[list[int], int]:
+    """Find the boundaries of the elements of an array with a structural scan: nested
+    objects and arrays are skipped with `skip_container` and elements are not
+    tokenized.
+
+    Args:
+        buffer: JSON5 document
+        idx: current index. Must point to the opening bracket
+
+    Returns:
+        tuple[list[int], int]: indices of the commas separating the elements of the
+            array and index of its closing bracket
+
+    Raises:
+        JSON5DecodeError: if a string, a comment or the brackets are invalid
+    """
+    assert buffer[idx] == "["
+    buffer_len = len(buffer)
+    commas: list[int] = []
+    idx += 1
+    while True:
+        match = ARRAY_SCAN_PATTERN.match(buffer, idx)
+        assert match is not None
+        idx = match.end()
+        if idx == buffer_len:
+            raise JSON5DecodeError(
+                msg=DecoderErr.unexpected_eof(),
+                doc=buffer,
+                pos=idx,
+            )
+        char = buffer[idx]
+        if char == ",":
+            commas.append(idx)
             idx += 1
         elif char == "]":
-            tokens.append(Token(TOKEN_TYPE["PUN_CLOSE_BRACKET"], (idx, idx + 1)))
-            idx += 1
-        elif char == ":":
-            tokens.append(Token(TOKEN_TYPE["PUN_COLON"], (idx, idx + 1)))
-            idx += 1
-        elif char == ",":
-            tokens.append(Token(TOKEN_TYPE["PUN_COMMA"], (idx, idx + 1)))
-            idx += 1
-        elif char in {"'", '"'}:
-            result = tokenize_string(buffer, idx)
-            tokens.append(result.token)
-            idx = result.idx
+            return commas, idx
+        elif char in CLOSING_PUNCTUATORS:
+            idx = skip_container(buffer, idx)
         elif char == "/":
             idx = validate_comment(buffer, idx)
-        elif char.isdigit() or char in {"+", "-", "."}:
-            result = tokenize_number(buffer, idx)
-            tokens.append(result.token)
-            idx = result.idx
+        elif char == "}":
+            raise JSON5DecodeError(
+                msg=DecoderErr.unexpected_punctuation(char),
+                doc=buffer,
+                pos=idx,
+            )
         else:
-            result = tokenize_identifier(buffer, idx)
-            tok_str = buffer[result.token.value[0] : result.token.value[1]]
-            if tok_str in {"true", "false"}:
-                token = Token(TOKEN_TYPE["BOOLEAN"], result.token.value)
-            elif tok_str == "null":
-                token = Token(TOKEN_TYPE["NULL"], result.token.value)
-            elif tok_str in {
-                "Infinity",
-                "NaN",
-                "-Infinity",
-                "-NaN",
-                "+Infinity",
-                "+NaN",
-            }:
-                token = Token(TOKEN_TYPE["NUMBER"], result.token.value)
+            idx = tokenize_string(buffer, idx).idx
+
+
+# Lexing UTF-8 encoded documents
+#
+# The structure of most documents is pure ASCII, so UTF-8 buffers can be lexed
+# byte by byte without decoding the whole document to `str`. The functions below
+# only handle that common case and raise `BytesFallback` for anything else (non-ASCII
+# outside of strings, unusual escapes, invalid tokens, ...). The decoder then decodes
+# the whole document and lexes it with the `str` functions above, which produce the
+# precise error messages.
+
+BytesLike = bytes | bytearray | memoryview | mmap.mmap
+"""Buffers that can be lexed without decoding them to `str` first."""
+
+
+class BytesFallback(Exception):
+    """Raised when a UTF-8 buffer has to be decoded and lexed as `str`."""
+
+
+PUNCTUATOR_TOKEN_TYPES_BYTES: dict[int, int] = {
+    ord(char): tk_type for char, tk_type in PUNCTUATOR_TOKEN_TYPES.items()
+}
+
+KEYWORD_TOKEN_TYPES_BYTES: dict[bytes, int] = {
+    keyword.encode(): tk_type for keyword, tk_type in KEYWORD_TOKEN_TYPES.items()
+}
+
+# ASCII characters for which str.isspace() is True
+WHITESPACE_BYTES: bytes = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+WHITESPACE_PATTERN_BYTES = re.compile(rb"[ \t\n\r\x0b\x0c\x1c-\x1f]*")
+TOKEN_END_BYTES: frozenset[int] = frozenset(
+    WHITESPACE_BYTES + "".join(consts.PUNCTUATORS).encode()
+)
+LINE_TERMINATOR_PATTERN_BYTES = re.compile(rb"[\n\r]|\xe2\x80[\xa8\xa9]")
+BLOCK_COMMENT_END_PATTERN_BYTES = re.compile(rb"\*/")
+NUMBER_PATTERN_BYTES = re.compile(
+    NUMBER_PATTERN.pattern.replace(r"\s", r" \t\n\r\x0b\x0c\x1c-\x1f").encode(),
+    re.VERBOSE,
+)
+IDENTIFIER_ASCII_PATTERN_BYTES = re.compile(IDENTIFIER_ASCII_PATTERN.pattern.encode())
+# 0xE2 starts the UTF-8 encoding of LS and PS, which terminate strings
+STRING_CHARS_PATTERNS_BYTES: dict[int, re.Pattern[bytes]] = {
+    ord('"'): re.compile(rb'[^"\\\n\r\xe2]*'),
+    ord("'"): re.compile(rb"[^'\\\n\r\xe2]*"),
+}
+ESCAPE_PATTERN_BYTES = re.compile(
+    rb"\\(?:['\"\\bfnrtv0/]|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}"
+    + rb"|[ \t\x0b\x0c]*(?:\r\n|[\n\r]|\xe2\x80[\xa8\xa9]))"
+)
+
+
+def tokenize_string_bytes(buffer: BytesLike, idx: int) -> TokenResult:
+    """Tokenize a string in a UTF-8 buffer. See `tokenize_string`.
+
+    Args:
+        buffer: UTF-8 encoded JSON5 document
+        idx: current index. Must point to the opening quote
+
+    Returns:
+        TokenResult: Token and updated index
+
+    Raises:
+        BytesFallback: if the string is invalid or needs the `str` lexer
+    """
+    chars_pattern = STRING_CHARS_PATTERNS_BYTES[buffer[idx]]
+    quote = buffer[idx]
+    buffer_len = len(buffer)
+    idx += 1
+    start_idx = idx
+    while True:
+        match = chars_pattern.match(buffer, idx)
+        assert match is not None
+        idx = match.end()
+        if idx == buffer_len:
+            raise BytesFallback
+        byte = buffer[idx]
+        if byte == quote:
+            return TokenResult(
+                Token(tk_type=TOKEN_TYPE["STRING"], value=(start_idx, idx)), idx + 1
+            )
+        if byte == 0x5C:  # backslash
+            match = ESCAPE_PATTERN_BYTES.match(buffer, idx)
+            if match is None:
+                raise BytesFallback
+            idx = match.end()
+        elif byte == 0xE2 and bytes(buffer[idx + 1 : idx + 3]) not in {
+            b"\x80\xa8",
+            b"\x80\xa9",
+        }:
+            idx += 1
+        else:  # line terminator
+            raise BytesFallback
+
+
+def next_token_bytes(buffer: BytesLike, idx: int) -> TokenResult | None:
+    """Skip whitespace and comments starting at `idx` in a UTF-8 buffer and tokenize
+    the next token. Indices are byte offsets. See `next_token`.
+
+    Args:
+        buffer: UTF-8 encoded JSON5 document
+        idx: current index
+
+    Returns:
+        TokenResult | None: The next token and the index right after it, or None if
+            only whitespace and comments are left in the document
+
+    Raises:
+        BytesFallback: if the next token is invalid or needs the `str` lexer
+    """
+    buffer_len = len(buffer)
+    while True:
+        match = WHITESPACE_PATTERN_BYTES.match(buffer, idx)
+        assert match is not None
+        idx = match.end()
+        if idx >= buffer_len:
+            return None
+        byte = buffer[idx]
+        if byte in PUNCTUATOR_TOKEN_TYPES_BYTES:
+            return TokenResult(
+                Token(PUNCTUATOR_TOKEN_TYPES_BYTES[byte], (idx, idx + 1)), idx + 1
+            )
+        if byte in STRING_CHARS_PATTERNS_BYTES:
+            return tokenize_string_bytes(buffer, idx)
+        if byte == 0x2F:  # slash
+            next_byte = buffer[idx + 1] if idx + 1 < buffer_len else None
+            if next_byte == 0x2F:
+                match = LINE_TERMINATOR_PATTERN_BYTES.search(buffer, idx + 2)
+                idx = buffer_len if match is None else match.end()
+            elif next_byte == 0x2A:
+                match = BLOCK_COMMENT_END_PATTERN_BYTES.search(buffer, idx + 2)
+                if match is None:
+                    raise BytesFallback
+                idx = match.end()
             else:
-                token = result.token
-            tokens.append(token)
-            idx = result.idx
-    return tokens
+                raise BytesFallback
+            continue
+        match = NUMBER_PATTERN_BYTES.match(buffer, idx)
+        if match is not None:
+            return TokenResult(
+                Token(TOKEN_TYPE["NUMBER"], (idx, match.end())), match.end()
+            )
+        match = IDENTIFIER_ASCII_PATTERN_BYTES.match(buffer, idx)
+        if match is None:
+            raise BytesFallback
+        end_idx = match.end()
+        if end_idx < buffer_len and buffer[end_idx] not in TOKEN_END_BYTES:
+            raise BytesFallback
+        tk_type = KEYWORD_TOKEN_TYPES_BYTES.get(
+            bytes(buffer[idx:end_idx]), TOKEN_TYPE["IDENTIFIER"]
+        )
+        return TokenResult(Token(tk_type, (idx, end_idx)), end_idx)
@@ -0,0 +1,220 @@
+"""Decoding and encoding JSON5 documents in parallel.
+
+Parsing is pure Python and CPU-bound, so with the GIL enabled threads cannot use more
+than one core. `load_files` and `decode_chunks` fan the work out to a
+`ProcessPoolExecutor` instead. Options and hooks passed to them are sent to the worker
+processes, so they must be picklable (e.g. module-level functions rather than lambdas).
+
+Decoders and encoders keep no state between calls, so a single instance can be shared
+by many threads. `loads_many` and `dumps_many` use a `ThreadPoolExecutor`, which scales
+on free-threaded builds of CPython (3.13t and later) without the cost of sending
+documents to other processes.
+"""
+
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from itertools import repeat
+from typing import Any, NamedTuple
+
+from ujson5.core import JSON5DecodeError
+from ujson5.decoder import Json5Decoder, load_path
+from ujson5.encoder import JSON5Encoder
+from ujson5.lexer import BytesLike
+
+
+class FileResult(NamedTuple):
+    """Result of decoding one file with [`load_files`][ujson5.load_files].
+
+    `error` is `None` if the file was decoded successfully, in which case `value` holds
+    the decoded object. Otherwise `value` is `None` and `error` is the
+    `JSON5DecodeError`, `UnicodeDecodeError` (for files that are not valid UTF-8,
+    UTF-16 or UTF-32) or `OSError` raised while loading the file.
+    """
+
+    path: str
+    value: Any
+    error: JSON5DecodeError | UnicodeDecodeError | OSError | None
+
+
+def _load_file(path: str, options: dict[str, Any]) -> FileResult:
+    """Load a file, catching the errors that are reported per file."""
+    try:
+        return FileResult(path, load_path(path, **options), None)
+    except (JSON5DecodeError, UnicodeDecodeError, OSError) as e:
+        return FileResult(path, None, e)
+
+
+def load_files(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    workers: int | None = None,
+    ordered: bool = True,
+    **options: Any,
+) -> Iterator[FileResult]:
+    """Decode many JSON5 files in parallel worker processes.
+
+    An invalid or unreadable file does not abort the batch: its error is reported in
+    its [`FileResult`][ujson5.FileResult].
+
+    Example:
+    ```python
+    import ujson5
+    for result in ujson5.load_files(["a.json5", "b.json5"], workers=4):
+        if result.error is not None:
+            print(result.path, result.error)
+    ```
+
+    Args:
+        paths: Paths of the files to decode.
+        workers: Number of worker processes. Defaults to the number of CPUs. With a
+            single worker, the files are decoded in the current process.
+        ordered: If `True`, results are yielded in the order of `paths`. Otherwise they
+            are yielded as soon as each file has been decoded.
+        **options: Keyword arguments passed to [`load_path`][ujson5.load_path] for every
+            file (e.g. `strict` or `object_hook`).
+
+    Yields:
+        FileResult: The result of each file.
+    """
+    str_paths = [os.fspath(path) for path in paths]
+    if workers == 1 or len(str_paths) <= 1:
+        for path in str_paths:
+            yield _load_file(path, options)
+        return
+    from concurrent.futures import (  # pylint: disable=C0415
+        ProcessPoolExecutor,
+        as_completed,
+    )
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_load_file, path, options) for path in str_paths]
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _decode_chunk(decoder: Json5Decoder, chunk: str) -> list[Any] | JSON5DecodeError:
+    """Decode a run of array elements, returning the error instead of raising it."""
+    try:
+        return decoder.decode("[" + chunk + "]")
+    except JSON5DecodeError as e:
+        return e
+
+
+def decode_chunks(
+    decoder: Json5Decoder, chunks: list[str], workers: int | None
+) -> list[list[Any] | JSON5DecodeError]:
+    """Decode runs of comma-separated array elements in worker processes.
+
+    Args:
+        decoder: Decoder used for every chunk.
+        chunks: Runs of array elements, without the surrounding brackets.
+        workers: Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        The elements of each chunk, or the error raised when decoding it. Error
+            positions are offsets in the chunk plus one (for the opening bracket).
+    """
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=C0415
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_decode_chunk, [decoder] * len(chunks), chunks))
+
+
+def _thread_workers(workers: int | None) -> int:
+    """Number of threads used by `loads_many` and `dumps_many`."""
+    if workers is not None:
+        return workers
+    # threads only add overhead while the GIL serializes them
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return 1
+    return os.cpu_count() or 1
+
+
+def loads_many(
+    json5_strs: Iterable[str | BytesLike],
+    *,
+    workers: int | None = None,
+    cls: type[Json5Decoder] | None = None,
+    **options: Any,
+) -> list[Any]:
+    """Decode many JSON5 documents with a pool of threads sharing one decoder.
+
+    Example:
+    ```python
+    import ujson5
+    objs = ujson5.loads_many(['{id: 1}', '{id: 2}'], workers=4)
+    # objs == [{'id': 1}, {'id': 2}]
+    ```
+
+    Args:
+        json5_strs: The documents, each a `str` or an encoded buffer as accepted by
+            [`loads`][ujson5.loads].
+        workers: Number of threads. Defaults to the number of CPUs on free-threaded
+            builds of CPython, and to decoding in the calling thread when the GIL is
+            enabled.
+        cls: If specified, must be a [`Json5Decoder`][ujson5.Json5Decoder] subclass.
+        **options: Keyword arguments passed to the decoder (e.g. `strict` or
+            `object_hook`).
+
+    Returns:
+        The decoded objects, in the order of `json5_strs`.
+
+    Raises:
+        JSON5DecodeError: If a document is invalid.
+    """
+    decoder = (cls or Json5Decoder)(**options)
+    workers = _thread_workers(workers)
+    if workers == 1:
+        return [decoder.decode(json5_str) for json5_str in json5_strs]
+    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=C0415
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(decoder.decode, json5_strs))
+
+
+def dumps_many(
+    objs: Iterable[Any],
+    typed_dict_cls: Any | None = None,
+    *,
+    workers: int | None = None,
+    cls: type[JSON5Encoder] | None = None,
+    **options: Any,
+) -> list[str]:
+    """Encode many objects with a pool of threads sharing one encoder.
+
+    Example:
+    ```python
+    import ujson5
+    docs = ujson5.dumps_many([{"id": 1}, {"id": 2}], workers=4)
+    # docs == ['{"id": 1}', '{"id": 2}']
+    ```
+
+    Args:
+        objs: The objects to serialize.
+        typed_dict_cls: A TypedDict class describing every object, used to write
+            comments.
+        workers: Number of threads. Defaults to the number of CPUs on free-threaded
+            builds of CPython, and to encoding in the calling thread when the GIL is
+            enabled.
+        cls: If specified, must be a [`JSON5Encoder`][ujson5.JSON5Encoder] subclass.
+        **options: Keyword arguments passed to the encoder, with the same meaning as in
+            [`dumps`][ujson5.dumps] (e.g. `indent` or `sort_keys`).
+
+    Returns:
+        The JSON5 strings, in the order of `objs`.
+
+    Raises:
+        JSON5EncodeError: If an object cannot be serialized.
+    """
+    encoder = (cls or JSON5Encoder)(**options)
+    workers = _thread_workers(workers)
+    if workers == 1:
+        return [encoder.encode(obj, typed_dict_cls) for obj in objs]
+    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=C0415
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(encoder.encode, objs, repeat(typed_dict_cls)))
@@ -21,3 +21,24 @@ def test_ujson5_benchmark(path: str, benchmark) -> None:
     ) as file:
         content = file.read()
     benchmark(ujson5.loads, content)
+
+
+NESTED_JSON5: str = (
+    "// generated records\n["
+    + ",\n".join(
+        f"{{id: {i}, name: 'item {i}', tags: ['a', \"b\"], score: {i}.5, "
+        + f"active: {str(i % 2 == 0).lower()}, parent: null, "
+        + "meta: {depth: [[1, 2], [3, 4]], hex: 0xFF,},}"
+        for i in range(2000)
+    )
+    + ",\n]"
+)
+
+
+@pytest.mark.skipif(not os.getenv("CI_ENV"), reason="Run only in CI environment")
+@pytest.mark.parametrize("encoding", [None, "utf-8"])
+def test_ujson5_nested_benchmark(encoding: str | None, benchmark) -> None:
+    """Benchmark the parsing loop on nested JSON5 containers with every token type."""
+    content = NESTED_JSON5 if encoding is None else NESTED_JSON5.encode(encoding)
+    assert len(ujson5.loads(content)) == 2000
+    benchmark(ujson5.loads, content)
@@ -80,3 +80,29 @@ def test_cli_output(tmp_path: Path) -> None:
     assert not output.exists()
     cli.main([str(target), str(output)])
     assert output.exists()
+
+
+def test_cli_validate(tmp_path: Path) -> None:
+    """Test validating many files in parallel."""
+    valid: Path = choice(example_consts.VALID_EXAMPLES)
+    invalid: Path = choice(example_consts.INVALID_EXAMPLES)
+    missing: Path = valid.parent / "wrong.json5"
+    not_utf8: Path = tmp_path / "not_utf8.json5"
+    not_utf8.write_bytes(b'["\xff"]')
+    with redirect_stdout(io.StringIO()) as f:
+        cli.main(
+            [
+                "--validate",
+                str(valid),
+                str(invalid),
+                str(not_utf8),
+                str(missing),
+                "--workers",
+                "2",
+            ]
+        )
+    output = f.getvalue()
+    assert f"{valid}: {cli.VALID_JSON5}" in output
+    assert f"{cli.DECODING_ERROR} {invalid}:" in output
+    assert f"{cli.DECODING_ERROR} {not_utf8}:" in output
+    assert f"{missing}: {cli.ERR_TARGET_NOT_EXIST}" in output
@@ -34,3 +34,10 @@ def test_invalid_comments(comment: str) -> None:
     """Test invalid comments."""
     with pytest.raises(ValueError):
         validate_comment(comment, 0)
+
+
+@pytest.mark.parametrize("terminator", ["\n", "\r", "\r\n", "\u2028", "\u2029"])
+def test_inline_comment_terminators(terminator: str) -> None:
+    """Inline comments end at any line terminator."""
+    comment = f"// some comment{terminator}"
+    assert validate_comment(comment + "next", 0) == len("// some comment") + 1
@@ -1,5 +1,7 @@
 """Tests for JSON5 parser."""
 
+import asyncio
+import io
 from collections.abc import Callable
 from copy import copy
 from math import isnan
@@ -289,3 +291,444 @@ def test_reserved_word_keys(word: str) -> None:
         ujson5.loads(f"{{{word}: 1}}", allow_reserved_words=False)
 
     ujson5.loads(f"{{{word}: 1}}", allow_reserved_words=True)
+
+
+def test_deeply_nested_loads() -> None:
+    """Nesting depth is not limited by the recursion limit."""
+    depth = 10_000
+    loaded = ujson5.loads("[" * depth + "{a: [1, 2,],}" + "]" * depth)
+    for _ in range(depth):
+        assert isinstance(loaded, list) and len(loaded) == 1
+        loaded = loaded[0]
+    assert loaded == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "json5, err_pos",
+    [
+        ("", 0),
+        ("[1 2]", 3),
+        ("{a: 1 b: 2}", 6),
+        ("{a 1}", 1),
+        ("[1, 2", 5),
+        ("{a: 1,,}", 6),
+        ("[1}", 2),
+        ("1 2", 2),
+    ],
+)
+def test_invalid_loads_position(json5: str, err_pos: int) -> None:
+    """Test the position reported for invalid JSON5."""
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.loads(json5)
+    assert exc_info.value.pos == err_pos
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r", "\r\n", "\u2028", "\u2029"])
+def test_line_terminators(newline: str) -> None:
+    """Documents using any line terminator decode without being rewritten."""
+    json5 = newline.join(
+        ["{", "  // comment", "  key: 'multi \\", "line',", "  /* block", "  */", "}"]
+    )
+    assert ujson5.loads(json5) == {"key": "multi line"}
+    _, idx = ujson5.Json5Decoder().raw_decode(json5 + newline)
+    assert idx == len(json5)
+
+
+def test_error_position_crlf() -> None:
+    """Error positions refer to the original document."""
+    json5 = "{\r\n  a: 1,\r\n  b: ]\r\n}"
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.loads(json5)
+    assert json5[exc_info.value.pos] == "]"
+
+
+def test_decode_error_lazy_position() -> None:
+    """Line and column are only computed when accessed."""
+    err = ujson5.JSON5DecodeError("Unexpected", "{\n  a: }", 7)
+    assert "lineno" not in vars(err) and "colno" not in vars(err)
+    assert (err.lineno, err.colno) == (2, 6)
+    assert err.args == ("Unexpected: line 2 column 6 (char 7)",)
+    assert repr(err) == "JSON5DecodeError('Unexpected: line 2 column 6 (char 7)')"
+    assert "Unexpected: line 2 column 6 (char 7)" in str(err)
+
+
+@pytest.mark.parametrize("json5, py_value", BASIC_LOADS)
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_bytes_loads(json5: str, py_value: Any, buffer_type: type) -> None:
+    """UTF-8 buffers decode to the same values as strings."""
+    loaded = ujson5.loads(buffer_type(json5.encode("utf-8")))
+    assert loaded == py_value or (isnan(loaded) and isnan(py_value))
+
+
+@pytest.mark.parametrize(
+    "encoding", ["utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "utf-32"]
+)
+def test_bytes_encodings(encoding: str) -> None:
+    """BOMs and UTF-16/32 encodings are detected."""
+    json5 = "{sigΣma: ['\\u00e9', 1], // c\u2029\"k\": 0x1F}"
+    assert ujson5.loads(json5.encode(encoding)) == ujson5.loads(json5)
+
+
+def test_bytes_error_position() -> None:
+    """Errors in buffers are reported with character positions."""
+    json5 = "['éé', 1 2]"
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.loads(json5.encode("utf-8"))
+    assert str(exc_info.value.doc) == json5
+    assert json5[exc_info.value.pos] == "2"
+    assert (exc_info.value.lineno, exc_info.value.colno) == (1, 10)
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.loads("['é'] 1".encode("utf-8-sig"))
+    assert exc_info.value.pos == 6
+
+
+def test_bytes_hook_error() -> None:
+    """A failing hook is only called once for a UTF-8 buffer."""
+    calls: list[Any] = []
+
+    def hook(obj: Any) -> Any:
+        calls.append(obj)
+        raise ValueError
+
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.loads(b"{a: 1}", object_hook=hook)
+    assert calls == [{"a": 1}]
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16"])
+def test_load_path(tmp_path, encoding: str) -> None:
+    """Files are memory-mapped and decoded like strings."""
+    json5 = "{sigΣma: ['é', 1], /* c */ \"k\": 0x1F}"
+    path = tmp_path / "doc.json5"
+    path.write_bytes(json5.encode(encoding))
+    assert ujson5.load_path(path) == ujson5.loads(json5)
+    assert ujson5.load_path(str(path), object_pairs_hook=list) == ujson5.loads(
+        json5, object_pairs_hook=list
+    )
+
+
+def test_load_path_errors(tmp_path) -> None:
+    """Errors raised for files do not reference the closed mapping."""
+    path = tmp_path / "doc.json5"
+    path.write_bytes(b"")
+    with pytest.raises(ujson5.JSON5DecodeError):
+        ujson5.load_path(path)
+    path.write_bytes(b"{a: 1,\n b: ]}")
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.load_path(path)
+    assert (exc_info.value.lineno, exc_info.value.colno) == (2, 5)
+
+
+@pytest.mark.parametrize("json5, py_value", BASIC_LOADS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_stream_decode(json5: str, py_value: Any, chunk_size: int) -> None:
+    """Streams decode to the same values as strings, whatever the chunk size."""
+    decoder = ujson5.Json5StreamDecoder(chunk_size=chunk_size)
+    for stream in (io.StringIO(json5), io.BytesIO(json5.encode("utf-8-sig"))):
+        loaded = decoder.decode_stream(stream)
+        assert loaded == py_value or (isnan(loaded) and isnan(py_value))
+
+
+@pytest.mark.parametrize(
+    "json5",
+    [
+        "",
+        "[1, 2",
+        "1 2",
+        "'unterminated",
+        "[1, /* unterminated",
+        "{\n" + "  key: 'value',\n" * 50 + "  a: 1 b: 2}",
+    ],
+)
+def test_stream_decode_errors(json5: str) -> None:
+    """Errors in streams are reported at the same position as for strings."""
+    with pytest.raises(ujson5.JSON5DecodeError) as str_exc:
+        ujson5.loads(json5)
+    with pytest.raises(ujson5.JSON5DecodeError) as stream_exc:
+        ujson5.Json5StreamDecoder(chunk_size=4).decode_stream(io.StringIO(json5))
+    assert stream_exc.value.msg == str_exc.value.msg
+    assert stream_exc.value.pos == str_exc.value.pos
+    assert (stream_exc.value.lineno, stream_exc.value.colno) == (
+        str_exc.value.lineno,
+        str_exc.value.colno,
+    )
+
+
+@pytest.mark.parametrize("invalid", ["@", "1..2", "'\\x4g'", "'a\n'"])
+def test_stream_decode_early_error(invalid: str) -> None:
+    """An invalid token is reported without reading the rest of the stream."""
+    json5 = "[" + invalid + ", " + "1, " * 10_000 + "]"
+    with pytest.raises(ujson5.JSON5DecodeError) as str_exc:
+        ujson5.loads(json5)
+    stream = io.StringIO(json5)
+    with pytest.raises(ujson5.JSON5DecodeError) as stream_exc:
+        ujson5.Json5StreamDecoder(chunk_size=64).decode_stream(stream)
+    assert stream.tell() <= 64
+    assert stream_exc.value.pos == str_exc.value.pos
+    assert stream_exc.value.colno == str_exc.value.colno
+
+
+def test_iterparse() -> None:
+    """Events are yielded in document order with the offsets of their token."""
+    json5 = "{key: [1, 'a'], b: {}, c: []}"
+    events = list(ujson5.iterparse(json5))
+    assert [(e.event, e.value) for e in events] == [
+        ("start_map", None),
+        ("map_key", "key"),
+        ("start_array", None),
+        ("value", 1),
+        ("value", "a"),
+        ("end_array", None),
+        ("map_key", "b"),
+        ("start_map", None),
+        ("end_map", None),
+        ("map_key", "c"),
+        ("start_array", None),
+        ("end_array", None),
+        ("end_map", None),
+    ]
+    assert [json5[e.start : e.end] for e in events][:5] == ["{", "key", "[", "1", "a"]
+    for source in (
+        json5.encode("utf-16"),
+        io.StringIO(json5),
+        io.BytesIO(b"\xef\xbb\xbf" + json5.encode()),
+    ):
+        assert list(ujson5.iterparse(source, chunk_size=2)) == events
+
+
+@pytest.mark.parametrize("json5, py_value", BASIC_LOADS)
+def test_iterparse_scalars(json5: str, py_value: Any) -> None:
+    """Values yielded by iterparse are decoded like with loads."""
+    values = [e.value for e in ujson5.iterparse(json5) if e.event == "value"]
+    if isinstance(py_value, (dict, list)):
+        assert len(values) == len(py_value)
+    else:
+        assert len(values) == 1
+        assert values[0] == py_value or (isnan(values[0]) and isnan(py_value))
+
+
+@pytest.mark.parametrize("json5, err_pos", [("", 0), ("[1 2]", 3), ("1 2", 2)])
+def test_iterparse_errors(json5: str, err_pos: int) -> None:
+    """Invalid documents raise once the error is reached."""
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        list(ujson5.iterparse(json5))
+    assert exc_info.value.pos == err_pos
+
+
+EXTRACT_DOC: str = """{
+  server: {port: 8080, host: "localhost", tags: ["a", "]"]},
+  // skipped: {"[": 1}
+  features: {a: {enabled: true, x: [1, {}]}, b: {enabled: false}},
+  list: [{id: 1}, {id: 2, sub: [0]}],
+  'str': "value",
+}"""
+
+
+@pytest.mark.parametrize(
+    "paths, expected",
+    [
+        (["server/port"], {"server/port": 8080}),
+        (
+            ["server/port", "features/*/enabled"],
+            {
+                "server/port": 8080,
+                "features/a/enabled": True,
+                "features/b/enabled": False,
+            },
+        ),
+        (
+            ["list/*/id", "list/1"],
+            {"list/0/id": 1, "list/1/id": 2, "list/1": {"id": 2, "sub": [0]}},
+        ),
+        (["str", "missing", "server/port/x"], {"str": "value"}),
+        (
+            ["server", "server/tags/1"],
+            {"server": ujson5.loads(EXTRACT_DOC)["server"], "server/tags/1": "]"},
+        ),
+        ([""], {"": ujson5.loads(EXTRACT_DOC)}),
+    ],
+)
+def test_extract(paths: list[str], expected: dict[str, Any]) -> None:
+    """Only the selected paths are decoded."""
+    assert ujson5.extract(EXTRACT_DOC, paths) == expected
+    assert ujson5.extract(EXTRACT_DOC.encode(), paths) == expected
+
+
+@pytest.mark.parametrize(
+    "json5, err_pos",
+    [("", 0), ("{a: 1 b: 2}", 6), ("[1, x]", 4), ("{a: [}", 5), ("{a: 1} 2", 7)],
+)
+def test_extract_errors(json5: str, err_pos: int) -> None:
+    """The parts of the document that are read are validated."""
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        ujson5.extract(json5, ["z"])
+    assert exc_info.value.pos == err_pos
+
+
+def test_extract_stops_early() -> None:
+    """The document is not read past the last concrete path."""
+    assert ujson5.extract("{a: 1, b: [2], c: }", ["a", "b"]) == {"a": 1, "b": [2]}
+
+
+ITER_ITEMS_DOC: str = """{
+  meta: {skipped: [1, {"]": 2}], s: "a"},
+  data: {records: [{id: 1}, "two", [3], {},], n: 1},
+}"""
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        ITER_ITEMS_DOC,
+        ITER_ITEMS_DOC.encode("utf-16"),
+        io.StringIO(ITER_ITEMS_DOC),
+        io.BytesIO(ITER_ITEMS_DOC.encode()),
+    ],
+)
+def test_iter_items(source: Any) -> None:
+    """Array elements are yielded one by one."""
+    items = ujson5.iter_items(source, "data/records", chunk_size=3)
+    assert next(items) == {"id": 1}
+    assert list(items) == ["two", [3], {}]
+
+
+def test_iter_items_paths() -> None:
+    """Paths select object members and array elements."""
+    assert list(ujson5.iter_items("[1, [2], 3]")) == [1, [2], 3]
+    assert not list(ujson5.iter_items("[]"))
+    assert list(ujson5.iter_items("{a: [[1, 2], [3]]}", "a/1")) == [3]
+    assert list(ujson5.iter_items("[{a: 1}]", object_pairs_hook=list)) == [[("a", 1)]]
+    # the first of duplicated keys is used
+    assert list(ujson5.iter_items("{a: [1], a: 2}", "a")) == [1]
+
+
+@pytest.mark.parametrize(
+    "json5, path, err_pos",
+    [("{a: 1}", "b", 5), ("{a: 1}", "a", 4), ("[1 2]", "", 3), ("[1, ", "", 4)],
+)
+def test_iter_items_errors(json5: str, path: str, err_pos: int) -> None:
+    """Invalid documents, missing paths and non-array values raise."""
+    with pytest.raises(ujson5.JSON5DecodeError) as exc_info:
+        list(ujson5.iter_items(json5, path))
+    assert exc_info.value.pos == err_pos
+
+
+MANY_VALUES: str = """{id: 1}
+// comment between values
+[1, 2] "three"
+4 null
+"""
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        MANY_VALUES,
+        MANY_VALUES.encode("utf-8"),
+        io.StringIO(MANY_VALUES),
+        io.BytesIO(MANY_VALUES.encode("utf-8")),
+    ],
+)
+def test_iter_loads(source: Any) -> None:
+    """Successive values are decoded one by one."""
+    expected = [{"id": 1}, [1, 2], "three", 4, None]
+    if isinstance(source, (io.StringIO, io.BytesIO)):
+        assert list(ujson5.load_many(source, chunk_size=2)) == expected
+    else:
+        assert list(ujson5.iter_loads(source)) == expected
+
+
+def test_iter_loads_errors() -> None:
+    """Values preceding an invalid value are yielded."""
+    values = ujson5.iter_loads("{a: 1}\n{a: 2")
+    assert next(values) == {"a": 1}
+    with pytest.raises(ujson5.JSON5DecodeError):
+        next(values)
+    assert not list(ujson5.iter_loads(" // only a comment\n"))
+
+
+@pytest.mark.parametrize(
+    "json5, idx, expected, end_idx",
+    [
+        ('frame: {"id": 1} trailer', 7, {"id": 1}, 16),
+        ("[1] [2", 0, [1], 3),
+        ("x /* c */ 'str'xx", 1, "str", 15),
+        ("12, 13", 4, 13, 6),
+    ],
+)
+def test_raw_decode_offset(json5: str, idx: int, expected: Any, end_idx: int) -> None:
+    """raw_decode starts at an offset and stops at the end of the first value."""
+    assert ujson5.Json5Decoder().raw_decode(json5, idx) == (expected, end_idx)
+
+
+async def _aload(data: bytes, **kwargs: Any) -> Any:
+    """Decode `data` fed to an `asyncio.StreamReader`."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await ujson5.aload(reader, **kwargs)
+
+
+@pytest.mark.parametrize("json5, py_value", BASIC_LOADS)
+@pytest.mark.parametrize("chunk_size", [1, 64])
+def test_aload(json5: str, py_value: Any, chunk_size: int) -> None:
+    """Asynchronous streams decode to the same values as strings."""
+    loaded = asyncio.run(_aload(json5.encode("utf-8-sig"), chunk_size=chunk_size))
+    assert loaded == py_value or (isnan(loaded) and isnan(py_value))
+
+
+def test_aload_hooks() -> None:
+    """Hooks are applied to the root object only, as with loads."""
+    json5 = "{b: {c: 1}, a: [1, 2]}"
+    loaded = asyncio.run(_aload(json5.encode(), object_pairs_hook=list, chunk_size=2))
+    assert loaded == ujson5.loads(json5, object_pairs_hook=list)
+    loaded = asyncio.run(_aload(json5.encode(), object_hook=len))
+    assert loaded == 2
+
+
+@pytest.mark.parametrize(
+    "json5",
+    [
+        "",
+        "[1, 2",
+        "1 2",
+        "{a 1}",
+        "{a: 1,,}",
+        "[1 2]",
+        "'unterminated",
+        "{\n" + "  key: 'value',\n" * 50 + "  a: 1 b: 2}",
+    ],
+)
+def test_aload_errors(json5: str) -> None:
+    """Errors in asynchronous streams are reported at the same position as for
+    strings."""
+    with pytest.raises(ujson5.JSON5DecodeError) as str_exc:
+        ujson5.loads(json5)
+    with pytest.raises(ujson5.JSON5DecodeError) as stream_exc:
+        asyncio.run(_aload(json5.encode(), chunk_size=4))
+    assert stream_exc.value.msg == str_exc.value.msg
+    assert stream_exc.value.pos == str_exc.value.pos
+    assert stream_exc.value.lineno == str_exc.value.lineno
+
+
+def test_aload_yields_to_event_loop() -> None:
+    """Other tasks run while a large document is decoded."""
+
+    async def main() -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        before = ticks
+        await _aload(b"[" + b"1, " * 10_000 + b"]", chunk_size=1024)
+        task.cancel()
+        return ticks - before
+
+    assert asyncio.run(main()) >= 10
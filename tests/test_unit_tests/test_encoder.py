@@ -1,11 +1,17 @@
 """Test encoder."""
 
+import asyncio
+import gc
+import io
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
 import pytest
 
 import ujson5
+from ujson5.encoder import CommentNode, build_comment_tree
 
 
 @pytest.mark.parametrize(
@@ -250,3 +256,257 @@ def test_quoted_key() -> None:
         ujson5.dumps(obj, key_quotation="single")
         == "{'key': \"value\", 'key2': \"value2\"}"
     )
+
+
+def test_dump_many() -> None:
+    """Objects are written one per line and read back by load_many."""
+    objs = [{"key": "value"}, [1, 2], "string", None, {}]
+    output = io.StringIO()
+    ujson5.dump_many(objs, output)
+    assert output.getvalue() == '{"key": "value"}\n[1, 2]\n"string"\nnull\n{}\n'
+    output.seek(0)
+    assert list(ujson5.load_many(output)) == objs
+
+    output = io.StringIO()
+    ujson5.dump_many(objs, output, indent=2, key_quotation="none")
+    assert list(ujson5.iter_loads(output.getvalue())) == objs
+
+
+def test_dumps_bytes() -> None:
+    """dumps_bytes returns the UTF-8 encoding of dumps."""
+    obj = {"key": ["value", "\u00e9", 1.5, None]}
+    assert ujson5.dumps_bytes(obj) == ujson5.dumps(obj).encode()
+    assert ujson5.dumps_bytes(obj, ensure_ascii=False, indent=2) == (
+        ujson5.dumps(obj, ensure_ascii=False, indent=2).encode()
+    )
+
+
+class _CountingBytesIO(io.BytesIO):
+    """Binary file object counting its writes."""
+
+    writes: int = 0
+
+    def write(self, data: Any) -> int:
+        self.writes += 1
+        return super().write(data)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 64 * 1024])
+def test_dump_binary(chunk_size: int) -> None:
+    """dump writes UTF-8 to binary file objects, joining chunks into buffered writes."""
+    obj = {"key": ["value", "\u00e9", 1.5, None], "nested": {"a": [{}, []]}}
+    expected = ujson5.dumps(obj, ensure_ascii=False, indent=2) + "\n"
+    output = _CountingBytesIO()
+    ujson5.dump(obj, output, ensure_ascii=False, indent=2, chunk_size=chunk_size)
+    assert output.getvalue() == expected.encode()
+    if chunk_size == 64 * 1024:
+        assert output.writes == 1
+    text_output = io.StringIO()
+    ujson5.dump(obj, text_output, ensure_ascii=False, indent=2, chunk_size=chunk_size)
+    assert text_output.getvalue() == expected
+
+
+class _BodyWriter:
+    """Binary writer that is not an `io` object, like the body of an HTTP response."""
+
+    def __init__(self, mode: str | None = None) -> None:
+        self.chunks: list[bytes] = []
+        if mode is not None:
+            self.mode = mode
+
+    def write(self, data: bytes) -> None:
+        if not isinstance(data, bytes):
+            raise TypeError("a bytes-like object is required")
+        self.chunks.append(data)
+
+
+@pytest.mark.parametrize("mode", [None, "wb"])
+def test_dump_binary_writer(mode: str | None) -> None:
+    """Binary writers are detected by their mode or by rejecting `str`."""
+    obj = {"key": ["value", "\u00e9"]}
+    output = _BodyWriter(mode)
+    ujson5.dump(obj, output, ensure_ascii=False, chunk_size=4)  # type: ignore[arg-type]
+    assert (
+        b"".join(output.chunks)
+        == (ujson5.dumps(obj, ensure_ascii=False) + "\n").encode()
+    )
+
+
+def test_dump_many_binary() -> None:
+    """dump_many writes UTF-8 lines to binary file objects, up to an invalid object."""
+    output = _CountingBytesIO()
+    ujson5.dump_many([{"key": "\u00e9"}, [1]], output, ensure_ascii=False)
+    assert output.getvalue() == '{"key": "\u00e9"}\n[1]\n'.encode()
+    assert output.writes == 1
+
+    output = _CountingBytesIO()
+    with pytest.raises(ujson5.JSON5EncodeError):
+        ujson5.dump_many([1, 2, object()], output)
+    assert output.getvalue() == b"1\n2\n"
+
+
+class _Writer:
+    """Minimal `asyncio.StreamWriter` recording what is written."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    async def drain(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize("chunk_size", [1, 64 * 1024])
+def test_adump(chunk_size: int) -> None:
+    """adump writes the same UTF-8 output as dump, in chunks."""
+    obj = {"key": ["value", "\u00e9", 1.5, None], "nested": {"a": [{}, []]}}
+    writer = _Writer()
+    asyncio.run(
+        ujson5.adump(
+            obj,
+            writer,  # type: ignore[arg-type]
+            ensure_ascii=False,
+            indent=2,
+            chunk_size=chunk_size,
+        )
+    )
+    output = io.StringIO()
+    ujson5.dump(obj, output, ensure_ascii=False, indent=2)
+    assert b"".join(writer.chunks) == output.getvalue().encode()
+    assert (len(writer.chunks) > 1) == (chunk_size == 1)
+
+    writer = _Writer()
+    with pytest.raises(ujson5.JSON5EncodeError):
+        asyncio.run(ujson5.adump({"key": object()}, writer))  # type: ignore[arg-type]
+
+
+def test_encoder_shared_between_threads() -> None:
+    """Concurrent calls on one encoder do not share circular reference markers."""
+    shared = [[i, {"key": [i] * 10}] for i in range(200)]
+    obj = {"a": shared, "b": shared}
+    expected = ujson5.dumps(obj)
+    encoder = ujson5.JSON5Encoder()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(encoder.encode, [obj] * 32))
+        results += list(executor.map(ujson5.dumps, [obj] * 32))
+    assert results == [expected] * 64
+
+
+class Point(TypedDict):
+    """TypedDict with a comment."""
+
+    x: int  # horizontal position
+
+
+@pytest.mark.filterwarnings("ignore:Comments extraction")
+def test_comments_not_reused() -> None:
+    """Comments of a TypedDict are only written for the call it is passed to."""
+    encoder = ujson5.JSON5Encoder(indent=2)
+    obj = {"x": 1}
+    assert "// horizontal position" in encoder.encode(obj, Point)
+    assert "//" not in encoder.encode(obj)
+
+
+class Shape(TypedDict):
+    """TypedDict with nested comments."""
+
+    # position of the shape
+    origin: Point
+    name: str  # display name
+
+
+ENCODE_OPTIONS: list[dict[str, Any]] = [
+    {},
+    {"indent": 2},
+    {"indent": 4, "trailing_comma": False, "key_quotation": "none"},
+    {"separators": (",", ":"), "sort_keys": True, "ensure_ascii": False},
+    {"skip_keys": True, "key_quotation": "single", "check_circular": False},
+]
+
+
+@pytest.mark.filterwarnings("ignore:Comments extraction")
+@pytest.mark.parametrize("options", ENCODE_OPTIONS)
+def test_encode_matches_iterencode(options: dict[str, Any]) -> None:
+    """The list-building encode engine produces the same output as iterencode."""
+    obj = {
+        "origin": {"x": 1},
+        "name": "sqéare\n",
+        "list": [1, 2.5, None, True, False, ("tuple", []), {}, [[{"a": ""}]]],
+        1: "int key",
+        2.5: "float key",
+        None: {"z": 1, "y": [float("inf")]},
+        "custom": complex(1, 2),
+    }
+    if options.get("sort_keys"):
+        obj = {str(key): value for key, value in obj.items()}
+    encoder = ujson5.JSON5Encoder(default=lambda c: [c.real, c.imag], **options)
+    for typed_dict_cls in (None, Shape):
+        assert encoder.encode(obj, typed_dict_cls) == "".join(
+            encoder.iterencode(obj, typed_dict_cls)
+        )
+    if options.get("skip_keys"):
+        obj[(1, 2)] = "skipped"
+        assert encoder.encode(obj) == "".join(encoder.iterencode(obj))
+
+
+@pytest.mark.filterwarnings("ignore:Comments extraction")
+def test_comments_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Comments are extracted once per TypedDict class and dropped with the class."""
+    extractions = 0
+    get_comments = ujson5.encoder.get_comments
+
+    def counting_get_comments(typed_dict_cls: Any) -> Any:
+        nonlocal extractions
+        extractions += 1
+        return get_comments(typed_dict_cls)
+
+    monkeypatch.setattr(ujson5.encoder, "get_comments", counting_get_comments)
+
+    class Local(TypedDict):
+        """TypedDict defined for this test only."""
+
+        value: int  # local comment
+
+    for indent in (2, 2, 4):
+        output = ujson5.dumps({"value": 1}, Local, indent=indent)
+        assert "// local comment" in output
+    assert extractions == 1
+
+    # a redefined class is a new class object, whose comments are extracted again
+    class Local(TypedDict):  # type: ignore[no-redef]  # pylint: disable=E0102
+        """TypedDict defined for this test only."""
+
+        value: int  # local comment
+
+    assert "// local comment" in ujson5.dumps({"value": 1}, Local, indent=2)
+    assert extractions == 2
+    cls_ref = weakref.ref(Local)
+    del Local
+    gc.collect()
+    assert cls_ref() is None
+
+
+def test_build_comment_tree() -> None:
+    """Comments by key path are nested by key, with nodes for uncommented parents."""
+    tree = build_comment_tree(
+        {
+            "/a/b/c": {"block_comments": ["deep"], "inline_comment": ""},
+            "/a": {"block_comments": ["first", "second"], "inline_comment": "inline"},
+            "/d": {"block_comments": [], "inline_comment": ""},
+        }
+    )
+    assert tree["a"].block_comments == ("// first", "// second")
+    assert tree["a"].inline_comment == "  // inline"
+    deep = CommentNode(("// deep",), "", {})
+    assert tree["a"].children == {"b": CommentNode((), "", {"c": deep})}
+    assert tree["d"] == CommentNode((), "", {})
+
+
+@pytest.mark.filterwarnings("ignore:Comments extraction")
+def test_comments_in_list_items() -> None:
+    """Dicts inside lists share the comments of the entry holding the list."""
+    output = ujson5.dumps({"origin": [{"x": 1}, {"x": 2}]}, Shape, indent=2)
+    assert output.count("// horizontal position") == 2
+    assert ujson5.dumps({"other": {"x": 1}}, Shape, indent=2).count("//") == 0
@@ -43,6 +43,9 @@ RANDOM_UNICODE_ESCAPE = (
         (f"{unicode_letters.pop()}{ZWJ}{ZWNJ}", 0, 3),
         (f"{unicode_letters.pop()}{unicode_digits.pop()}", 0, 2),
         (f"{unicode_letters.pop()}{unicode_connectors.pop()}", 0, 2),
+        ("key_1$:", 0, 6),
+        ("ab\\u0041cd ", 0, 10),
+        ("sig\u03a3ma_2,", 0, 8),
     ],
 )
 def test_valid_identifiers(identifier: str, start: int, end: int) -> None:
@@ -63,6 +66,8 @@ def test_valid_identifiers(identifier: str, start: int, end: int) -> None:
         *sample(list(unicode_digits), k=min(10, len(unicode_digits))),
         *sample(list(unicode_connectors), k=min(10, len(unicode_connectors))),
         "A\u2603",  # invalid unicode escape sequence
+        "ab-c",
+        "ab\\u12",
     ],
 )
 def test_invalid_identifiers(identifier: str) -> None:
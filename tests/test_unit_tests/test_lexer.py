@@ -1,6 +1,9 @@
 """Test lexer module"""
 
-from ujson5.lexer import TOKEN_TYPE, tokenize
+import pytest
+
+from ujson5.core import JSON5DecodeError
+from ujson5.lexer import TOKEN_TYPE, scan_array, skip_container, tokenize
 
 JSON5_TEXT = """{
   // comments
@@ -87,3 +90,21 @@ def test_lexer() -> None:
         assert result.tk_type == tok[0]
         r_text = JSON5_TEXT[result.value[0] : result.value[1]]
         assert r_text == tok[1]
+
+
+def test_skip_container() -> None:
+    """Containers are skipped up to their matching closing bracket."""
+    assert skip_container(JSON5_TEXT + " tail", 0) == len(JSON5_TEXT)
+    assert skip_container("[1, ']', /* } */ {a: \"[\"}] 2", 0) == 26
+    for invalid in ["[1, 2", "{a: [}", "['unterminated]", "[/* ]"]:
+        with pytest.raises(JSON5DecodeError):
+            skip_container(invalid, 0)
+
+
+def test_scan_array() -> None:
+    """The commas separating the elements of an array are found."""
+    json5 = '[1, {a: [2, 3]}, "x,]", /* , */ [4, 5], ]'
+    assert scan_array(json5, 0) == ([2, 15, 22, 38], len(json5) - 1)
+    for invalid in ["[1, 2", "[1, }", "[1, 'unterminated]"]:
+        with pytest.raises(JSON5DecodeError):
+            scan_array(invalid, 0)
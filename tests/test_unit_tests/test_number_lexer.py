@@ -5,7 +5,7 @@ from random import randint
 import pytest
 
 from ujson5.core import TOKEN_TYPE, JSON5DecodeError
-from ujson5.lexer import tokenize_number
+from ujson5.lexer import NUMBER_PATTERN, tokenize_number
 
 number_valid_examples = [
     "0",
@@ -164,3 +164,23 @@ def test_invalid_invalid_numbers(text_number: str) -> None:
     """Test invalid numbers."""
     with pytest.raises(JSON5DecodeError):
         tokenize_number(buffer=text_number, idx=0)
+
+
+@pytest.mark.parametrize("text_number", number_valid_examples + number_valid_constants)
+def test_fast_path_matches(text_number: str) -> None:
+    """Valid numbers are matched without falling back to the state machine."""
+    assert NUMBER_PATTERN.match(text_number) is not None
+    assert NUMBER_PATTERN.match(f"{text_number},") is not None
+
+
+@pytest.mark.parametrize("text_number", number_invalid_examples)
+def test_fast_path_rejects(text_number: str) -> None:
+    """Invalid numbers are never matched by the fast path."""
+    assert NUMBER_PATTERN.match(text_number) is None
+
+
+@pytest.mark.parametrize("constant", number_valid_constants)
+def test_constant_followed_by_punctuator(constant: str) -> None:
+    """Signed constants may be directly followed by a punctuator."""
+    result = tokenize_number(buffer=f"{constant}]", idx=0)
+    assert result.token.value == (0, len(constant))
@@ -0,0 +1,102 @@
+"""Test parallel decoding and encoding."""
+
+from pathlib import Path
+
+import pytest
+
+import ujson5
+
+
+@pytest.mark.parametrize("workers, ordered", [(1, True), (2, True), (2, False)])
+def test_load_files(tmp_path: Path, workers: int, ordered: bool) -> None:
+    """Files are decoded in parallel and errors are reported per file."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"doc{i}.json5"
+        path.write_text("{id: %d}" % i if i != 3 else "{id: ", encoding="utf8")
+        paths.append(path)
+    not_utf8 = tmp_path / "not_utf8.json5"
+    not_utf8.write_bytes(b'["\xff"]')
+    paths.append(not_utf8)
+    paths.append(tmp_path / "missing.json5")
+    results = list(ujson5.load_files(paths, workers=workers, ordered=ordered))
+    if not ordered:
+        results.sort(key=lambda result: paths.index(Path(result.path)))
+    assert [result.path for result in results] == [str(path) for path in paths]
+    for i, result in enumerate(results[:-2]):
+        if i == 3:
+            assert isinstance(result.error, ujson5.JSON5DecodeError)
+        else:
+            assert result == (str(paths[i]), {"id": i}, None)
+    assert isinstance(results[-2].error, UnicodeDecodeError)
+    assert isinstance(results[-1].error, FileNotFoundError)
+
+
+ARRAY_DOC: str = (
+    "// records\n["
+    + ", ".join(f'{{id: {i}, tags: [1, 2.5, "x,]"]}}' for i in range(50))
+    + ", /* trailing comma */]"
+)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Split arrays into runs of a few elements."""
+    monkeypatch.setattr(ujson5.decoder, "MIN_PARALLEL_CHUNK_SIZE", 64)
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_loads_workers() -> None:
+    """Root arrays decoded in parallel are the same as decoded serially."""
+    assert ujson5.loads(ARRAY_DOC, workers=3) == ujson5.loads(ARRAY_DOC)
+    assert ujson5.loads(ARRAY_DOC.encode(), workers=3) == ujson5.loads(ARRAY_DOC)
+    assert ujson5.loads(ARRAY_DOC, workers=3, object_pairs_hook=len) == 50
+    assert ujson5.loads("{a: [1, 2]}", workers=3) == {"a": [1, 2]}
+
+
+@pytest.mark.usefixtures("small_chunks")
+@pytest.mark.parametrize(
+    "json5",
+    [
+        "[" + "1, " * 40 + "{a: }, 2]",
+        "[" + "1, " * 40 + ", 2]",
+        "[" + "1, " * 40 + "/* c */, 2]",
+        "[" + "1" * 62 + ",," + " 2," * 30 + "]",
+        "[" + "1" * 60 + ", /**/," + " 2," * 30 + "]",
+        "[" + " " * 70 + ", 1" * 30 + "]",
+        "[" + "1, " * 40 + "] 3",
+        "[" + "1, " * 40 + "'unterminated",
+        "[" + "1, " * 40 + "}",
+    ],
+)
+def test_loads_workers_errors(json5: str) -> None:
+    """Errors are reported at the same position as when decoding serially."""
+    with pytest.raises(ujson5.JSON5DecodeError) as serial_exc:
+        ujson5.loads(json5)
+    with pytest.raises(ujson5.JSON5DecodeError) as parallel_exc:
+        ujson5.loads(json5, workers=3)
+    assert parallel_exc.value.msg == serial_exc.value.msg
+    assert parallel_exc.value.pos == serial_exc.value.pos
+
+
+@pytest.mark.parametrize("workers", [None, 1, 4])
+def test_loads_many(workers: int | None) -> None:
+    """Documents decoded in threads are the same as decoded serially."""
+    docs = [f"{{id: {i}, tags: ['a', {i}.5]}}" for i in range(20)]
+    expected = [ujson5.loads(doc) for doc in docs]
+    assert ujson5.loads_many(docs, workers=workers) == expected
+    assert ujson5.loads_many(iter(docs), workers=workers, object_hook=len) == [2] * 20
+    with pytest.raises(ujson5.JSON5DecodeError):
+        ujson5.loads_many(docs + ["{id: }"], workers=workers)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 4])
+def test_dumps_many(workers: int | None) -> None:
+    """Objects encoded in threads are the same as encoded serially."""
+    shared = {"nested": [1, 2, {"a": None}]}
+    objs = [{"id": i, "shared": shared} for i in range(20)]
+    assert ujson5.dumps_many(iter(objs), workers=workers, indent=2) == [
+        ujson5.dumps(obj, indent=2) for obj in objs
+    ]
+    with pytest.raises(ujson5.JSON5EncodeError):
+        ujson5.dumps_many(objs + [{"key": object()}], workers=workers)
@@ -117,3 +117,27 @@ def test_invalid_strings(text_string: str) -> None:
     """Test invalid strings."""
     with pytest.raises(JSON5DecodeError):
         tokenize_string(buffer=text_string, idx=0)
+
+
+@pytest.mark.parametrize("quote", ["'", '"'])
+def test_long_string(quote: str) -> None:
+    """Test a long string mixing runs of plain characters and escapes."""
+    other_quote = "'" if quote == '"' else '"'
+    escaped_value = f"{other_quote}\\{quote}b\\{quote}{other_quote}"
+    content = f"SELECT * FROM t WHERE a = {escaped_value};" * 500
+    text_string = f"{quote}{content}{quote}, "
+    result = tokenize_string(buffer=text_string, idx=0)
+    start, end = result.token.value
+    assert text_string[start:end] == content
+    assert result.idx == len(content) + 2
+
+
+@pytest.mark.parametrize("terminator", list(LINE_TERMINATOR_SEQUENCE))
+def test_raw_line_terminators(terminator: str) -> None:
+    """Line terminators are recognized without normalizing the document first."""
+    continued = f'"first\\{terminator}second"'
+    result = tokenize_string(buffer=continued, idx=0)
+    assert result.token.value == (1, len(continued) - 1)
+
+    with pytest.raises(JSON5DecodeError):
+        tokenize_string(buffer=f'"first{terminator}second"', idx=0)
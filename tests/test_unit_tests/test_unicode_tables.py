@@ -0,0 +1,64 @@
+"""Test the precomputed Unicode category tables."""
+
+import subprocess
+import sys
+import unicodedata
+from collections.abc import Callable
+from random import randrange
+
+import pytest
+
+from ujson5 import _unicode_tables, consts
+
+CATEGORY_CHECKS: list[tuple[Callable[[str], bool], Callable[[str], bool]]] = [
+    (
+        consts.is_unicode_letter,
+        lambda c: unicodedata.category(c) in {"Lu", "Ll", "Lt", "Lm", "Lo", "Nl"},
+    ),
+    (
+        consts.is_unicode_combining_mark,
+        lambda c: unicodedata.category(c) in {"Mn", "Mc"},
+    ),
+    (consts.is_unicode_digit, lambda c: unicodedata.category(c) == "Nd"),
+    (
+        consts.is_unicode_connector,
+        lambda c: unicodedata.category(c) == "Pc" and c != "_",
+    ),
+]
+
+
+@pytest.mark.skipif(
+    unicodedata.unidata_version != _unicode_tables.UNICODE_VERSION,
+    reason="Tables were generated for a different Unicode version",
+)
+@pytest.mark.parametrize("lookup, expected", CATEGORY_CHECKS)
+def test_tables_match_unicodedata(
+    lookup: Callable[[str], bool], expected: Callable[[str], bool]
+) -> None:
+    """Table lookups agree with `unicodedata` for ASCII and random code points."""
+    code_points = list(range(0x80)) + [randrange(0x80, 0x110000) for _ in range(5000)]
+    for code_point in code_points:
+        char = chr(code_point)
+        assert lookup(char) == expected(char), hex(code_point)
+
+
+def test_unicode_sets() -> None:
+    """The lazily materialized sets agree with the table lookups."""
+    assert "a" in consts.UNICODE_LETTERS
+    assert "Σ" in consts.UNICODE_LETTERS
+    assert "_" not in consts.UNICODE_CONNECTORS
+    assert all(consts.is_unicode_digit(c) for c in consts.UNICODE_DIGITS)
+    assert consts.UNICODE_LETTERS is consts.UNICODE_LETTERS
+    with pytest.raises(AttributeError):
+        _ = consts.UNICODE_UNKNOWN
+
+
+def test_tables_not_loaded_on_import() -> None:
+    """Importing ujson5 and lexing ASCII identifiers does not load the tables."""
+    code = (
+        "import sys, ujson5; ujson5.loads('{key_1: 1, $k2: 2}');"
+        + "assert 'ujson5._unicode_tables' not in sys.modules;"
+        + "ujson5.loads('{sigΣma: 1}');"
+        + "assert 'ujson5._unicode_tables' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)